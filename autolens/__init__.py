@@ -1,3 +1,5 @@
+import importlib
+
 from autoarray import preprocess
 from autoarray import Mask2D
 from autoarray.dataset.imaging import Imaging
@@ -5,8 +7,7 @@ from autoarray.dataset.interferometer import Interferometer
 from autoarray.mask.mask_2d import Mask2D
 from autoarray.operators.convolver import Convolver
 from autoarray.inversion import pixelizations as pix, regularization as reg
-from autoarray.inversion.pixelizations import SettingsPixelization
-from autoarray.inversion.inversions import inversion as Inversion, SettingsInversion
+from autoarray.inversion.inversions import inversion as Inversion
 from autoarray.inversion.mappers import mapper as Mapper
 from autoarray.operators.transformer import TransformerDFT
 from autoarray.operators.transformer import TransformerNUFFT
@@ -25,16 +26,11 @@ from autoarray import VectorFieldIrregular
 from autoarray.structures.kernel import Kernel
 from autoarray.structures.visibilities import Visibilities, VisibilitiesNoiseMap
 from autogalaxy import util
-from autogalaxy.dataset.imaging import SettingsMaskedImaging
-from autogalaxy.dataset.interferometer import SettingsMaskedInterferometer
 from autogalaxy.galaxy.fit_galaxy import FitGalaxy
 from autogalaxy.galaxy.galaxy import Galaxy, HyperGalaxy, Redshift
 from autogalaxy.galaxy.galaxy_data import GalaxyData
 from autogalaxy.galaxy.galaxy_model import GalaxyModel
 from autogalaxy.hyper import hyper_data
-from autogalaxy.pipeline.setup import SetupLightParametric, SetupSMBH
-from autogalaxy.pipeline.phase.extensions.hyper_phase import HyperPhase
-from autogalaxy.pipeline.pipeline import PipelineDataset
 from autogalaxy.plane.plane import Plane
 from autogalaxy.profiles import (
     light_profiles as lp,
@@ -43,40 +39,104 @@ from autogalaxy.profiles import (
 )
 from autogalaxy import convert
 
-from . import aggregator as agg
-from . import plot
-from .dataset.imaging import MaskedImaging, SimulatorImaging
-from .dataset.interferometer import MaskedInterferometer, SimulatorInterferometer
+from .dataset.imaging import MaskedImaging, SettingsMaskedImaging, SimulatorImaging
+from .dataset.interferometer import (
+    MaskedInterferometer,
+    SettingsMaskedInterferometer,
+    SimulatorInterferometer,
+)
 from .fit.fit import FitImaging, FitInterferometer
 from .fit.fit_positions import FitPositionsSourcePlaneMaxSeparation
-from .lens.settings import SettingsLens
+from .lens.settings import SettingsLens, SettingsPixelization, SettingsInversion
 from .lens.ray_tracing import Tracer
+from .lens.line_of_sight import LineOfSightCulling, LinearDeflections
+from .lens.adaptive_supersampling import AdaptiveSupersampling
+from .lens.interpolated_deflections import InterpolatedDeflections
+from .lens.light_profile_culling import LightProfileCulling
+from .lens.threaded_evaluation import ThreadedEvaluation
+from .lens.tiled_evaluation import TiledEvaluation
+from .lens.tree_deflections import TreeDeflections
 from .lens.positions_solver import PositionsFinder
-from .pipeline.setup import (
-    SetupPipeline,
-    SetupHyper,
-    SetupSourceParametric,
-    SetupSourceInversion,
-    SetupMassTotal,
-    SetupMassLightDark,
-    SetupSubhalo,
-)
-from .pipeline.slam import (
-    SLaMPipelineSourceParametric,
-    SLaMPipelineSourceInversion,
-    SLaMPipelineLightParametric,
-    SLaMPipelineMass,
-    SLaM,
-)
-from .pipeline.phase.settings import SettingsPhaseImaging
-from .pipeline.phase.settings import SettingsPhaseInterferometer
-from .pipeline.phase.imaging.phase import PhaseImaging
-from .pipeline.phase.interferometer.phase import PhaseInterferometer
-from .pipeline.phase.extensions.stochastic_phase import StochasticPhase
-from .pipeline.phase.phase_galaxy import PhaseGalaxy
+
+"""
+The plotting, aggregator, pipeline and phase modules are loaded the first time one of their attributes is accessed
+(e.g. `al.plot`, `al.PhaseImaging`), as opposed to when `autolens` is imported. This keeps the start-up of processes
+that only fit a `Tracer` (e.g. the workers of a process pool) cheap.
+
+Each entry maps the attribute name of the `autolens` module to the module it is loaded from and the name of the
+attribute in that module, where `None` means the module itself is the attribute.
+"""
+_lazy_imports = {
+    "agg": ("autolens.aggregator", None),
+    "plot": ("autolens.plot", None),
+    "SetupLightParametric": ("autogalaxy.pipeline.setup", "SetupLightParametric"),
+    "SetupSMBH": ("autogalaxy.pipeline.setup", "SetupSMBH"),
+    "HyperPhase": ("autogalaxy.pipeline.phase.extensions.hyper_phase", "HyperPhase"),
+    "PipelineDataset": ("autogalaxy.pipeline.pipeline", "PipelineDataset"),
+    "SetupPipeline": ("autolens.pipeline.setup", "SetupPipeline"),
+    "SetupHyper": ("autolens.pipeline.setup", "SetupHyper"),
+    "SetupSourceParametric": ("autolens.pipeline.setup", "SetupSourceParametric"),
+    "SetupSourceInversion": ("autolens.pipeline.setup", "SetupSourceInversion"),
+    "SetupMassTotal": ("autolens.pipeline.setup", "SetupMassTotal"),
+    "SetupMassLightDark": ("autolens.pipeline.setup", "SetupMassLightDark"),
+    "SetupSubhalo": ("autolens.pipeline.setup", "SetupSubhalo"),
+    "SLaMPipelineSourceParametric": (
+        "autolens.pipeline.slam",
+        "SLaMPipelineSourceParametric",
+    ),
+    "SLaMPipelineSourceInversion": (
+        "autolens.pipeline.slam",
+        "SLaMPipelineSourceInversion",
+    ),
+    "SLaMPipelineLightParametric": (
+        "autolens.pipeline.slam",
+        "SLaMPipelineLightParametric",
+    ),
+    "SLaMPipelineMass": ("autolens.pipeline.slam", "SLaMPipelineMass"),
+    "SLaM": ("autolens.pipeline.slam", "SLaM"),
+    "SettingsPhaseImaging": (
+        "autolens.pipeline.phase.settings",
+        "SettingsPhaseImaging",
+    ),
+    "SettingsPhaseInterferometer": (
+        "autolens.pipeline.phase.settings",
+        "SettingsPhaseInterferometer",
+    ),
+    "PhaseImaging": ("autolens.pipeline.phase.imaging.phase", "PhaseImaging"),
+    "PhaseInterferometer": (
+        "autolens.pipeline.phase.interferometer.phase",
+        "PhaseInterferometer",
+    ),
+    "StochasticPhase": (
+        "autolens.pipeline.phase.extensions.stochastic_phase",
+        "StochasticPhase",
+    ),
+    "PhaseGalaxy": ("autolens.pipeline.phase.phase_galaxy", "PhaseGalaxy"),
+}
+
+
+def __getattr__(name):
+
+    if name not in _lazy_imports:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attribute_name = _lazy_imports[name]
+
+    module = importlib.import_module(module_name)
+
+    attribute = module if attribute_name is None else getattr(module, attribute_name)
+
+    globals()[name] = attribute
+
+    return attribute
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_imports))
+
 
 from autoconf import conf
 
 conf.instance.register(__file__)
 
-__version__ = '1.9.3'
+__version__ = "1.9.3"
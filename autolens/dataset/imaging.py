@@ -1,15 +1,84 @@
 import copy
+import numpy as np
 
+from autoconf import conf
 from autoarray.dataset import imaging
 from autoarray.structures import arrays
 from autoarray.structures import grids
 from autoarray.structures import kernel
+from autoarray.util import fit_util
 from autogalaxy.dataset import imaging as im
 from autolens.lens import ray_tracing
 
 
+class SettingsMaskedImaging(im.SettingsMaskedImaging):
+    def __init__(
+        self,
+        grid_class=grids.Grid,
+        grid_inversion_class=grids.Grid,
+        sub_size=2,
+        fractional_accuracy=0.9999,
+        sub_steps=None,
+        pixel_scales_interp=None,
+        bin_up_factor=None,
+        signal_to_noise_limit=None,
+        psf_shape_2d=None,
+        renormalize_psf=True,
+        use_float32=False,
+    ):
+        """
+        The settings of a `MaskedImaging` dataset, which extend those of *PyAutoGalaxy* (see
+        `autogalaxy.SettingsMaskedImaging` for a description of every other setting) with a single-precision mode.
+
+        Parameters
+        ----------
+        use_float32 : bool
+            If `True`, the image, noise-map, grid, blurring grid and PSF convolution frames of the masked dataset are
+            stored in single precision (float32), halving the memory moved when ray-tracing the grids and reading the
+            PSF frames. Light profile images are evaluated by the profiles in double precision (float64), as are the
+            model image and its residuals, and the chi-squared and the linear algebra of inversions are computed in
+            double precision.
+        """
+        super().__init__(
+            grid_class=grid_class,
+            grid_inversion_class=grid_inversion_class,
+            sub_size=sub_size,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps,
+            pixel_scales_interp=pixel_scales_interp,
+            bin_up_factor=bin_up_factor,
+            signal_to_noise_limit=signal_to_noise_limit,
+            psf_shape_2d=psf_shape_2d,
+            renormalize_psf=renormalize_psf,
+        )
+
+        self.use_float32 = use_float32
+
+    @property
+    def tag_no_inversion(self):
+        return f"{super().tag_no_inversion[:-1]}{self.float32_tag}]"
+
+    @property
+    def tag_with_inversion(self):
+        return f"{super().tag_with_inversion[:-1]}{self.float32_tag}]"
+
+    @property
+    def float32_tag(self):
+        """Generate a float32 tag, to customize phase names based on whether the dataset is fitted in single \
+        precision.
+
+        This changes the phase settings folder as follows:
+
+        use_float32 = False -> settings
+        use_float32 = True -> settings__f32
+        """
+        if not self.use_float32:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['imaging']['float32']}"
+
+
 class MaskedImaging(imaging.MaskedImaging):
-    def __init__(self, imaging, mask, settings=im.SettingsMaskedImaging()):
+    def __init__(self, imaging, mask, settings=SettingsMaskedImaging()):
         """
         The lens dataset is the collection of data (image, noise-map, PSF), a mask, grid, convolver \
         and other utilities that are used for modeling and fitting an image of a strong lens.
@@ -44,6 +113,59 @@ class MaskedImaging(imaging.MaskedImaging):
             imaging=imaging, mask=mask, settings=settings
         )
 
+        if settings.use_float32:
+
+            self.image = self.image.astype("float32")
+            self.noise_map = self.noise_map.astype("float32")
+            self.grid = self.grid.astype("float32")
+
+            if self.psf is not None:
+                self.blurring_grid = self.blurring_grid.astype("float32")
+                self.convolver = convolver_float32_from(convolver=self.convolver)
+
+    @property
+    def use_float32(self):
+        return self.image.dtype == np.float32
+
+    @property
+    def noise_normalization(self):
+        """
+        The noise normalization term of the noise-map, which is computed when it is first used and reused by every
+        fit until the noise-map changes (e.g. the copy of the masked imaging with a hyper noise-map made by
+        `modify_image_and_noise_map`).
+        """
+        if self.__dict__.get("_noise_normalization_noise_map") is not self.noise_map:
+            self._noise_normalization = fit_util.noise_normalization_from(
+                noise_map=np.asarray(self.noise_map)
+            )
+            self._noise_normalization_noise_map = self.noise_map
+
+        return self._noise_normalization
+
+
+def convolver_float32_from(convolver):
+    """
+    Returns a copy of a `Convolver` which stores the PSF values of every image and blurring pixel's frame in single
+    precision and the indexes of the frames as 32-bit integers.
+
+    The frames are the largest arrays read during PSF convolution (every pixel stores a value and index for every
+    pixel of the PSF), so this halves the memory the convolution reads.
+    """
+    convolver = copy.copy(convolver)
+
+    convolver.image_frame_1d_kernels = convolver.image_frame_1d_kernels.astype(
+        "float32"
+    )
+    convolver.image_frame_1d_indexes = convolver.image_frame_1d_indexes.astype("int32")
+    convolver.blurring_frame_1d_kernels = convolver.blurring_frame_1d_kernels.astype(
+        "float32"
+    )
+    convolver.blurring_frame_1d_indexes = convolver.blurring_frame_1d_indexes.astype(
+        "int32"
+    )
+
+    return convolver
+
 
 class SimulatorImaging(imaging.SimulatorImaging):
     def __init__(
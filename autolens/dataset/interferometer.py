@@ -1,19 +1,89 @@
 import copy
+import numpy as np
 
+from autoconf import conf
 from autoarray.dataset import interferometer
 from autoarray.operators import transformer
 from autoarray.structures import grids
 from autogalaxy.dataset import interferometer as inter
+from autolens.dataset import transformer_cache
+from autolens.dataset import uv_binning
 from autolens.lens import ray_tracing
 
 
+class SettingsMaskedInterferometer(inter.SettingsMaskedInterferometer):
+    def __init__(
+        self,
+        grid_class=grids.Grid,
+        grid_inversion_class=grids.Grid,
+        sub_size=2,
+        fractional_accuracy=0.9999,
+        sub_steps=None,
+        pixel_scales_interp=None,
+        signal_to_noise_limit=None,
+        transformer_class=transformer.TransformerNUFFT,
+        uv_bin_size=None,
+    ):
+        """
+        The settings of a `MaskedInterferometer` dataset, which extend those of *PyAutoGalaxy* (see
+        `autogalaxy.SettingsMaskedInterferometer` for a description of every other setting) with uv-plane binning.
+
+        Parameters
+        ----------
+        uv_bin_size : float or None
+            If input, the visibilities are binned into square cells of the uv-plane of this size (in wavelengths)
+            before they are fitted (see `uv_binning.binned_interferometer_from`), which for datasets with many
+            redundant visibilities reduces the number of visibilities the model is transformed to and fitted by orders
+            of magnitude. This is intended for the early phases of a pipeline, with the final phase fitting the
+            unbinned visibilities.
+        """
+        super().__init__(
+            grid_class=grid_class,
+            grid_inversion_class=grid_inversion_class,
+            sub_size=sub_size,
+            fractional_accuracy=fractional_accuracy,
+            sub_steps=sub_steps,
+            pixel_scales_interp=pixel_scales_interp,
+            signal_to_noise_limit=signal_to_noise_limit,
+            transformer_class=transformer_class,
+        )
+
+        self.uv_bin_size = uv_bin_size
+
+    @property
+    def tag_no_inversion(self):
+        return f"{super().tag_no_inversion[:-1]}{self.uv_bin_size_tag}]"
+
+    @property
+    def tag_with_inversion(self):
+        return f"{super().tag_with_inversion[:-1]}{self.uv_bin_size_tag}]"
+
+    @property
+    def uv_bin_size_tag(self):
+        """Generate a uv bin size tag, to customize phase names based on the size of the uv-plane cells the \
+        visibilities are binned into.
+
+        This changes the phase settings folder as follows:
+
+        uv_bin_size = None -> settings
+        uv_bin_size = 1000.0 -> settings__uvbin_1000
+        uv_bin_size = 1.0e6 -> settings__uvbin_1000000
+        """
+        if self.uv_bin_size is None:
+            return ""
+        return (
+            f"__{conf.instance['notation']['settings_tags']['interferometer']['uv_bin_size']}_"
+            f"{np.format_float_positional(self.uv_bin_size, trim='-')}"
+        )
+
+
 class MaskedInterferometer(interferometer.MaskedInterferometer):
     def __init__(
         self,
         interferometer,
         visibilities_mask,
         real_space_mask,
-        settings=inter.SettingsMaskedInterferometer(),
+        settings=SettingsMaskedInterferometer(),
     ):
         """
         The lens dataset is the collection of data (image, noise-map), a mask, grid, convolver \
@@ -40,13 +110,59 @@ class MaskedInterferometer(interferometer.MaskedInterferometer):
         inversion_pixel_limit : int or None
             The maximum number of pixels that can be used by an inversion, with the limit placed primarily to speed \
             up run.
+
+        If transformer caching is enabled in the general config, the transformer is loaded from the transformer cache
+        (see `transformer_cache.transformer_from`), so that its plan is only set up once for every phase, pipeline
+        run and aggregator session fitting the dataset.
+
+        If the settings have a `uv_bin_size`, the visibilities are binned in the uv-plane before the dataset is set
+        up, and the `uv_binning` attribute describes the binning and the information it loses.
         """
 
-        super(MaskedInterferometer, self).__init__(
+        self.uv_binning = None
+
+        if settings.uv_bin_size is not None:
+
+            interferometer, self.uv_binning = uv_binning.binned_interferometer_from(
+                interferometer=interferometer,
+                uv_bin_size=settings.uv_bin_size,
+                visibilities_mask=visibilities_mask,
+            )
+
+            visibilities_mask = np.full(
+                fill_value=False, shape=(self.uv_binning.total_binned_visibilities,)
+            )
+
+        cache_path = transformer_cache.cache_path_from_config()
+
+        settings_of_transformer = settings
+
+        if cache_path is not None:
+
+            settings_of_transformer = copy.copy(settings)
+            settings_of_transformer.transformer_class = transformer_cache.CachedTransformerClass(
+                transformer_class=settings.transformer_class, cache_path=cache_path
+            )
+
+        super().__init__(
             interferometer=interferometer,
             visibilities_mask=visibilities_mask,
             real_space_mask=real_space_mask,
-            settings=settings,
+            settings=settings_of_transformer,
+        )
+
+        self.settings = settings
+
+    @property
+    def uv_binning_max_phase_error(self):
+        """
+        The largest error in the phase of the model visibilities (in radians) caused by binning the visibilities in
+        the uv-plane (see `UVBinning.max_phase_error_from`), which is 0.0 if they are not binned.
+        """
+        if self.uv_binning is None:
+            return 0.0
+        return self.uv_binning.max_phase_error_from(
+            real_space_mask=self.real_space_mask
         )
 
 
@@ -0,0 +1,186 @@
+import hashlib
+import os
+import pickle
+import shutil
+from os import path
+
+import autoarray
+import numpy as np
+from autoconf import conf
+
+"""
+Arrays of a transformer of at least this many bytes (e.g. the interpolation matrices of a `TransformerNUFFT` or the
+preloaded transforms of a `TransformerDFT`) are stored in their own .npy file, which is memory-mapped when the
+transformer is loaded.
+"""
+MEMORY_MAP_MIN_BYTES = 8192
+
+
+def cache_path_from_config():
+    """
+    The directory transformers are cached in, which is the `transformers` folder of the output path, or `None` if
+    caching is disabled. Caching writes to the output path, so it is only enabled if the `[transformer] cache` entry
+    of the general config is `True`.
+    """
+    try:
+        cache = conf.instance["general"]["transformer"]["cache"]
+    except KeyError:
+        cache = False
+
+    if not cache:
+        return None
+
+    return path.join(conf.instance.output_path, "transformers")
+
+
+def transformer_key_from(transformer_class, uv_wavelengths, real_space_mask):
+    """
+    The key of a transformer in the cache, which is a hash of everything its plan depends on: its class (and the
+    autoarray version, which defines the class), its uv-wavelengths and the geometry of its real-space mask.
+    """
+    mask = real_space_mask.mask_sub_1
+
+    key = hashlib.sha1()
+
+    key.update(
+        f"{transformer_class.__module__}.{transformer_class.__qualname__}".encode()
+    )
+    key.update(autoarray.__version__.encode())
+    key.update(str(np.shape(uv_wavelengths)).encode())
+    key.update(np.ascontiguousarray(uv_wavelengths, dtype="float64").tobytes())
+    key.update(str(mask.shape).encode())
+    key.update(np.ascontiguousarray(mask, dtype="bool").tobytes())
+    key.update(str((mask.pixel_scales, mask.origin)).encode())
+
+    return key.hexdigest()
+
+
+class _TransformerPickler(pickle.Pickler):
+    def __init__(self, file, file_path):
+        """
+        Pickles a transformer, storing every large ndarray in its own .npy file of the directory `file_path` (as
+        opposed to in the pickle) so that it can be memory-mapped when the transformer is loaded.
+        """
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.file_path = file_path
+        self.array_filenames = {}
+
+    def persistent_id(self, obj):
+
+        if type(obj) is not np.ndarray or obj.nbytes < MEMORY_MAP_MIN_BYTES:
+            return None
+
+        if id(obj) not in self.array_filenames:
+
+            filename = f"array_{len(self.array_filenames)}.npy"
+
+            np.save(path.join(self.file_path, filename), obj)
+
+            self.array_filenames[id(obj)] = filename
+
+        return self.array_filenames[id(obj)]
+
+
+class _TransformerUnpickler(pickle.Unpickler):
+    def __init__(self, file, file_path):
+        super().__init__(file)
+
+        self.file_path = file_path
+
+    def persistent_load(self, pid):
+        return np.load(path.join(self.file_path, pid), mmap_mode="r")
+
+
+def save_transformer(transformer, file_path):
+    """
+    Save a transformer to the directory `file_path`, whose large arrays are stored as .npy files that are
+    memory-mapped by `load_transformer`.
+    """
+    with open(path.join(file_path, "transformer.pickle"), "wb") as f:
+        _TransformerPickler(f, file_path=file_path).dump(transformer)
+
+
+def load_transformer(file_path):
+    with open(path.join(file_path, "transformer.pickle"), "rb") as f:
+        return _TransformerUnpickler(f, file_path=file_path).load()
+
+
+class CachedTransformerClass:
+    def __init__(self, transformer_class, cache_path):
+        """
+        A transformer class whose transformers are loaded from (and stored in) the cache directory `cache_path`
+        (see `transformer_from`), which can be used in place of the class wherever a transformer is set up from its
+        uv-wavelengths and real-space mask (e.g. as the `transformer_class` of the settings of a masked
+        interferometer).
+        """
+        self.transformer_class = transformer_class
+        self.cache_path = cache_path
+
+    def __call__(self, uv_wavelengths, real_space_mask):
+        return transformer_from(
+            transformer_class=self.transformer_class,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+            cache_path=self.cache_path,
+        )
+
+
+def transformer_from(transformer_class, uv_wavelengths, real_space_mask, cache_path):
+    """
+    Returns a transformer, loading its plan (e.g. the interpolation matrices of a `TransformerNUFFT` or the
+    preloaded transforms of a `TransformerDFT`) from the cache directory `cache_path` if a transformer of the same
+    class, uv-wavelengths and real-space mask was cached there before (e.g. by an earlier phase, an earlier run of
+    the pipeline or an aggregator session), and setting it up and caching it otherwise.
+
+    The large arrays of a cached transformer are memory-mapped, so every process using it shares one copy of them.
+    If `cache_path` is `None` the transformer is set up without caching.
+
+    Parameters
+    ----------
+    transformer_class : type
+        The class of the transformer (e.g. `TransformerNUFFT`).
+    uv_wavelengths : np.ndarray
+        The uv-wavelengths of the interferometer dataset.
+    real_space_mask : aa.Mask2D
+        The real-space mask of the transformer.
+    cache_path : str or None
+        The directory transformers are cached in.
+    """
+    if cache_path is None:
+        return transformer_class(
+            uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+        )
+
+    transformer_path = path.join(
+        cache_path,
+        transformer_key_from(
+            transformer_class=transformer_class,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=real_space_mask,
+        ),
+    )
+
+    if path.exists(path.join(transformer_path, "transformer.pickle")):
+        return load_transformer(file_path=transformer_path)
+
+    transformer = transformer_class(
+        uv_wavelengths=uv_wavelengths, real_space_mask=real_space_mask
+    )
+
+    # The transformer is written to a temporary directory which is then renamed, so that other processes sharing
+    # the cache never load a partially written transformer.
+
+    temporary_path = f"{transformer_path}.{os.getpid()}"
+
+    os.makedirs(temporary_path, exist_ok=True)
+
+    save_transformer(transformer=transformer, file_path=temporary_path)
+
+    try:
+        os.rename(temporary_path, transformer_path)
+    except OSError:
+        shutil.rmtree(temporary_path)
+        return transformer
+
+    return load_transformer(file_path=transformer_path)
@@ -0,0 +1,168 @@
+import numpy as np
+
+from autoarray.dataset import interferometer as inter
+from autoarray.structures import visibilities as vis
+
+
+class UVBinning:
+    def __init__(self, uv_bin_size, uv_wavelengths, binned_uv_wavelengths, bin_indexes):
+        """
+        Describes how the visibilities of an interferometer dataset are binned into square cells of the uv-plane
+        (see `binned_interferometer_from`) and the information lost by fitting the binned visibilities.
+
+        Parameters
+        ----------
+        uv_bin_size : float
+            The size of every uv-plane cell, in wavelengths.
+        uv_wavelengths : np.ndarray
+            The uv-wavelengths of every visibility before binning.
+        binned_uv_wavelengths : np.ndarray
+            The (weighted mean) uv-wavelengths of every binned visibility.
+        bin_indexes : np.ndarray
+            The index of the binned visibility every visibility is binned into.
+        """
+        self.uv_bin_size = uv_bin_size
+        self.uv_wavelengths = uv_wavelengths
+        self.binned_uv_wavelengths = binned_uv_wavelengths
+        self.bin_indexes = bin_indexes
+
+    @property
+    def total_visibilities(self):
+        return self.uv_wavelengths.shape[0]
+
+    @property
+    def total_binned_visibilities(self):
+        return self.binned_uv_wavelengths.shape[0]
+
+    @property
+    def compression(self):
+        """
+        The factor by which binning reduces the number of visibilities that are fitted.
+        """
+        return self.total_visibilities / self.total_binned_visibilities
+
+    @property
+    def max_uv_offset(self):
+        """
+        The largest distance in the uv-plane (in wavelengths) between a visibility and the binned visibility it is
+        binned into.
+        """
+        return float(
+            np.max(
+                np.linalg.norm(
+                    self.uv_wavelengths - self.binned_uv_wavelengths[self.bin_indexes],
+                    axis=1,
+                )
+            )
+        )
+
+    def max_phase_error_from(self, real_space_mask):
+        """
+        The largest error (in radians) in the phase of the model visibilities caused by binning, which is the phase
+        error of emission at the edge of the real-space mask in the visibility furthest from its binned visibility.
+
+        The model visibilities of a binned visibility are computed at its mean uv-wavelengths, whereas the
+        visibilities it bins sample the Fourier transform of the model at their own uv-wavelengths. Emission a
+        distance `theta` (in radians) from the phase centre changes phase by `2 * pi * theta * |delta uv|` between
+        them. This information-loss metric should be well below 1.0 for the binned fit to be accurate.
+
+        Parameters
+        ----------
+        real_space_mask : aa.Mask2D
+            The real-space mask of the images that are Fourier transformed.
+        """
+        grid = real_space_mask.mask_sub_1.geometry.masked_grid_sub_1.in_radians
+
+        max_radius = float(np.max(np.sqrt(np.sum(np.square(grid), axis=1))))
+
+        return 2.0 * np.pi * max_radius * self.max_uv_offset
+
+
+def binned_interferometer_from(interferometer, uv_bin_size, visibilities_mask=None):
+    """
+    Bin the visibilities of an interferometer dataset into square cells of the uv-plane of size `uv_bin_size`
+    (in wavelengths), returning the binned dataset and the `UVBinning` describing it.
+
+    Visibilities which are masked by the `visibilities_mask` (where `True` denotes a masked visibility) are removed
+    before binning, such that no binned visibility is masked.
+
+    The real and imaginary components of every cell's visibilities are combined via their inverse-variance weighted
+    mean, such that their noise-map values are `1 / sqrt(sum(1 / noise ** 2))` and the chi-squared of a model which
+    is constant within every cell is the same (up to a constant) as that of the unbinned visibilities. The
+    uv-wavelengths of every binned visibility are the weighted mean uv-wavelengths of its visibilities.
+
+    Parameters
+    ----------
+    interferometer : aa.Interferometer
+        The interferometer dataset whose visibilities are binned.
+    uv_bin_size : float
+        The size of every uv-plane cell, in wavelengths.
+    visibilities_mask : np.ndarray or None
+        The mask of the visibilities, where `True` entries are removed before binning.
+    """
+    unmasked = slice(None)
+
+    if visibilities_mask is not None:
+        unmasked = ~np.asarray(visibilities_mask, dtype="bool")
+
+    uv_wavelengths = np.asarray(interferometer.uv_wavelengths, dtype="float64")[
+        unmasked
+    ]
+
+    cells = np.floor(uv_wavelengths / uv_bin_size).astype("int64")
+
+    bin_indexes = np.unique(cells, axis=0, return_inverse=True)[1].ravel()
+
+    total_bins = int(np.max(bin_indexes)) + 1
+
+    visibilities = np.asarray(interferometer.visibilities)[unmasked]
+    noise_map = np.asarray(interferometer.noise_map)[unmasked]
+
+    weights_real = 1.0 / np.square(np.real(noise_map))
+    weights_imag = 1.0 / np.square(np.imag(noise_map))
+
+    def bin_sum_from(values):
+        return np.bincount(bin_indexes, weights=values, minlength=total_bins)
+
+    weights_real_binned = bin_sum_from(values=weights_real)
+    weights_imag_binned = bin_sum_from(values=weights_imag)
+
+    binned_visibilities = (
+        bin_sum_from(values=weights_real * np.real(visibilities)) / weights_real_binned
+        + 1j
+        * bin_sum_from(values=weights_imag * np.imag(visibilities))
+        / weights_imag_binned
+    )
+
+    binned_noise_map = 1.0 / np.sqrt(weights_real_binned) + 1j / np.sqrt(
+        weights_imag_binned
+    )
+
+    weights = weights_real + weights_imag
+    weights_binned = bin_sum_from(values=weights)
+
+    binned_uv_wavelengths = np.stack(
+        [
+            bin_sum_from(values=weights * uv_wavelengths[:, 0]) / weights_binned,
+            bin_sum_from(values=weights * uv_wavelengths[:, 1]) / weights_binned,
+        ],
+        axis=1,
+    )
+
+    binned_interferometer = inter.Interferometer(
+        visibilities=vis.Visibilities(visibilities=binned_visibilities),
+        noise_map=vis.VisibilitiesNoiseMap(visibilities=binned_noise_map),
+        uv_wavelengths=binned_uv_wavelengths,
+        positions=interferometer.positions,
+        name=interferometer.name,
+    )
+
+    return (
+        binned_interferometer,
+        UVBinning(
+            uv_bin_size=uv_bin_size,
+            uv_wavelengths=uv_wavelengths,
+            binned_uv_wavelengths=binned_uv_wavelengths,
+            bin_indexes=bin_indexes,
+        ),
+    )
@@ -23,8 +23,17 @@ except Exception:
     parallel = False
 
 
+"""
+Every function compiled with the `jit` decorator is added to this list, so that all autolens kernels can be compiled
+and cached ahead of time (see `autolens.numba_cache`).
+"""
+kernels = []
+
+
 def jit(nopython=nopython, cache=cache, parallel=parallel):
     def wrapper(func):
-        return numba.jit(func, nopython=nopython, cache=cache, parallel=parallel)
+        kernel = numba.jit(func, nopython=nopython, cache=cache, parallel=parallel)
+        kernels.append(kernel)
+        return kernel
 
     return wrapper
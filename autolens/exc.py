@@ -23,3 +23,7 @@ class PixelizationException(af.exc.FitException):
 
 class SettingsException(Exception):
     pass
+
+
+class SerializationException(Exception):
+    pass
@@ -2,8 +2,9 @@ import numpy as np
 
 from autoconf import conf
 from autoarray.fit import fit as aa_fit
-from autoarray.inversion import pixelizations as pix, inversions as inv
+from autoarray.util import fit_util as aa_fit_util
 from autogalaxy.galaxy import galaxy as g
+from autolens.lens.settings import SettingsPixelization, SettingsInversion
 
 
 class FitImaging(aa_fit.FitImaging):
@@ -14,8 +15,10 @@ class FitImaging(aa_fit.FitImaging):
         hyper_image_sky=None,
         hyper_background_noise=None,
         use_hyper_scaling=True,
-        settings_pixelization=pix.SettingsPixelization(),
-        settings_inversion=inv.SettingsInversion(),
+        settings_pixelization=SettingsPixelization(),
+        settings_inversion=SettingsInversion(),
+        likelihood_only=False,
+        inversion_cache=None,
     ):
         """ An  lens fitter, which contains the tracer's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
@@ -26,9 +29,18 @@ class FitImaging(aa_fit.FitImaging):
             The tracer, which describes the ray-tracing and strong lens configuration.
         scaled_array_2d_from_array_1d : func
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
+        likelihood_only : bool
+            If `True`, the `figure_of_merit` is computed from the raw 1D values of the image, model image and
+            noise-map (with the noise normalization of the noise-map reused between fits), as opposed to via the
+            residual-map and chi-squared-map structures, which are only computed if they are used (e.g.
+            for visualization). This is used when fitting a model, where only the `figure_of_merit` is used.
+        inversion_cache : InversionCache or None
+            If input, the inversion reuses the quantities of the cache's last inversion which are unchanged (see
+            `InversionCache`).
         """
 
         self.tracer = tracer
+        self.likelihood_only = likelihood_only
 
         if use_hyper_scaling:
 
@@ -63,8 +75,6 @@ class FitImaging(aa_fit.FitImaging):
             blurring_grid=masked_imaging.blurring_grid,
         )
 
-        self.profile_subtracted_image = image - self.blurred_image
-
         if not tracer.has_pixelization:
 
             inversion = None
@@ -72,13 +82,24 @@ class FitImaging(aa_fit.FitImaging):
 
         else:
 
+            self._profile_subtracted_image = image - self.blurred_image
+
+            profile_subtracted_image = self.profile_subtracted_image
+
+            if masked_imaging.use_float32:
+                profile_subtracted_image = profile_subtracted_image.astype(
+                    "float64", copy=False
+                )
+                noise_map = noise_map.astype("float64")
+
             inversion = tracer.inversion_imaging_from_grid_and_data(
                 grid=masked_imaging.grid_inversion,
-                image=self.profile_subtracted_image,
+                image=profile_subtracted_image,
                 noise_map=noise_map,
                 convolver=masked_imaging.convolver,
                 settings_pixelization=settings_pixelization,
                 settings_inversion=settings_inversion,
+                inversion_cache=inversion_cache,
             )
 
             model_image = self.blurred_image + inversion.mapped_reconstructed_image
@@ -94,6 +115,46 @@ class FitImaging(aa_fit.FitImaging):
     def grid(self):
         return self.masked_imaging.grid
 
+    @property
+    def profile_subtracted_image(self):
+        """
+        The image minus the blurred image of the tracer's light profiles, which is computed once when it is first
+        used.
+        """
+        if self.__dict__.get("_profile_subtracted_image") is None:
+            self._profile_subtracted_image = self.image - self.blurred_image
+        return self._profile_subtracted_image
+
+    @property
+    def figure_of_merit(self) -> float:
+        if not self.likelihood_only:
+            return super().figure_of_merit
+
+        chi_squared = float(
+            np.sum(
+                np.square(
+                    (np.asarray(self.image) - np.asarray(self.model_image))
+                    / np.asarray(self.noise_map)
+                ),
+                dtype="float64",
+            )
+        )
+
+        noise_normalization = self.masked_imaging.noise_normalization
+
+        if self.inversion is None:
+            return aa_fit_util.log_likelihood_from(
+                chi_squared=chi_squared, noise_normalization=noise_normalization
+            )
+
+        return aa_fit_util.log_evidence_from(
+            chi_squared=chi_squared,
+            regularization_term=self.inversion.regularization_term,
+            log_curvature_regularization_term=self.inversion.log_det_curvature_reg_matrix_term,
+            log_regularization_term=self.inversion.log_det_regularization_matrix_term,
+            noise_normalization=noise_normalization,
+        )
+
     @property
     def galaxy_model_image_dict(self) -> {g.Galaxy: np.ndarray}:
         """
@@ -105,15 +166,15 @@ class FitImaging(aa_fit.FitImaging):
             blurring_grid=self.masked_imaging.blurring_grid,
         )
 
-        # TODO : Extend to multiple inversioons across Planes
+        inversions_of_planes = self.inversions_of_planes
 
         for plane_index in self.tracer.plane_indexes_with_pixelizations:
 
             galaxy_model_image_dict.update(
                 {
-                    self.tracer.planes[plane_index].galaxies[
-                        0
-                    ]: self.inversion.mapped_reconstructed_image
+                    self.tracer.planes[plane_index]
+                    .galaxies[0]: inversions_of_planes[plane_index]
+                    .mapped_reconstructed_image
                 }
             )
 
@@ -128,14 +189,36 @@ class FitImaging(aa_fit.FitImaging):
             blurring_grid=self.masked_imaging.blurring_grid,
         )
 
+        inversions_of_planes = self.inversions_of_planes
+
         for plane_index in self.tracer.plane_indexes_with_pixelizations:
 
-            model_images_of_planes[
+            model_images_of_planes[plane_index] += inversions_of_planes[
                 plane_index
-            ] += self.inversion.mapped_reconstructed_image
+            ].mapped_reconstructed_image
 
         return model_images_of_planes
 
+    @property
+    def inversions_of_planes(self):
+        """
+        The inversion of every plane with a pixelization, which is `None` for planes without one. If several planes
+        have a pixelization these are the inversions of every plane of their joint inversion.
+        """
+        inversions_of_planes = [None] * self.tracer.total_planes
+
+        if self.inversion is None:
+            return inversions_of_planes
+
+        inversions = getattr(self.inversion, "inversions", [self.inversion])
+
+        for plane_index, inversion in zip(
+            self.tracer.plane_indexes_with_pixelizations, inversions
+        ):
+            inversions_of_planes[plane_index] = inversion
+
+        return inversions_of_planes
+
     @property
     def unmasked_blurred_image(self):
         return self.tracer.unmasked_blurred_image_from_grid_and_psf(
@@ -166,8 +249,9 @@ class FitInterferometer(aa_fit.FitInterferometer):
         tracer,
         hyper_background_noise=None,
         use_hyper_scaling=True,
-        settings_pixelization=pix.SettingsPixelization(),
-        settings_inversion=inv.SettingsInversion(),
+        settings_pixelization=SettingsPixelization(),
+        settings_inversion=SettingsInversion(),
+        inversion_cache=None,
     ):
         """ An  lens fitter, which contains the tracer's used to perform the fit and functions to manipulate \
         the lens dataset's hyper_galaxies.
@@ -178,6 +262,9 @@ class FitInterferometer(aa_fit.FitInterferometer):
             The tracer, which describes the ray-tracing and strong lens configuration.
         scaled_array_2d_from_array_1d : func
             A function which maps the 1D lens hyper_galaxies to its unmasked 2D arrays.
+        inversion_cache : InversionCache or None
+            If input, the inversion reuses the quantities of the cache's last inversion which are unchanged (see
+            `InversionCache`).
         """
 
         if use_hyper_scaling:
@@ -224,6 +311,7 @@ class FitInterferometer(aa_fit.FitInterferometer):
                 transformer=masked_interferometer.transformer,
                 settings_pixelization=settings_pixelization,
                 settings_inversion=settings_inversion,
+                inversion_cache=inversion_cache,
             )
 
             model_visibilities = (
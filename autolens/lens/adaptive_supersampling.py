@@ -0,0 +1,190 @@
+import numpy as np
+
+from autoarray.mask import mask_2d as msk
+from autoarray.structures import grids
+
+
+class AdaptiveSupersampling:
+    def __init__(
+        self,
+        sub_steps=(4, 8, 16),
+        fractional_accuracy: float = 0.9999,
+        relative_variation: float = 0.03,
+        source_plane_resolution: float = 0.1,
+    ):
+        """
+        Computes the image of a tracer by supersampling every image pixel at the sub-size its lensing requires, as
+        opposed to using the same sub-size for every pixel.
+
+        A fixed sub-size wastes evaluations on pixels whose traced sub-pixels sample a smooth region of the source
+        (e.g. pixels in the outskirts of the image, where the source is demagnified and faint) and undersamples pixels
+        whose traced sub-pixels straddle steep gradients of the source (e.g. pixels near the critical curves, which map
+        to stretched footprints in the source-plane).
+
+        The image is first computed using the sub-size of the input grid, which is ray-traced to the source-plane to
+        give the footprint of every pixel. A pixel is re-evaluated at the next sub-size of `sub_steps` if either:
+
+        - The image of its traced sub-pixels varies by more than `relative_variation` times the maximum value of the
+          image, such that its footprint covers steep gradients of the lensed source.
+
+        - Its traced sub-pixels are separated by more than the `source_plane_resolution` in the source-plane, such
+          that its footprint is sampled too sparsely to detect a compact source (e.g. near a caustic).
+
+        This repeats for every sub-size, until neither applies to a pixel or its image changes by less than the
+        `fractional_accuracy` between two sub-sizes (as for a `GridIterate`).
+
+        The pixels which are re-evaluated are therefore chosen by how the source varies over each pixel's footprint
+        in the source-plane, as opposed to the curvature of the light profiles evaluated on the image-plane grid
+        (which is what a `GridIterate` uses), and only one sub-size is evaluated for every pixel which is not.
+
+        Parameters
+        ----------
+        sub_steps : [int]
+            The increasing sub-sizes pixels are re-evaluated at, where sub-sizes below that of the input grid are
+            not used.
+        fractional_accuracy : float
+            The fractional accuracy of a pixel's image between two sub-sizes above which it is not re-evaluated.
+        relative_variation : float
+            The variation of the image of a pixel's sub-pixels, as a fraction of the maximum value of the image,
+            above which it is re-evaluated.
+        source_plane_resolution : float
+            The arc-second separation of a pixel's traced sub-pixels in the source-plane above which it is
+            re-evaluated.
+        """
+        self.sub_steps = sub_steps
+        self.fractional_accuracy = fractional_accuracy
+        self.relative_variation = relative_variation
+        self.source_plane_resolution = source_plane_resolution
+
+    def binned_image_and_sub_sizes_from_tracer_and_grid(self, tracer, grid):
+        """
+        Returns the image of a tracer on the pixels of a masked `Grid`, supersampled adaptively, and the sub-size
+        each pixel's image was computed using. Both are returned as ndarrays of shape [total_unmasked_pixels].
+        """
+        mask = grid.mask
+
+        pixel_indexes_2d = np.argwhere(~np.asarray(mask))
+
+        image, variations, spacings = self.binned_image_variations_and_spacings_from(
+            tracer=tracer, grid=grid
+        )
+
+        maximum_variation = self.relative_variation * np.max(np.abs(image))
+
+        sub_sizes = np.full(shape=image.shape[0], fill_value=mask.sub_size)
+
+        indexes = np.nonzero(
+            np.logical_or(
+                variations > maximum_variation, spacings > self.source_plane_resolution
+            )
+        )[0]
+
+        for sub_size in self.sub_steps:
+
+            if sub_size <= mask.sub_size:
+                continue
+
+            if len(indexes) == 0:
+                break
+
+            mask_refine = np.full(shape=mask.shape, fill_value=True)
+            mask_refine[tuple(pixel_indexes_2d[indexes].T)] = False
+
+            grid_refine = grids.Grid.from_mask(
+                mask=msk.Mask2D(
+                    mask=mask_refine,
+                    pixel_scales=mask.pixel_scales,
+                    sub_size=sub_size,
+                    origin=mask.origin,
+                )
+            )
+
+            (
+                image_refine,
+                variations,
+                spacings,
+            ) = self.binned_image_variations_and_spacings_from(
+                tracer=tracer, grid=grid_refine
+            )
+
+            is_converged = self.is_converged_from(
+                image_lower_sub=image[indexes], image_higher_sub=image_refine
+            )
+
+            image[indexes] = image_refine
+            sub_sizes[indexes] = sub_size
+
+            indexes = indexes[
+                np.logical_and(
+                    ~is_converged,
+                    np.logical_or(
+                        variations > maximum_variation,
+                        spacings > self.source_plane_resolution,
+                    ),
+                )
+            ]
+
+        return image, sub_sizes
+
+    def is_converged_from(self, image_lower_sub, image_higher_sub):
+        """
+        Returns whether the image of every pixel evaluated at a lower and higher sub-size are within the fractional
+        accuracy of one another, where pixels whose images are both zero are converged.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fractional_accuracy = image_lower_sub / image_higher_sub
+
+        fractional_accuracy = np.where(
+            fractional_accuracy > 1.0, 1.0 / fractional_accuracy, fractional_accuracy
+        )
+
+        return np.logical_or(
+            fractional_accuracy >= self.fractional_accuracy,
+            np.logical_and(image_lower_sub == 0.0, image_higher_sub == 0.0),
+        )
+
+    @staticmethod
+    def binned_image_variations_and_spacings_from(tracer, grid):
+        """
+        Returns the image of a tracer binned to the pixels of a `Grid`, the variation (maximum minus minimum) of the
+        image of every pixel's sub-pixels and the arc-second separation of every pixel's sub-pixels when traced to
+        the source-plane.
+
+        The separation is estimated as the diagonal of the bounding box of the traced sub-pixels divided by the
+        number of sub-pixel separations along each side. Pixels with a sub-size of 1 (e.g. those of a blurring grid)
+        have only one traced coordinate, so their separation is estimated as the diagonal of a pixel, computed from
+        the pixel scales of the grid's mask, which assumes their footprints are not magnified.
+        """
+        sub_length = grid.sub_size ** 2
+
+        traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+        image = sum(
+            np.asarray(tracer.image_of_plane_from_grid(plane=plane, grid=traced_grid))
+            for plane, traced_grid in zip(tracer.planes, traced_grids_of_planes)
+        )
+
+        image = image.reshape(-1, sub_length)
+
+        binned_image = np.mean(image, axis=1)
+        variations = np.max(image, axis=1) - np.min(image, axis=1)
+
+        if grid.sub_size == 1:
+            return (
+                binned_image,
+                variations,
+                np.full(
+                    shape=binned_image.shape[0],
+                    fill_value=np.sqrt(np.sum(np.square(grid.mask.pixel_scales))),
+                ),
+            )
+
+        source_plane_grid = np.asarray(traced_grids_of_planes[-1]).reshape(
+            -1, sub_length, 2
+        )
+
+        extents = np.max(source_plane_grid, axis=1) - np.min(source_plane_grid, axis=1)
+
+        spacings = np.sqrt(np.sum(extents ** 2.0, axis=1)) / (grid.sub_size - 1)
+
+        return binned_image, variations, spacings
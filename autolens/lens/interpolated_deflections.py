@@ -0,0 +1,164 @@
+import numpy as np
+
+
+class InterpolatedDeflections:
+    def __init__(self, pixel_scale: float = 0.1, maximum_error: float = 1.0e-3):
+        """
+        Computes the deflection angles of a plane on a coarse regular grid covering the footprint of the grid traced
+        to that plane, and bilinearly interpolates them to the (sub-)coordinates of the traced grid.
+
+        Ray-tracing otherwise evaluates the deflections of every plane at every sub-pixel of the traced grid (and
+        its blurring grid and sparse grids, which are traced via the same method). With a sub_size of 4 or 8 there
+        are 16 or 64 coordinates per image pixel, whereas the deflections of most mass profiles vary smoothly on
+        the scale of a pixel.
+
+        The coarse grid consists of the corners of every cell of size `pixel_scale` which contains a coordinate of
+        the traced grid. The error of the interpolation is controlled by also evaluating the deflections at the
+        centre and the midpoints of the four edges of every cell, where the error of bilinear interpolation is
+        largest (the error at the centre alone vanishes for deflections whose curvature along y and x cancel, for
+        example near the critical curves of an isothermal profile). Cells whose interpolated deflections at any of
+        these points differ from the exact deflections by more than `maximum_error` (e.g. cells containing the cusp
+        of a mass profile's centre) have their deflections evaluated exactly at every one of their coordinates.
+
+        The cells are aligned to multiples of `pixel_scale`, as opposed to the coordinates of the grid, so the
+        interpolated deflections at a coordinate do not depend on the other coordinates of the grid (e.g. the tiles
+        of a `TiledEvaluation`), unless the grid has fewer coordinates than the coarse grid, in which case its
+        deflections are evaluated exactly.
+
+        Parameters
+        ----------
+        pixel_scale : float
+            The arc-second size of the cells of the coarse grid the deflections are evaluated on.
+        maximum_error : float
+            The maximum arc-second error of the interpolated deflections at the centre and edge midpoints of a cell,
+            above which the deflections of its coordinates are evaluated exactly. Between these points the error can
+            exceed this tolerance slightly.
+        """
+        self.pixel_scale = pixel_scale
+        self.maximum_error = maximum_error
+
+    def is_used_for_plane(self, plane):
+        return plane.has_mass_profile
+
+    def deflections_from_func_and_grid(self, func, grid):
+        """
+        Returns the deflection angles of a function, which computes deflection angles on an ndarray of (y,x)
+        coordinates of shape [total_coordinates, 2], interpolated to a grid. The deflections are returned as an
+        ndarray of shape [total_coordinates, 2].
+        """
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        absolute_cell_indexes_2d = np.floor(grid / self.pixel_scale).astype("int")
+
+        origin_index = np.min(absolute_cell_indexes_2d, axis=0)
+
+        cell_indexes_2d = absolute_cell_indexes_2d - origin_index
+
+        """
+        Cells and their corners are labelled by a 1D index, with the corners of a cell spanning (y,x) indexes
+        [(0,0), (0,1), (1,0), (1,1)] relative to it. Corners are shared between neighboring cells and are therefore
+        only evaluated once.
+        """
+        total_x = np.max(cell_indexes_2d[:, 1]) + 2
+
+        cells, cell_indexes = np.unique(
+            cell_indexes_2d[:, 0] * total_x + cell_indexes_2d[:, 1],
+            return_inverse=True,
+        )
+
+        cells_2d = np.stack((cells // total_x, cells % total_x), axis=-1)
+
+        cell_corners = self.pixel_scale * (cells_2d + origin_index)
+
+        corners, corner_indexes = np.unique(
+            cells[:, None] + np.array([0, 1, total_x, total_x + 1])[None, :],
+            return_inverse=True,
+        )
+
+        corners = np.stack((corners // total_x, corners % total_x), axis=-1)
+
+        """
+        The centre and edge midpoints of every cell, at which the interpolation error is estimated, are labelled by a
+        1D index on a grid of half the cell size, spanning (y,x) half-cell indexes [(1,1), (0,1), (2,1), (1,0),
+        (1,2)] relative to the cell. Edge midpoints are shared between neighboring cells.
+        """
+        test_points, test_point_indexes = np.unique(
+            (2 * cells_2d[:, None, 0] + np.array([1, 0, 2, 1, 1])[None, :])
+            * (2 * total_x)
+            + (2 * cells_2d[:, None, 1] + np.array([1, 1, 1, 0, 2])[None, :]),
+            return_inverse=True,
+        )
+
+        test_points = np.stack(
+            (test_points // (2 * total_x), test_points % (2 * total_x)), axis=-1
+        )
+
+        if corners.shape[0] + test_points.shape[0] >= grid.shape[0]:
+            return np.asarray(func(grid)).reshape(-1, 2)
+
+        deflections_of_corners = np.asarray(
+            func(self.pixel_scale * (corners + origin_index))
+        ).reshape(-1, 2)
+
+        deflections_of_cell_corners = deflections_of_corners[
+            corner_indexes.reshape(-1, 4)
+        ]
+
+        deflections_of_test_points = np.asarray(
+            func(0.5 * self.pixel_scale * (test_points + 2 * origin_index))
+        ).reshape(-1, 2)
+
+        interpolated_deflections_of_cell_test_points = np.einsum(
+            "pc,ncj->npj",
+            np.array(
+                [
+                    [0.25, 0.25, 0.25, 0.25],
+                    [0.5, 0.5, 0.0, 0.0],
+                    [0.0, 0.0, 0.5, 0.5],
+                    [0.5, 0.0, 0.5, 0.0],
+                    [0.0, 0.5, 0.0, 0.5],
+                ]
+            ),
+            deflections_of_cell_corners,
+        )
+
+        interpolation_errors = np.max(
+            np.sqrt(
+                np.sum(
+                    (
+                        deflections_of_test_points[test_point_indexes.reshape(-1, 5)]
+                        - interpolated_deflections_of_cell_test_points
+                    )
+                    ** 2.0,
+                    axis=2,
+                )
+            ),
+            axis=1,
+        )
+
+        offsets = (grid - cell_corners[cell_indexes]) / self.pixel_scale
+
+        weights = np.stack(
+            (
+                (1.0 - offsets[:, 0]) * (1.0 - offsets[:, 1]),
+                (1.0 - offsets[:, 0]) * offsets[:, 1],
+                offsets[:, 0] * (1.0 - offsets[:, 1]),
+                offsets[:, 0] * offsets[:, 1],
+            ),
+            axis=1,
+        )
+
+        deflections = np.einsum(
+            "nc,ncj->nj", weights, deflections_of_cell_corners[cell_indexes]
+        )
+
+        exact_indexes = np.nonzero(
+            interpolation_errors[cell_indexes] > self.maximum_error
+        )[0]
+
+        if len(exact_indexes) > 0:
+            deflections[exact_indexes] = np.asarray(func(grid[exact_indexes])).reshape(
+                -1, 2
+            )
+
+        return deflections
@@ -0,0 +1,619 @@
+import numpy as np
+from scipy import linalg, sparse
+
+from autoarray import exc
+from autoarray.inversion import inversions as inv
+from autoarray.structures import arrays
+from autoarray.util import inversion_util
+from autolens.lens import solver_util
+from autolens.lens.settings import SettingsInversion
+from autolens.lens import sparse_inversion_util
+
+
+class InversionImagingMatrix(inv.InversionImagingMatrix):
+    def __init__(
+        self,
+        log_det_curvature_reg_matrix_term,
+        log_det_regularization_matrix_term,
+        log_det_curvature_reg_matrix_term_error=0.0,
+        **kwargs
+    ):
+        """
+        An `InversionImagingMatrix` whose log determinant terms are computed by the `InversionCache` which performed
+        it, for example from the Cholesky factorisation used to solve for its reconstruction, as opposed to
+        factorising the matrices again.
+
+        If the log determinant of the curvature regularization matrix was estimated by the iterative solver, its
+        standard error is `log_det_curvature_reg_matrix_term_error` (which is 0.0 if it was computed exactly) and the
+        standard error of the log evidence of the inversion is `log_evidence_error`.
+
+        Its blurred mapping matrix, regularization matrix and curvature regularization matrix are sparse matrices if
+        the inversion was performed with `use_sparse_matrices=True` (see `autolens.SettingsInversion`).
+        """
+        super().__init__(**kwargs)
+
+        self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+        self._log_det_regularization_matrix_term = log_det_regularization_matrix_term
+        self.log_det_curvature_reg_matrix_term_error = (
+            log_det_curvature_reg_matrix_term_error
+        )
+
+    @property
+    def log_evidence_error(self):
+        return 0.5 * self.log_det_curvature_reg_matrix_term_error
+
+    @property
+    def log_det_curvature_reg_matrix_term(self):
+        return self._log_det_curvature_reg_matrix_term
+
+    @property
+    def log_det_regularization_matrix_term(self):
+        return self._log_det_regularization_matrix_term
+
+    @property
+    def regularization_term(self):
+        return self.reconstruction @ (self.regularization_matrix @ self.reconstruction)
+
+    @property
+    def errors_with_covariance(self):
+        if sparse.issparse(self.curvature_reg_matrix):
+            return np.linalg.inv(self.curvature_reg_matrix.toarray())
+        return super().errors_with_covariance
+
+    @property
+    def mapped_reconstructed_image(self):
+        if sparse.issparse(self.blurred_mapping_matrix):
+            return arrays.Array(
+                array=self.blurred_mapping_matrix @ self.reconstruction,
+                mask=self.mapper.grid.mask.mask_sub_1,
+                store_in_1d=True,
+            )
+        return super().mapped_reconstructed_image
+
+
+class InversionInterferometerMatrix(inv.InversionInterferometerMatrix):
+    def __init__(
+        self,
+        log_det_curvature_reg_matrix_term,
+        log_det_regularization_matrix_term,
+        log_det_curvature_reg_matrix_term_error=0.0,
+        **kwargs
+    ):
+        """
+        An `InversionInterferometerMatrix` whose log determinant terms are computed by the `InversionCache` which
+        performed it (see `InversionImagingMatrix`).
+        """
+        super().__init__(**kwargs)
+
+        self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+        self._log_det_regularization_matrix_term = log_det_regularization_matrix_term
+        self.log_det_curvature_reg_matrix_term_error = (
+            log_det_curvature_reg_matrix_term_error
+        )
+
+    @property
+    def log_evidence_error(self):
+        return 0.5 * self.log_det_curvature_reg_matrix_term_error
+
+    @property
+    def log_det_curvature_reg_matrix_term(self):
+        return self._log_det_curvature_reg_matrix_term
+
+    @property
+    def log_det_regularization_matrix_term(self):
+        return self._log_det_regularization_matrix_term
+
+
+def arrays_are_equal(array, cached_array):
+    if array is cached_array:
+        return True
+    if cached_array is None or np.shape(array) != np.shape(cached_array):
+        return False
+    if sparse.issparse(array) or sparse.issparse(cached_array):
+        return (
+            sparse.issparse(array)
+            and sparse.issparse(cached_array)
+            and (array != cached_array).nnz == 0
+        )
+    return np.array_equal(array, cached_array)
+
+
+class InversionCache:
+    def __init__(self):
+        """
+        Caches the quantities of the last inversion performed by a tracer (see
+        `Tracer.inversion_imaging_from_grid_and_data`), which are reused by the next inversion whose mapping does not
+        change. This is the case in phases which fix the pixelization and mass model, for example hyper phases which
+        only vary the regularization coefficients.
+
+        The blurred (or transformed) mapping matrix and curvature matrix are reused if the mapping matrix, noise-map
+        and convolver (or transformer) are unchanged, and the data vector if the image (or visibilities) are also
+        unchanged. The Cholesky factorisation of the curvature regularization matrix, which is used both to solve for
+        the reconstruction and to compute its log determinant, is reused if the regularization matrix is also
+        unchanged. In a phase which only varies the regularization coefficients an inversion therefore only
+        recomputes the regularization matrix and one Cholesky factorisation.
+
+        The log determinant of the (sparse) regularization matrix is computed via its sparse LU decomposition, and
+        reused if the regularization matrix is unchanged.
+
+        Every cached quantity is compared to the new one before being reused, so the inversions are the same as
+        those computed without the cache up to the numerical precision of the linear algebra.
+
+        If the settings of an inversion have `use_iterative_solver=True` (see `autolens.SettingsInversion`), the
+        Cholesky factorisation of the last inversion's curvature regularization matrix which was factorised is kept
+        as a reference. Inversions with a new curvature regularization matrix then estimate its log determinant
+        relative to the reference via stochastic Lanczos quadrature and solve for the reconstruction via the
+        conjugate gradient method, preconditioned by the reference and warm-started from the last reconstruction
+        (see `solver_util`). If the estimate's standard error cannot reach the `log_det_tolerance` of the settings or
+        the solver does not converge, the matrix is factorised exactly and becomes the new reference.
+
+        The log evidences of the iterative solver are therefore approximate and depend on the order inversions are
+        performed in: the estimated log determinant is a deterministic function of the matrix and the reference, but
+        the reference is whichever matrix was last factorised exactly, so re-evaluating the same model after a
+        different sequence of models can give a log evidence which differs by a few times its standard error. The
+        standard error is reported by every inversion as its `log_evidence_error` (0.0 if the log determinant was
+        computed exactly). The iterative solver only reduces the run time of inversions whose Cholesky factorisation
+        dominates it, which for the dense matrices used here is the case for pixelizations of several thousand
+        pixels or more; for smaller pixelizations (e.g. 2025 pixels) the Lanczos iterations cost more than the
+        factorisation they replace.
+
+        If the settings of an imaging inversion have `use_sparse_matrices=True`, its mapping matrix, blurred mapping
+        matrix, curvature matrix and regularization matrix are computed as sparse matrices (see
+        `sparse_inversion_util`) and the curvature regularization matrix is factorised via its sparse LU
+        decomposition (see `solver_util.sparse_lu_from`), which also gives its log determinant. The sparse matrix
+        which convolves images with the PSF is cached alongside them.
+        """
+        self.mapping_matrix = None
+        self.noise_map = None
+        self.operator = None
+        self.operated_mapping_matrix = None
+        self.curvature_matrix = None
+
+        self.data = None
+        self.data_vector = None
+
+        self.regularization_matrix = None
+        self.curvature_reg_matrix = None
+        self.cholesky = None
+        self.log_det_curvature_reg_matrix_term = None
+        self.log_det_curvature_reg_matrix_term_error = 0.0
+
+        self.log_det_regularization_matrix = None
+        self.log_det_regularization_matrix_term = None
+
+        self.sparse_lu = None
+
+        self.convolver = None
+        self.convolution_matrix = None
+
+        self.reconstruction = None
+        self.reference_cholesky = None
+        self.reference_log_det = None
+
+        self.curvature_matrix_reuses = 0
+        self.iterative_solves = 0
+
+    def _curvature_matrix_is_cached(self, mapping_matrix, noise_map, operator):
+        return (
+            operator is self.operator
+            and arrays_are_equal(array=noise_map, cached_array=self.noise_map)
+            and arrays_are_equal(array=mapping_matrix, cached_array=self.mapping_matrix)
+        )
+
+    def _update_curvature_matrix(
+        self,
+        mapping_matrix,
+        noise_map,
+        operator,
+        operated_mapping_matrix,
+        curvature_matrix,
+    ):
+
+        self.mapping_matrix = mapping_matrix
+        self.noise_map = noise_map
+        self.operator = operator
+        self.operated_mapping_matrix = operated_mapping_matrix
+        self.curvature_matrix = curvature_matrix
+
+        self.data = None
+        self.data_vector = None
+        self.regularization_matrix = None
+        self.cholesky = None
+        self.sparse_lu = None
+
+    def _factorise_curvature_reg_matrix(self):
+        """
+        Compute the Cholesky factorisation of the curvature regularization matrix and its log determinant, which
+        becomes the reference of the iterative solver.
+        """
+        try:
+            cholesky = linalg.cho_factor(
+                self.curvature_reg_matrix, lower=True, check_finite=False
+            )
+        except linalg.LinAlgError:
+            raise exc.InversionException()
+
+        if not np.all(np.isfinite(cholesky[0])):
+            raise exc.InversionException()
+
+        self.cholesky = cholesky
+        self.log_det_curvature_reg_matrix_term = 2.0 * np.sum(
+            np.log(np.diag(cholesky[0]))
+        )
+        self.log_det_curvature_reg_matrix_term_error = 0.0
+
+        self.reference_cholesky = self.cholesky
+        self.reference_log_det = self.log_det_curvature_reg_matrix_term
+
+    def _log_det_regularization_matrix_term_from(self, regularization_matrix):
+
+        if not arrays_are_equal(
+            array=regularization_matrix, cached_array=self.log_det_regularization_matrix
+        ):
+
+            self.log_det_regularization_matrix_term = solver_util.log_determinant_via_sparse_lu_from(
+                matrix=regularization_matrix
+            )
+            self.log_det_regularization_matrix = regularization_matrix
+
+        return self.log_det_regularization_matrix_term
+
+    def _convolution_matrix_from(self, convolver):
+
+        if convolver is not self.convolver:
+
+            self.convolution_matrix = sparse_inversion_util.convolution_matrix_sparse_from(
+                convolver=convolver
+            )
+            self.convolver = convolver
+
+        return self.convolution_matrix
+
+    def _reconstruction_via_sparse_lu_from(self, data_vector, regularization_matrix):
+        """
+        Solve for the reconstruction of an inversion whose curvature matrix and regularization matrix are sparse via
+        the sparse LU decomposition of its curvature regularization matrix, which is computed (and its log
+        determinant with it) only if the regularization matrix changed since the last inversion.
+        """
+        if not arrays_are_equal(
+            array=regularization_matrix, cached_array=self.regularization_matrix
+        ):
+
+            self.regularization_matrix = None
+            self.curvature_reg_matrix = (
+                self.curvature_matrix + regularization_matrix
+            ).tocsc()
+
+            self.sparse_lu = solver_util.sparse_lu_from(
+                matrix=self.curvature_reg_matrix
+            )
+            self.log_det_curvature_reg_matrix_term = solver_util.log_determinant_from_sparse_lu(
+                lu=self.sparse_lu
+            )
+            self.log_det_curvature_reg_matrix_term_error = 0.0
+
+            self.regularization_matrix = regularization_matrix
+
+        return self.sparse_lu.solve(np.asarray(data_vector, dtype="float64"))
+
+    def _reconstruction_from(self, data_vector, regularization_matrix, settings):
+        """
+        Solve for the reconstruction of an inversion via the Cholesky factorisation of its curvature regularization
+        matrix, which is computed (and its log determinant with it) only if the regularization matrix changed since
+        the last inversion, or via the iterative solver or sparse LU decomposition (see `InversionCache`).
+        """
+        if sparse.issparse(self.curvature_matrix):
+            values = self._reconstruction_via_sparse_lu_from(
+                data_vector=data_vector, regularization_matrix=regularization_matrix
+            )
+        else:
+            values = self._reconstruction_via_cholesky_from(
+                data_vector=data_vector,
+                regularization_matrix=regularization_matrix,
+                settings=settings,
+            )
+
+        self.reconstruction = values
+
+        if settings.check_solution:
+            if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
+                if np.isclose(a=values[0], b=values, atol=1e-4).all():
+                    raise exc.InversionException()
+
+        return values
+
+    def _reconstruction_via_cholesky_from(
+        self, data_vector, regularization_matrix, settings
+    ):
+
+        use_iterative_solver = settings.use_iterative_solver
+
+        if not arrays_are_equal(
+            array=regularization_matrix, cached_array=self.regularization_matrix
+        ):
+
+            self.regularization_matrix = None
+            self.curvature_reg_matrix = np.add(
+                self.curvature_matrix, regularization_matrix
+            )
+            self.cholesky = None
+
+            log_det = None
+
+            if use_iterative_solver and self.reference_cholesky is not None:
+                if self.reference_cholesky[0].shape == self.curvature_reg_matrix.shape:
+                    (
+                        log_det,
+                        log_det_error,
+                    ) = solver_util.log_determinant_via_stochastic_lanczos_quadrature_from(
+                        matrix=self.curvature_reg_matrix,
+                        reference_cholesky=self.reference_cholesky,
+                        reference_log_det=self.reference_log_det,
+                        lanczos_steps=settings.log_det_lanczos_steps,
+                        tolerance=settings.log_det_tolerance,
+                        max_probes=settings.log_det_max_probes,
+                    )
+
+            if log_det is None:
+                self._factorise_curvature_reg_matrix()
+            else:
+                self.log_det_curvature_reg_matrix_term = log_det
+                self.log_det_curvature_reg_matrix_term_error = log_det_error
+
+            self.regularization_matrix = regularization_matrix
+
+        values = None
+
+        if self.cholesky is None:
+
+            values = solver_util.reconstruction_via_conjugate_gradient_from(
+                curvature_reg_matrix=self.curvature_reg_matrix,
+                data_vector=data_vector,
+                preconditioner_cholesky=self.reference_cholesky,
+                initial_reconstruction=self.reconstruction,
+                tolerance=settings.tolerance,
+                maxiter=settings.maxiter,
+            )
+
+            if values is None:
+                self._factorise_curvature_reg_matrix()
+            else:
+                self.iterative_solves += 1
+
+        if values is None:
+            values = linalg.cho_solve(self.cholesky, data_vector, check_finite=False)
+
+        return values
+
+    def inversion_imaging_from(
+        self,
+        image,
+        noise_map,
+        convolver,
+        mapper,
+        regularization,
+        settings=SettingsInversion(),
+    ):
+        """
+        Returns the inversion of an image, which is the same as
+        `InversionImagingMatrix.from_data_mapper_and_regularization` but reuses the cached quantities of the last
+        inversion which are unchanged.
+
+        Parameters
+        ----------
+        image : aa.Array
+            The image (e.g. the profile subtracted image) which is reconstructed.
+        noise_map : aa.Array
+            The noise-map of the image.
+        convolver : aa.Convolver
+            The convolver used to blur the mapping matrix with the PSF.
+        mapper : aa.Mapper
+            The mapper between the image pixels and the pixelization's pixels.
+        regularization : aa.reg.Regularization
+            The regularization scheme of the pixelization.
+        settings : autolens.SettingsInversion
+            The settings of the inversion.
+        """
+        use_sparse_matrices = settings.use_sparse_matrices
+
+        if use_sparse_matrices:
+            mapping_matrix = sparse_inversion_util.mapping_matrix_sparse_from(
+                mapper=mapper
+            )
+        else:
+            mapping_matrix = mapper.mapping_matrix
+
+        if self._curvature_matrix_is_cached(
+            mapping_matrix=mapping_matrix, noise_map=noise_map, operator=convolver
+        ):
+            self.curvature_matrix_reuses += 1
+        elif use_sparse_matrices:
+
+            blurred_mapping_matrix = (
+                self._convolution_matrix_from(convolver=convolver) @ mapping_matrix
+            )
+
+            self._update_curvature_matrix(
+                mapping_matrix=mapping_matrix,
+                noise_map=noise_map,
+                operator=convolver,
+                operated_mapping_matrix=blurred_mapping_matrix,
+                curvature_matrix=sparse_inversion_util.curvature_matrix_sparse_from(
+                    blurred_mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+                ),
+            )
+        else:
+
+            blurred_mapping_matrix = convolver.convolve_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            )
+
+            self._update_curvature_matrix(
+                mapping_matrix=mapping_matrix,
+                noise_map=noise_map,
+                operator=convolver,
+                operated_mapping_matrix=blurred_mapping_matrix,
+                curvature_matrix=inversion_util.curvature_matrix_via_mapping_matrix_from(
+                    mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+                ),
+            )
+
+        if not arrays_are_equal(array=image, cached_array=self.data):
+
+            self.data = image
+
+            if use_sparse_matrices:
+                self.data_vector = sparse_inversion_util.data_vector_sparse_from(
+                    blurred_mapping_matrix=self.operated_mapping_matrix,
+                    image=image,
+                    noise_map=noise_map,
+                )
+            else:
+                self.data_vector = inversion_util.data_vector_via_blurred_mapping_matrix_from(
+                    blurred_mapping_matrix=self.operated_mapping_matrix,
+                    image=image,
+                    noise_map=noise_map,
+                )
+
+        if use_sparse_matrices:
+            regularization_matrix = sparse_inversion_util.regularization_matrix_sparse_from(
+                regularization=regularization, mapper=mapper
+            )
+        else:
+            regularization_matrix = regularization.regularization_matrix_from_mapper(
+                mapper=mapper
+            )
+
+        values = self._reconstruction_from(
+            data_vector=self.data_vector,
+            regularization_matrix=regularization_matrix,
+            settings=settings,
+        )
+
+        return InversionImagingMatrix(
+            image=image,
+            noise_map=noise_map,
+            convolver=convolver,
+            mapper=mapper,
+            regularization=regularization,
+            blurred_mapping_matrix=self.operated_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=self.curvature_matrix + regularization_matrix,
+            reconstruction=values,
+            settings=settings,
+            log_det_curvature_reg_matrix_term=self.log_det_curvature_reg_matrix_term,
+            log_det_curvature_reg_matrix_term_error=self.log_det_curvature_reg_matrix_term_error,
+            log_det_regularization_matrix_term=self._log_det_regularization_matrix_term_from(
+                regularization_matrix=regularization_matrix
+            ),
+        )
+
+    def inversion_interferometer_from(
+        self,
+        visibilities,
+        noise_map,
+        transformer,
+        mapper,
+        regularization,
+        settings=SettingsInversion(),
+    ):
+        """
+        Returns the inversion of visibilities, which is the same as
+        `AbstractInversionInterferometer.from_data_mapper_and_regularization` but reuses the cached quantities of the
+        last inversion which are unchanged.
+
+        Inversions which use linear operators or a preconditioner do not form the curvature matrix and are performed
+        without the cache. The curvature matrix of visibilities is dense (every visibility depends on every pixel of
+        the real-space image) so the `use_sparse_matrices` setting does not apply to interferometer inversions.
+
+        Parameters
+        ----------
+        visibilities : aa.Visibilities
+            The visibilities (e.g. the profile subtracted visibilities) which are reconstructed.
+        noise_map : aa.VisibilitiesNoiseMap
+            The noise-map of the visibilities.
+        transformer : aa.TransformerDFT or aa.TransformerNUFFT
+            The transformer used to Fourier transform the mapping matrix to the uv-plane.
+        mapper : aa.Mapper
+            The mapper between the real-space image pixels and the pixelization's pixels.
+        regularization : aa.reg.Regularization
+            The regularization scheme of the pixelization.
+        settings : autolens.SettingsInversion
+            The settings of the inversion.
+        """
+        if settings.use_linear_operators or settings.use_preconditioner:
+            return inv.AbstractInversionInterferometer.from_data_mapper_and_regularization(
+                visibilities=visibilities,
+                noise_map=noise_map,
+                transformer=transformer,
+                mapper=mapper,
+                regularization=regularization,
+                settings=settings,
+            )
+
+        mapping_matrix = mapper.mapping_matrix
+
+        if self._curvature_matrix_is_cached(
+            mapping_matrix=mapping_matrix, noise_map=noise_map, operator=transformer
+        ):
+            self.curvature_matrix_reuses += 1
+        else:
+
+            transformed_mapping_matrix = transformer.transformed_mapping_matrix_from_mapping_matrix(
+                mapping_matrix=mapping_matrix
+            )
+
+            real_curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=transformed_mapping_matrix.real,
+                noise_map=noise_map.real,
+            )
+
+            imag_curvature_matrix = inversion_util.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=transformed_mapping_matrix.imag,
+                noise_map=noise_map.imag,
+            )
+
+            self._update_curvature_matrix(
+                mapping_matrix=mapping_matrix,
+                noise_map=noise_map,
+                operator=transformer,
+                operated_mapping_matrix=transformed_mapping_matrix,
+                curvature_matrix=np.add(real_curvature_matrix, imag_curvature_matrix),
+            )
+
+        if not arrays_are_equal(array=visibilities, cached_array=self.data):
+
+            self.data = visibilities
+            self.data_vector = inversion_util.data_vector_via_transformed_mapping_matrix_from(
+                transformed_mapping_matrix=self.operated_mapping_matrix,
+                visibilities=visibilities,
+                noise_map=noise_map,
+            )
+
+        regularization_matrix = regularization.regularization_matrix_from_mapper(
+            mapper=mapper
+        )
+
+        values = self._reconstruction_from(
+            data_vector=self.data_vector,
+            regularization_matrix=regularization_matrix,
+            settings=settings,
+        )
+
+        return InversionInterferometerMatrix(
+            visibilities=visibilities,
+            noise_map=noise_map,
+            transformer=transformer,
+            mapper=mapper,
+            regularization=regularization,
+            transformed_mapping_matrix=self.operated_mapping_matrix,
+            regularization_matrix=regularization_matrix,
+            curvature_reg_matrix=np.add(self.curvature_matrix, regularization_matrix),
+            reconstruction=values,
+            settings=settings,
+            log_det_curvature_reg_matrix_term=self.log_det_curvature_reg_matrix_term,
+            log_det_curvature_reg_matrix_term_error=self.log_det_curvature_reg_matrix_term_error,
+            log_det_regularization_matrix_term=self._log_det_regularization_matrix_term_from(
+                regularization_matrix=regularization_matrix
+            ),
+        )
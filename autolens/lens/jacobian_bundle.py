@@ -0,0 +1,76 @@
+import numpy as np
+
+from autoarray.structures import arrays
+
+
+class LensingJacobianBundle:
+    def __init__(self, a11, a12, a21, a22, mask=None):
+        """
+        The lensing Jacobian of a lensing object on a grid and every quantity derived from it (the convergence, shear,
+        tangential and radial eigen values, determinant and magnification), which are computed together from one
+        evaluation of its deflection angles (see `Tracer.lensing_jacobian_bundle_from_grid`).
+
+        The Jacobian is `[[a11, a12], [a21, a22]]`, following the convention of
+        `autogalaxy.LensingObject.jacobian_from_grid`, and every quantity is computed as in the corresponding
+        `LensingObject` method.
+
+        Parameters
+        ----------
+        a11, a12, a21, a22 : np.ndarray
+            The components of the lensing Jacobian at every (y,x) coordinate of the grid, in 1D.
+        mask : aa.Mask2D or None
+            The mask of the `Grid` the Jacobian was computed on, in which case every quantity is returned as an
+            `Array`, or `None` if it was computed on irregular coordinates and every quantity is an ndarray.
+        """
+        self.mask = mask
+
+        self._a11 = np.asarray(a11)
+        self._a12 = np.asarray(a12)
+        self._a21 = np.asarray(a21)
+        self._a22 = np.asarray(a22)
+
+        self._convergence = 1 - 0.5 * (self._a11 + self._a22)
+
+        gamma_y = -0.5 * (self._a12 + self._a21)
+        gamma_x = 0.5 * (self._a22 - self._a11)
+
+        self._shear = (gamma_x ** 2 + gamma_y ** 2) ** 0.5
+
+        self._det_jacobian = self._a11 * self._a22 - self._a12 * self._a21
+
+    def structure_from(self, values):
+        if self.mask is None:
+            return values
+        return arrays.Array(array=values, mask=self.mask)
+
+    @property
+    def jacobian(self):
+        return [
+            [self.structure_from(self._a11), self.structure_from(self._a12)],
+            [self.structure_from(self._a21), self.structure_from(self._a22)],
+        ]
+
+    @property
+    def convergence(self):
+        return self.structure_from(self._convergence)
+
+    @property
+    def shear(self):
+        return self.structure_from(self._shear)
+
+    @property
+    def tangential_eigen_value(self):
+        return self.structure_from(1 - self._convergence - self._shear)
+
+    @property
+    def radial_eigen_value(self):
+        return self.structure_from(1 - self._convergence + self._shear)
+
+    @property
+    def det_jacobian(self):
+        return self.structure_from(self._det_jacobian)
+
+    @property
+    def magnification(self):
+        with np.errstate(divide="ignore"):
+            return self.structure_from(1 / self._det_jacobian)
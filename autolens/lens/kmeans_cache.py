@@ -0,0 +1,196 @@
+import collections
+import hashlib
+
+import numpy as np
+from autoconf import conf
+from autoarray import exc
+from autoarray.inversion import pixelizations as pix
+from autoarray.structures import grids
+from sklearn.cluster import MiniBatchKMeans
+
+
+def cache_size_from_config():
+    """
+    The maximum number of sparse grids stored in the k-means cache, which is the `[pixelization] kmeans_cache_size`
+    entry of the general config (where 0 disables caching).
+    """
+    try:
+        return int(conf.instance["general"]["pixelization"]["kmeans_cache_size"])
+    except KeyError:
+        return 32
+
+
+def sparse_grid_key_from(pixelization, grid, hyper_image, seed, use_mini_batch_kmeans):
+    """
+    The key of the sparse grid of a `VoronoiBrightnessImage` pixelization in the k-means cache, which is a hash of
+    every input of its k-means clustering: the grid and hyper image, the weight floor, weight power and number of
+    pixels of the pixelization, the random number seed and the k-means algorithm.
+    """
+    key = hashlib.sha1()
+
+    key.update(np.ascontiguousarray(grid, dtype="float64").tobytes())
+    key.update(np.ascontiguousarray(hyper_image, dtype="float64").tobytes())
+    key.update(
+        str(
+            (
+                type(pixelization).__name__,
+                pixelization.pixels,
+                float(pixelization.weight_floor),
+                float(pixelization.weight_power),
+                seed,
+                use_mini_batch_kmeans,
+            )
+        ).encode()
+    )
+
+    return key.hexdigest()
+
+
+class KMeansCache:
+    def __init__(self, max_size=None):
+        """
+        A least-recently-used cache of the sparse grids computed via k-means clustering (e.g. by a
+        `VoronoiBrightnessImage` pixelization), which are reused whenever the same inputs are clustered again.
+
+        When fitting a model the hyper images are fixed, so every likelihood evaluation which resamples the
+        pixelization with the same seeds (e.g. via the `stochastic_likelihood_resamples` of `SettingsLens`) or does
+        not change the pixelization's parameters (e.g. in a hyper phase which varies only the regularization)
+        clusters identical inputs.
+
+        Parameters
+        ----------
+        max_size : int or None
+            The maximum number of sparse grids stored, after which the least recently used sparse grid is evicted.
+            If `None`, this is the `[pixelization] kmeans_cache_size` entry of the general config.
+        """
+        self._max_size = max_size
+        self.sparse_grids = collections.OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def max_size(self):
+        if self._max_size is None:
+            return cache_size_from_config()
+        return self._max_size
+
+    def sparse_grid_from(self, key, func):
+        """
+        Returns the sparse grid of a key if it is cached, and computes it via `func` and caches it otherwise.
+        """
+        if key in self.sparse_grids:
+
+            self.hits += 1
+            self.sparse_grids.move_to_end(key)
+
+            return self.sparse_grids[key]
+
+        self.misses += 1
+
+        sparse_grid = func()
+
+        if self.max_size > 0:
+
+            self.sparse_grids[key] = sparse_grid
+
+            while len(self.sparse_grids) > self.max_size:
+                self.sparse_grids.popitem(last=False)
+
+        return sparse_grid
+
+    def clear(self):
+        self.sparse_grids.clear()
+
+
+kmeans_cache = KMeansCache()
+
+
+def sparse_grid_via_mini_batch_kmeans_from(
+    pixelization, grid, hyper_image, seed, max_iter=5
+):
+    """
+    The sparse grid of a `VoronoiBrightnessImage` pixelization computed using mini-batch k-means, which clusters
+    random subsets of the grid's coordinates as opposed to all of them every iteration. For grids of ~100000 or more
+    coordinates this is faster than the k-means clustering of `VoronoiBrightnessImage.sparse_grid_from_grid`, at
+    the expense of a small loss in the quality of the clustering, whereas for smaller grids it is not.
+    """
+    weight_map = pixelization.weight_map_from_hyper_image(hyper_image=hyper_image)
+
+    if pixelization.pixels > grid.shape[0]:
+        raise exc.GridException
+
+    kmeans = MiniBatchKMeans(
+        n_clusters=pixelization.pixels,
+        random_state=seed,
+        n_init=1,
+        max_iter=max_iter,
+        batch_size=max(100, 3 * pixelization.pixels),
+    )
+
+    try:
+        kmeans = kmeans.fit(X=grid.in_1d_binned, sample_weight=weight_map)
+    except (ValueError, OverflowError):
+        raise exc.InversionException()
+
+    return grids.GridVoronoi(
+        grid=kmeans.cluster_centers_,
+        nearest_pixelization_1d_index_for_mask_1d_index=kmeans.labels_.astype("int"),
+    )
+
+
+def sparse_image_plane_grid_from(plane, grid, settings_pixelization):
+    """
+    The sparse image-plane grid of a plane's pixelization, which for a `VoronoiBrightnessImage` pixelization is
+    computed via k-means clustering (or mini-batch k-means clustering, if the settings' `use_mini_batch_kmeans` is
+    `True`) and cached in the `kmeans_cache`.
+
+    Stochastic sparse grids use a random seed every call and are therefore not cached.
+    """
+    if not plane.has_pixelization or not isinstance(
+        plane.pixelization, pix.VoronoiBrightnessImage
+    ):
+        return plane.sparse_image_plane_grid_from_grid(
+            grid=grid, settings_pixelization=settings_pixelization
+        )
+
+    pixelization = plane.pixelization
+    hyper_image = plane.hyper_galaxy_image_of_galaxy_with_pixelization
+
+    use_mini_batch_kmeans = settings_pixelization.use_mini_batch_kmeans
+
+    if not use_mini_batch_kmeans:
+
+        def func():
+            return pixelization.sparse_grid_from_grid(
+                grid=grid, hyper_image=hyper_image, settings=settings_pixelization
+            )
+
+    else:
+
+        seed = settings_pixelization.kmeans_seed
+
+        if settings_pixelization.is_stochastic:
+            seed = np.random.randint(low=1, high=2 ** 31)
+
+        def func():
+            return sparse_grid_via_mini_batch_kmeans_from(
+                pixelization=pixelization,
+                grid=grid,
+                hyper_image=hyper_image,
+                seed=seed,
+            )
+
+    if settings_pixelization.is_stochastic:
+        return func()
+
+    return kmeans_cache.sparse_grid_from(
+        key=sparse_grid_key_from(
+            pixelization=pixelization,
+            grid=grid,
+            hyper_image=hyper_image,
+            seed=settings_pixelization.kmeans_seed,
+            use_mini_batch_kmeans=use_mini_batch_kmeans,
+        ),
+        func=func,
+    )
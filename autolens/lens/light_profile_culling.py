@@ -0,0 +1,86 @@
+import numpy as np
+
+from autoarray.structures import grids
+from autogalaxy.profiles import light_profiles as lp
+
+
+class LightProfileCulling:
+    def __init__(self, flux_tolerance: float = 1.0e-4):
+        """
+        Evaluates the image of every light profile of a plane only at the (y,x) coordinates of its grid within a
+        bounding circle of the profile's centre, outside of which its intensity is negligible, with the image of
+        every other coordinate set to zero.
+
+        Ray-tracing maps the grid of the image-plane to the source-plane, where the traced coordinates of most pixels
+        of the mask land far from a compact source and its light profiles are evaluated as effectively zero. For a
+        Sersic profile (and its exponential and de Vaucouleurs special cases) the bounding circle has the radius at
+        which its intensity is `flux_tolerance` times its `intensity` (which is the intensity at its effective
+        radius), divided by the square root of its axis-ratio so the circle bounds its elliptical isophote. For a
+        Gaussian the radius is where its intensity is `flux_tolerance` times its central `intensity`.
+
+        Light profiles without a bounding radius (e.g. cored Sersic or Chameleon profiles) are evaluated on every
+        coordinate.
+
+        Parameters
+        ----------
+        flux_tolerance : float
+            The fraction of a light profile's `intensity` below which its image is culled (set to zero).
+        """
+        self.flux_tolerance = flux_tolerance
+
+    def bounding_radius_from_light_profile(self, light_profile):
+        """
+        Returns the radius of the circle centred on a light profile's centre outside of which its intensity is below
+        `flux_tolerance` times its `intensity`, or `None` if this is not known for the light profile.
+        """
+        if isinstance(light_profile, lp.EllipticalCoreSersic):
+            return None
+
+        if isinstance(light_profile, lp.EllipticalSersic):
+            eccentric_radius = (
+                light_profile.effective_radius
+                * (1.0 - np.log(self.flux_tolerance) / light_profile.sersic_constant)
+                ** light_profile.sersic_index
+            )
+        elif isinstance(light_profile, lp.EllipticalGaussian):
+            eccentric_radius = (
+                light_profile.sigma
+                / np.sqrt(light_profile.axis_ratio)
+                * np.sqrt(-2.0 * np.log(self.flux_tolerance))
+            )
+        else:
+            return None
+
+        return eccentric_radius / np.sqrt(light_profile.axis_ratio)
+
+    def image_from_light_profile_and_grid(self, light_profile, grid):
+        """
+        Returns the image of a light profile on a grid, where only the coordinates within the light profile's
+        bounding circle are evaluated.
+        """
+        bounding_radius = self.bounding_radius_from_light_profile(
+            light_profile=light_profile
+        )
+
+        if bounding_radius is None:
+            return light_profile.image_from_grid(grid=grid)
+
+        grid_1d = np.asarray(grid).reshape(-1, 2)
+
+        indexes = np.nonzero(
+            np.sum(np.square(grid_1d - np.asarray(light_profile.centre)), axis=1)
+            < bounding_radius ** 2.0
+        )[0]
+
+        if len(indexes) == grid_1d.shape[0]:
+            return light_profile.image_from_grid(grid=grid)
+
+        image = np.zeros(shape=grid_1d.shape[0])
+
+        if len(indexes) > 0:
+            image[indexes] = light_profile.image_from_grid(grid=grid_1d[indexes])
+
+        if isinstance(grid, grids.Grid):
+            return grid.structure_from_result(result=image)
+
+        return image
@@ -0,0 +1,284 @@
+import numpy as np
+import typing
+
+from autoarray.structures import grids
+from autogalaxy.galaxy import galaxy as g
+from autogalaxy.plane import plane as pl
+from autogalaxy.profiles import geometry_profiles
+from autogalaxy.profiles.mass_profiles import mass_profiles as mp
+
+
+class LinearDeflections(geometry_profiles.SphericalProfile, mp.MassProfile):
+    def __init__(
+        self,
+        centre: typing.Tuple[float, float] = (0.0, 0.0),
+        deflections: typing.Tuple[float, float] = (0.0, 0.0),
+        gradient: typing.Tuple[
+            typing.Tuple[float, float], typing.Tuple[float, float]
+        ] = ((0.0, 0.0), (0.0, 0.0)),
+    ):
+        """
+        A deflection field which is a constant plus a gradient about a centre, which approximates the deflections
+        of mass far from the region of the grid that it deflects (e.g. line-of-sight halos).
+
+        The deflection angles at a (y,x) coordinate are `deflections + gradient . ((y,x) - centre)`. The gradient is
+        the Hessian of the lensing potential and is therefore symmetric, with half its trace the (constant)
+        convergence of the profile.
+
+        Parameters
+        ----------
+        centre: (float, float)
+            The (y,x) arc-second coordinates about which the gradient is applied.
+        deflections : (float, float)
+            The (y,x) deflection angles at the centre.
+        gradient : ((float, float), (float, float))
+            The gradient of the (y,x) deflection angles with respect to the (y,x) coordinates, ordered
+            ((d_alpha_y / dy, d_alpha_y / dx), (d_alpha_x / dy, d_alpha_x / dx)).
+        """
+        super(LinearDeflections, self).__init__(centre=centre)
+        self.deflections = deflections
+        self.gradient = gradient
+
+    @property
+    def convergence(self):
+        return 0.5 * (self.gradient[0][0] + self.gradient[1][1])
+
+    def convergence_func(self, grid_radius):
+        return self.convergence
+
+    @grids.grid_like_to_structure
+    def convergence_from_grid(self, grid):
+        return np.full(shape=grid.shape[0], fill_value=self.convergence)
+
+    @grids.grid_like_to_structure
+    def potential_from_grid(self, grid):
+        shifted_grid = np.subtract(grid, self.centre)
+        return np.dot(shifted_grid, self.deflections) + 0.5 * np.sum(
+            shifted_grid * np.dot(shifted_grid, np.asarray(self.gradient).T), axis=1
+        )
+
+    @grids.grid_like_to_structure
+    def deflections_from_grid(self, grid):
+        shifted_grid = np.subtract(grid, self.centre)
+        return np.add(
+            self.deflections, np.dot(shifted_grid, np.asarray(self.gradient).T)
+        )
+
+    @property
+    def is_mass_sheet(self):
+        return True
+
+
+class LineOfSightCulling:
+    def __init__(
+        self,
+        tracer,
+        grid,
+        line_of_sight_galaxies,
+        deflection_tolerance,
+        approximate=False,
+        shape_2d=(11, 11),
+    ):
+        """
+        Cull the line-of-sight galaxies of a tracer whose deflections over the region of a grid are negligible.
+
+        A multi-plane tracer (e.g. made via `Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies`)
+        computes the deflections of every galaxy on every (sub-)pixel of the grid it traces, even though most
+        line-of-sight halos deflect light by a negligible amount over the mask. Culling estimates the maximum
+        deflection of every line-of-sight galaxy over the bounding region of the grid traced to its plane and
+        removes those below `deflection_tolerance` from the tracer.
+
+        The maximum deflection of a galaxy is estimated by tracing a uniform grid of `shape_2d` coordinates spanning
+        the bounding box of the input grid through the full tracer, and evaluating the galaxy's deflections on these
+        coordinates (plus the coordinate of the traced bounding box closest to the galaxy's centre, where its
+        deflections typically peak).
+
+        If `approximate` is `True`, the culled galaxies of every plane are not dropped but replaced by one
+        `LinearDeflections` profile (a constant plus a gradient), fitted by least-squares to their summed
+        deflections on the traced coordinates.
+
+        The truncation error is the maximum error in the deflection angles of the culled tracer (in arc-seconds),
+        summed over planes. For dropped galaxies this is the sum of their maximum deflections, for approximated
+        galaxies the maximum residual of the linear fit.
+
+        Parameters
+        ----------
+        tracer : Tracer
+            The tracer whose line-of-sight galaxies are culled.
+        grid : aa.Grid
+            The grid the culled tracer is used to ray-trace, which defines the region over which deflections are
+            estimated.
+        line_of_sight_galaxies : [Galaxy]
+            The galaxies of the tracer which may be culled, which must be instances of the galaxies in its planes.
+        deflection_tolerance : float
+            The maximum deflection (in arc-seconds) over the traced region below which a galaxy is culled.
+        approximate : bool
+            If `True` culled galaxies are approximated by a constant plus gradient deflection field, as opposed to
+            being dropped.
+        shape_2d : (int, int)
+            The number of (y,x) coordinates used to sample the bounding box of the grid.
+        """
+        self.deflection_tolerance = deflection_tolerance
+
+        sample_grid = sample_grid_from_grid_and_shape_2d(grid=grid, shape_2d=shape_2d)
+
+        traced_grids_of_planes = [
+            np.asarray(traced_grid)
+            for traced_grid in tracer.traced_grids_of_planes_from_grid(grid=sample_grid)
+        ]
+
+        self.max_deflections = []
+        self.culled_galaxies = []
+
+        culled_galaxies_of_planes = [[] for _ in tracer.planes]
+        culled_max_deflections_of_planes = [[] for _ in tracer.planes]
+
+        for galaxy in line_of_sight_galaxies:
+
+            plane_index = plane_index_of_galaxy(tracer=tracer, galaxy=galaxy)
+
+            max_deflection = max_deflection_of_galaxy_from_grid(
+                galaxy=galaxy, grid=traced_grids_of_planes[plane_index]
+            )
+
+            self.max_deflections.append(max_deflection)
+
+            if max_deflection < deflection_tolerance:
+                self.culled_galaxies.append(galaxy)
+                culled_galaxies_of_planes[plane_index].append(galaxy)
+                culled_max_deflections_of_planes[plane_index].append(max_deflection)
+
+        self.truncation_error = 0.0
+
+        planes = []
+
+        for plane_index, plane in enumerate(tracer.planes):
+
+            culled_galaxies = culled_galaxies_of_planes[plane_index]
+
+            galaxies = [
+                galaxy
+                for galaxy in plane.galaxies
+                if not any(galaxy is culled_galaxy for culled_galaxy in culled_galaxies)
+            ]
+
+            if culled_galaxies:
+
+                if approximate:
+
+                    (
+                        linear_deflections,
+                        residual,
+                    ) = linear_deflections_from_galaxies_and_grid(
+                        galaxies=culled_galaxies,
+                        grid=traced_grids_of_planes[plane_index],
+                    )
+
+                    galaxies.append(
+                        g.Galaxy(redshift=plane.redshift, mass=linear_deflections)
+                    )
+
+                    self.truncation_error += residual
+
+                else:
+
+                    self.truncation_error += sum(
+                        culled_max_deflections_of_planes[plane_index]
+                    )
+
+            planes.append(pl.Plane(redshift=plane.redshift, galaxies=galaxies))
+
+        self.tracer = tracer.tracer_with_planes(planes=planes)
+
+    @property
+    def total_culled_galaxies(self):
+        return len(self.culled_galaxies)
+
+
+def sample_grid_from_grid_and_shape_2d(grid, shape_2d):
+    """
+    Returns a uniform grid of `shape_2d` (y,x) coordinates which spans the bounding box of a grid, as a 2D ndarray
+    of shape [total_coordinates, 2].
+    """
+    grid = np.asarray(grid).reshape(-1, 2)
+
+    y = np.linspace(np.min(grid[:, 0]), np.max(grid[:, 0]), shape_2d[0])
+    x = np.linspace(np.min(grid[:, 1]), np.max(grid[:, 1]), shape_2d[1])
+
+    y, x = np.meshgrid(y, x, indexing="ij")
+
+    return np.stack((y.ravel(), x.ravel()), axis=-1)
+
+
+def plane_index_of_galaxy(tracer, galaxy):
+
+    for plane_index, plane in enumerate(tracer.planes):
+        if any(galaxy is plane_galaxy for plane_galaxy in plane.galaxies):
+            return plane_index
+
+    raise ValueError(
+        "A line-of-sight galaxy input to LineOfSightCulling is not in a plane of the tracer."
+    )
+
+
+def max_deflection_of_galaxy_from_grid(galaxy, grid):
+    """
+    Estimate the maximum deflection of a galaxy over the bounding box of a grid, by evaluating its deflections on the
+    grid and on the coordinate of the bounding box closest to the centre of each of its mass profiles.
+    """
+    if not galaxy.has_mass_profile:
+        return 0.0
+
+    grid_min = np.min(grid, axis=0)
+    grid_max = np.max(grid, axis=0)
+
+    closest_coordinates = [
+        np.clip(mass_profile.centre, grid_min, grid_max)
+        for mass_profile in galaxy.mass_profiles
+        if hasattr(mass_profile, "centre")
+    ]
+
+    grid = np.concatenate((grid, np.asarray(closest_coordinates).reshape(-1, 2)))
+
+    deflections = np.asarray(galaxy.deflections_from_grid(grid=grid))
+
+    return float(np.max(np.sqrt(np.sum(deflections ** 2.0, axis=1))))
+
+
+def linear_deflections_from_galaxies_and_grid(galaxies, grid):
+    """
+    Fit a `LinearDeflections` profile to the summed deflections of galaxies on a grid by (linear) least-squares,
+    returning the profile and the maximum residual of the fit in arc-seconds.
+
+    The profile is centred on the mean of the grid and its gradient is symmetrized, as the deflections of a mass
+    distribution are the gradient of its potential.
+    """
+    centre = np.mean(grid, axis=0)
+
+    deflections = sum(
+        np.asarray(galaxy.deflections_from_grid(grid=grid)) for galaxy in galaxies
+    )
+
+    shifted_grid = grid - centre
+
+    design_matrix = np.hstack((np.ones((grid.shape[0], 1)), shifted_grid))
+
+    coefficients = np.linalg.lstsq(design_matrix, deflections, rcond=None)[0]
+
+    gradient = coefficients[1:].T
+    gradient = 0.5 * (gradient + gradient.T)
+
+    linear_deflections = LinearDeflections(
+        centre=tuple(centre),
+        deflections=tuple(coefficients[0]),
+        gradient=tuple(map(tuple, gradient)),
+    )
+
+    residuals = deflections - np.asarray(
+        linear_deflections.deflections_from_grid(grid=grid)
+    )
+
+    return (
+        linear_deflections,
+        float(np.max(np.sqrt(np.sum(residuals ** 2.0, axis=1)))),
+    )
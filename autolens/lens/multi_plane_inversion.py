@@ -0,0 +1,263 @@
+import numpy as np
+from scipy import sparse
+
+from autoarray import exc
+from autoarray.inversion import inversions as inv
+from autolens.lens import solver_util
+from autolens.lens import sparse_inversion_util
+
+
+class InversionImagingMatrixOfPlane(inv.InversionImagingMatrix):
+    def __init__(self, factors, index, **kwargs):
+        """
+        The inversion of one plane of a joint inversion of several planes (see `InversionImagingMultiPlane`), whose
+        curvature regularization matrix is its diagonal block of the joint curvature regularization matrix.
+
+        Its errors are computed from the block Cholesky factorisation of the joint matrix (see
+        `solver_util.block_cholesky_from`), such that they are marginalized over the reconstructions of the other
+        planes, as opposed to the inverse of its diagonal block, which gives errors conditional on them.
+
+        Parameters
+        ----------
+        factors : [[np.ndarray]]
+            The block Cholesky factors of the joint curvature regularization matrix.
+        index : int
+            The index of this plane's block in the joint curvature regularization matrix.
+        """
+        super().__init__(**kwargs)
+
+        self.factors = factors
+        self.index = index
+
+    @property
+    def errors_with_covariance(self):
+        return solver_util.inverse_diagonal_block_via_block_cholesky_from(
+            factors=self.factors, index=self.index
+        )
+
+
+class InversionImagingMultiPlane:
+    def __init__(
+        self,
+        inversions,
+        log_det_curvature_reg_matrix_term,
+        log_det_regularization_matrix_term,
+    ):
+        """
+        The joint inversion of an image by the pixelizations of several planes (e.g. the source planes of a double
+        source plane lens), whose reconstructions are solved for simultaneously such that the light of every plane's
+        source is separated from that of the others.
+
+        The inversion of every plane is an `InversionImagingMatrixOfPlane`, whose reconstruction is that plane's
+        part of the joint solution and whose errors are its diagonal block of the inverse of the joint curvature
+        regularization matrix, such that they are marginalized over the reconstructions of the other planes.
+
+        Properties which describe a single reconstruction (e.g. the `mapper` and `reconstruction`, which are used
+        for visualization) are those of the last plane's inversion, which is the plane a single-plane inversion
+        reconstructs.
+
+        Parameters
+        ----------
+        inversions : [InversionImagingMatrixOfPlane]
+            The inversion of every plane with a pixelization, in order of redshift.
+        log_det_curvature_reg_matrix_term : float
+            The log determinant of the joint curvature regularization matrix.
+        log_det_regularization_matrix_term : float
+            The log determinant of the joint regularization matrix, which is the sum of those of every plane.
+        """
+        self.inversions = inversions
+
+        self._log_det_curvature_reg_matrix_term = log_det_curvature_reg_matrix_term
+        self._log_det_regularization_matrix_term = log_det_regularization_matrix_term
+
+    @classmethod
+    def from_data_mappers_and_regularizations(
+        cls,
+        image,
+        noise_map,
+        convolver,
+        mappers,
+        regularizations,
+        settings=inv.SettingsInversion(),
+    ):
+        """
+        Perform the joint inversion of an image by the mappers and regularizations of several planes.
+
+        The joint curvature matrix has a block for every pair of planes, F_ij = B_i^T W B_j, where B_i is the
+        blurred mapping matrix of plane i and W the diagonal matrix of inverse noise-map variances. The blurred
+        mapping matrices are computed as sparse matrices (see `sparse_inversion_util`), such that every block is
+        computed from the image pixels the two planes map to, and the blocks of planes whose blurred images do not
+        overlap are zero. The regularization matrix of every plane is added to its diagonal block.
+
+        The joint curvature regularization matrix is factorised via block elimination (see
+        `solver_util.block_cholesky_from`), which gives both the reconstructions and its log determinant.
+
+        Parameters
+        ----------
+        image : aa.Array
+            The image (e.g. the profile subtracted image) which is reconstructed.
+        noise_map : aa.Array
+            The noise-map of the image.
+        convolver : aa.Convolver
+            The convolver used to blur the mapping matrices with the PSF.
+        mappers : [aa.Mapper]
+            The mapper of every plane with a pixelization, in order of redshift.
+        regularizations : [aa.reg.Regularization]
+            The regularization scheme of every plane's pixelization.
+        settings : aa.SettingsInversion
+            The settings of the inversion.
+        """
+        convolution_matrix = sparse_inversion_util.convolution_matrix_sparse_from(
+            convolver=convolver
+        )
+
+        blurred_mapping_matrices = [
+            convolution_matrix
+            @ sparse_inversion_util.mapping_matrix_sparse_from(mapper=mapper)
+            for mapper in mappers
+        ]
+
+        inverse_variances = sparse.diags(1.0 / np.square(np.asarray(noise_map)))
+
+        weighted_blurred_mapping_matrices = [
+            inverse_variances @ blurred_mapping_matrix
+            for blurred_mapping_matrix in blurred_mapping_matrices
+        ]
+
+        regularization_matrices = [
+            regularization.regularization_matrix_from_mapper(mapper=mapper)
+            for mapper, regularization in zip(mappers, regularizations)
+        ]
+
+        blocks = [[None] * len(mappers) for _ in range(len(mappers))]
+
+        for i in range(len(mappers)):
+            for j in range(i + 1):
+
+                curvature_matrix = (
+                    blurred_mapping_matrices[i].T @ weighted_blurred_mapping_matrices[j]
+                )
+
+                if i == j:
+                    blocks[i][j] = (
+                        curvature_matrix.toarray() + regularization_matrices[i]
+                    )
+                elif curvature_matrix.nnz > 0:
+                    blocks[i][j] = curvature_matrix.toarray()
+
+        data_vectors = [
+            sparse_inversion_util.data_vector_sparse_from(
+                blurred_mapping_matrix=blurred_mapping_matrix,
+                image=image,
+                noise_map=noise_map,
+            )
+            for blurred_mapping_matrix in blurred_mapping_matrices
+        ]
+
+        factors = solver_util.block_cholesky_from(blocks=blocks)
+
+        reconstructions = solver_util.solution_via_block_cholesky_from(
+            factors=factors, vectors=data_vectors
+        )
+
+        if settings.check_solution:
+            for values in reconstructions:
+                if np.isclose(a=values[0], b=values[1], atol=1e-4).all():
+                    if np.isclose(a=values[0], b=values, atol=1e-4).all():
+                        raise exc.InversionException()
+
+        inversions = [
+            InversionImagingMatrixOfPlane(
+                factors=factors,
+                index=index,
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mapper,
+                regularization=regularization,
+                blurred_mapping_matrix=blurred_mapping_matrix.toarray(),
+                regularization_matrix=regularization_matrix,
+                curvature_reg_matrix=blocks[index][index],
+                reconstruction=reconstruction,
+                settings=settings,
+            )
+            for index, (
+                mapper,
+                regularization,
+                blurred_mapping_matrix,
+                regularization_matrix,
+                reconstruction,
+            ) in enumerate(
+                zip(
+                    mappers,
+                    regularizations,
+                    blurred_mapping_matrices,
+                    regularization_matrices,
+                    reconstructions,
+                )
+            )
+        ]
+
+        return cls(
+            inversions=inversions,
+            log_det_curvature_reg_matrix_term=solver_util.log_determinant_from_block_cholesky(
+                factors=factors
+            ),
+            log_det_regularization_matrix_term=sum(
+                solver_util.log_determinant_via_sparse_lu_from(
+                    matrix=regularization_matrix
+                )
+                for regularization_matrix in regularization_matrices
+            ),
+        )
+
+    @property
+    def mapped_reconstructed_image(self):
+        mapped_reconstructed_image = self.inversions[0].mapped_reconstructed_image
+
+        for inversion in self.inversions[1:]:
+            mapped_reconstructed_image = (
+                mapped_reconstructed_image + inversion.mapped_reconstructed_image
+            )
+
+        return mapped_reconstructed_image
+
+    @property
+    def regularization_term(self):
+        return sum(inversion.regularization_term for inversion in self.inversions)
+
+    @property
+    def log_det_curvature_reg_matrix_term(self):
+        return self._log_det_curvature_reg_matrix_term
+
+    @property
+    def log_det_regularization_matrix_term(self):
+        return self._log_det_regularization_matrix_term
+
+    @property
+    def mapper(self):
+        return self.inversions[-1].mapper
+
+    @property
+    def reconstruction(self):
+        return self.inversions[-1].reconstruction
+
+    @property
+    def errors_with_covariance(self):
+        return self.inversions[-1].errors_with_covariance
+
+    @property
+    def errors(self):
+        return self.inversions[-1].errors
+
+    @property
+    def brightest_reconstruction_pixel_centre(self):
+        return self.inversions[-1].brightest_reconstruction_pixel_centre
+
+    def interpolated_reconstruction_from_shape_2d(self, shape_2d=None):
+        return self.inversions[-1].interpolated_reconstruction_from_shape_2d(
+            shape_2d=shape_2d
+        )
+
+    def interpolated_errors_from_shape_2d(self, shape_2d=None):
+        return self.inversions[-1].interpolated_errors_from_shape_2d(shape_2d=shape_2d)
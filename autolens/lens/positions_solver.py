@@ -1,9 +1,9 @@
-from autoarray import decorator_util
 import numpy as np
 from autoarray.util import grid_util, mask_util
 
 from autoarray.structures import abstract_structure, grids
 
+from autolens import decorator_util
 from autolens import exc
 
 import copy
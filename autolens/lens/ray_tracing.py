@@ -3,18 +3,46 @@ import pickle
 import numpy as np
 from os import path
 from astropy import cosmology as cosmo
-from autoarray.inversion import pixelizations as pix
 from autoarray.inversion import inversions as inv
-from autoarray.structures import grids
+from autoarray.structures import arrays, grids
 from autogalaxy import lensing
 from autogalaxy.galaxy import galaxy as g
 from autogalaxy.plane import plane as pl
 from autogalaxy.util import cosmology_util
 from autogalaxy.util import plane_util
+from autolens.lens import inversion_cache as inv_cache
+from autolens.lens import jacobian_bundle
+from autolens.lens import kmeans_cache
+from autolens.lens import multi_plane_inversion
+from autolens.lens import serialization
+from autolens.lens.settings import SettingsPixelization, SettingsInversion
+from autolens.lens import traced_grids
+from autolens.lens import transformer_util
+from skimage import measure
 
 
 class AbstractTracer(lensing.LensingObject, ABC):
-    def __init__(self, planes, cosmology):
+
+    strategy_names = (
+        "tree_deflections",
+        "interpolated_deflections",
+        "threaded_evaluation",
+        "tiled_evaluation",
+        "adaptive_supersampling",
+        "light_profile_culling",
+    )
+
+    def __init__(
+        self,
+        planes,
+        cosmology,
+        tree_deflections=None,
+        interpolated_deflections=None,
+        threaded_evaluation=None,
+        tiled_evaluation=None,
+        adaptive_supersampling=None,
+        light_profile_culling=None,
+    ):
         """Ray-tracer for a lens system with any number of planes.
 
         The redshift of these planes are specified by the redshits of the galaxies; there is a unique plane redshift \
@@ -37,10 +65,56 @@ class AbstractTracer(lensing.LensingObject, ABC):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        tree_deflections : TreeDeflections
+            If input, the deflection angles of planes with many mass profiles are computed using this tree-code \
+            (see `TreeDeflections`) as opposed to summing every mass profile's deflections on every coordinate.
+        interpolated_deflections : InterpolatedDeflections
+            If input, the deflection angles of every plane are computed on a coarse grid covering the grid traced to \
+            that plane and interpolated to the traced grid (see `InterpolatedDeflections`).
+        threaded_evaluation : ThreadedEvaluation
+            If input, the deflection angles and images of the profiles of every plane are evaluated on a pool of \
+            threads (see `ThreadedEvaluation`), with identical results to evaluating them serially.
+        tiled_evaluation : TiledEvaluation
+            If input, the image of the tracer is computed by ray-tracing tiles of the grid one at a time, bounding \
+            the memory used to compute the image of a large grid (see `TiledEvaluation`).
+        adaptive_supersampling : AdaptiveSupersampling
+            If input, the image of the tracer on a `Grid` is computed by supersampling every pixel at the sub-size \
+            its ray-tracing requires (see `AdaptiveSupersampling`).
+        light_profile_culling : LightProfileCulling
+            If input, the light profiles of every plane are only evaluated at the coordinates of its traced grid \
+            where their intensity is not negligible (see `LightProfileCulling`).
         """
         self.planes = planes
         self.plane_redshifts = [plane.redshift for plane in planes]
         self.cosmology = cosmology
+        self.tree_deflections = tree_deflections
+        self.interpolated_deflections = interpolated_deflections
+        self.threaded_evaluation = threaded_evaluation
+        self.tiled_evaluation = tiled_evaluation
+        self.adaptive_supersampling = adaptive_supersampling
+        self.light_profile_culling = light_profile_culling
+
+    @property
+    def strategies(self):
+        """
+        The evaluation strategies of the tracer (e.g. `TreeDeflections`), as a dictionary of the arguments of its
+        constructor they are input via.
+        """
+        return {name: getattr(self, name) for name in self.strategy_names}
+
+    def tracer_with_planes(self, planes):
+        """
+        Returns a tracer of the same class, cosmology and evaluation strategies as this tracer but with different
+        planes (e.g. the planes of this tracer with some of their galaxies removed).
+
+        Parameters
+        ----------
+        planes : [Plane]
+            The planes of the returned tracer.
+        """
+        return self.__class__(
+            planes=planes, cosmology=self.cosmology, **self.strategies
+        )
 
     @property
     def total_planes(self):
@@ -191,54 +265,248 @@ class AbstractTracer(lensing.LensingObject, ABC):
 
     @classmethod
     def load(cls, file_path, filename="tracer"):
-        with open(path.join(file_path, f"{filename}.pickle"), "rb") as f:
-            return pickle.load(f)
+        """
+        Load a tracer saved by `save`, where tracers saved as a `.pickle` file by previous versions of PyAutoLens are
+        unpickled.
+        """
+        if not path.exists(path.join(file_path, f"{filename}.json")):
+            with open(path.join(file_path, f"{filename}.pickle"), "rb") as f:
+                return pickle.load(f)
+
+        return serialization.TracerDeserializer.load(
+            file_path=file_path, filename=filename
+        )
 
     def save(self, file_path, filename="tracer"):
         """
-        Save the tracer by serializing it with pickle.
+        Save the tracer as a `.json` file describing its planes, galaxies and cosmology and a `.npy` file containing
+        any arrays attached to its galaxies (e.g. hyper images), see `serialization.TracerSerializer`.
         """
-        with open(path.join(file_path, f"{filename}.pickle"), "wb") as f:
-            pickle.dump(self, f)
+        serialization.TracerSerializer().save(
+            tracer=self, file_path=file_path, filename=filename
+        )
 
 
 class AbstractTracerLensing(AbstractTracer, ABC):
+    @property
+    def scaling_factors_between_planes(self):
+        """
+        The factors which scale the deflection angles of every plane to every later plane in multi-plane ray-tracing,
+        ordered [previous_plane_index][plane_index].
+
+        Computing them requires angular diameter distances, which are expensive to compute relative to the rest of
+        ray-tracing, so they are computed once and reused until the redshifts of the tracer's planes change.
+        """
+        plane_redshifts = [plane.redshift for plane in self.planes]
+
+        cached = self.__dict__.get("_scaling_factors_between_planes")
+
+        if cached is not None and cached[0] == plane_redshifts:
+            return cached[1]
+
+        scaling_factors = [
+            [
+                cosmology_util.scaling_factor_between_redshifts_from(
+                    redshift_0=plane_redshifts[previous_plane_index],
+                    redshift_1=plane_redshifts[plane_index],
+                    redshift_final=plane_redshifts[-1],
+                    cosmology=self.cosmology,
+                )
+                if previous_plane_index < plane_index
+                else None
+                for plane_index in range(len(plane_redshifts))
+            ]
+            for previous_plane_index in range(len(plane_redshifts))
+        ]
+
+        self._scaling_factors_between_planes = (plane_redshifts, scaling_factors)
+
+        return scaling_factors
+
+    def scaling_factors_to_redshift_from_redshift(self, redshift):
+        """
+        The factors which scale the deflection angles of every plane to a redshift, where the factor of every plane
+        at or behind the redshift is `None`.
+
+        They are cached for every redshift they are computed for, until the redshifts of the tracer's planes change.
+        """
+        plane_redshifts = [plane.redshift for plane in self.planes]
+
+        cached = self.__dict__.get("_scaling_factors_to_redshifts")
+
+        if cached is None or cached[0] != plane_redshifts:
+            cached = (plane_redshifts, {})
+            self._scaling_factors_to_redshifts = cached
+
+        if redshift not in cached[1]:
+            cached[1][redshift] = [
+                cosmology_util.scaling_factor_between_redshifts_from(
+                    redshift_0=plane_redshift,
+                    redshift_1=redshift,
+                    redshift_final=plane_redshifts[-1],
+                    cosmology=self.cosmology,
+                )
+                if plane_redshift < redshift
+                else None
+                for plane_redshift in plane_redshifts
+            ]
+
+        return cached[1][redshift]
+
     @grids.grid_like_to_structure_list
     def traced_grids_of_planes_from_grid(self, grid, plane_index_limit=None):
+        """
+        Ray-trace a grid through every plane of the tracer, returning the traced grid of every plane.
+        """
+        return self.traced_grids_and_deflections_of_planes_from_grid(
+            grid=grid, plane_index_limit=plane_index_limit
+        )[0]
 
-        traced_grids = []
+    def traced_grids_from_grid(self, grid):
+        """
+        Ray-trace a grid through every plane of the tracer, returning a `TracedGrids` object which stores the traced
+        grid and deflection angles of every plane and computes the grid at any redshift from them.
+        """
+        (
+            traced_grids_of_planes,
+            deflections_of_planes,
+        ) = self.traced_grids_and_deflections_of_planes_from_grid(grid=grid)
+
+        return traced_grids.TracedGrids(
+            tracer=self,
+            grid=grid,
+            traced_grids_of_planes=traced_grids_of_planes,
+            deflections_of_planes=deflections_of_planes,
+        )
+
+    def traced_grids_and_deflections_of_planes_from_grid(
+        self, grid, plane_index_limit=None
+    ):
+        """
+        Ray-trace a grid through every plane of the tracer, returning the traced grid and deflection angles of every
+        plane (which are `None` for planes without a mass profile).
+
+        Every plane's traced grid is a copy of the input grid which has the scaled deflection angles of every
+        previous plane subtracted from it in-place. The scaled deflections are computed in one workspace buffer
+        that is reused for every plane, so the only arrays allocated per trace are the traced grids and deflection
+        angles of every plane (as opposed to a temporary array for every pair of planes). Planes without a mass
+        profile do not deflect light and are skipped.
+        """
+        scaling_factors = self.scaling_factors_between_planes
+
+        traced_grids_of_planes = []
         traced_deflections = []
 
+        workspace = None
+
         for (plane_index, plane) in enumerate(self.planes):
 
             scaled_grid = grid.copy()
 
-            if plane_index > 0:
-                for previous_plane_index in range(plane_index):
-                    scaling_factor = cosmology_util.scaling_factor_between_redshifts_from(
-                        redshift_0=self.plane_redshifts[previous_plane_index],
-                        redshift_1=plane.redshift,
-                        redshift_final=self.plane_redshifts[-1],
-                        cosmology=self.cosmology,
-                    )
+            for previous_plane_index in range(plane_index):
 
-                    scaled_deflections = (
-                        scaling_factor * traced_deflections[previous_plane_index]
+                deflections = traced_deflections[previous_plane_index]
+
+                if deflections is None:
+                    continue
+
+                if workspace is None:
+                    workspace = np.empty(
+                        shape=np.shape(deflections), dtype=scaled_grid.dtype
                     )
 
-                    # TODO : Setup as GridInterpolate
+                np.multiply(
+                    deflections,
+                    scaling_factors[previous_plane_index][plane_index],
+                    out=workspace,
+                )
 
-                    scaled_grid -= scaled_deflections
+                scaled_grid -= workspace
 
-            traced_grids.append(scaled_grid)
+            traced_grids_of_planes.append(scaled_grid)
 
             if plane_index_limit is not None:
                 if plane_index == plane_index_limit:
-                    return traced_grids
+                    return traced_grids_of_planes, traced_deflections
 
-            traced_deflections.append(plane.deflections_from_grid(grid=scaled_grid))
+            if plane.has_mass_profile:
+                traced_deflections.append(
+                    self.deflections_of_plane_from_grid(plane=plane, grid=scaled_grid)
+                )
+            else:
+                traced_deflections.append(None)
 
-        return traced_grids
+        return traced_grids_of_planes, traced_deflections
+
+    def deflections_of_plane_from_grid(self, plane, grid):
+        """
+        The deflection angles of a plane used for ray-tracing, which are interpolated from a coarse grid if the
+        tracer has `InterpolatedDeflections` and computed using the tracer's `TreeDeflections` if it has one and
+        the plane has enough mass profiles for the tree-code to be used.
+        """
+        if self.interpolated_deflections is not None:
+            if self.interpolated_deflections.is_used_for_plane(plane=plane):
+                return self.interpolated_deflections.deflections_from_func_and_grid(
+                    func=lambda grid_interp: self.summed_deflections_of_plane_from_grid(
+                        plane=plane, grid=grid_interp
+                    ),
+                    grid=grid,
+                )
+
+        return self.summed_deflections_of_plane_from_grid(plane=plane, grid=grid)
+
+    def summed_deflections_of_plane_from_grid(self, plane, grid):
+
+        if self.tree_deflections is not None:
+            if self.tree_deflections.is_used_for_plane(plane=plane):
+                return self.tree_deflections.deflections_from_plane_and_grid(
+                    plane=plane, grid=grid
+                )
+
+        if self.threaded_evaluation is not None:
+            if self.threaded_evaluation.is_used_for_plane_deflections(plane=plane):
+                return self.threaded_evaluation.deflections_from_plane_and_grid(
+                    plane=plane, grid=grid
+                )
+
+        return plane.deflections_from_grid(grid=grid)
+
+    def image_of_plane_from_grid(self, plane, grid):
+        """
+        The image of a plane, whose light profiles are evaluated on the tracer's `ThreadedEvaluation` thread pool
+        if it has one and only within their bounding circles if the tracer has a `LightProfileCulling`.
+        """
+        if self.threaded_evaluation is not None:
+            if self.threaded_evaluation.is_used_for_plane_image(plane=plane):
+                return self.threaded_evaluation.image_from_plane_and_grid(
+                    plane=plane,
+                    grid=grid,
+                    image_func=self.image_of_light_profile_from_grid,
+                )
+
+        if self.light_profile_culling is not None and plane.has_light_profile:
+            return sum(
+                sum(
+                    self.image_of_light_profile_from_grid(
+                        light_profile=light_profile, grid=grid
+                    )
+                    for light_profile in galaxy.light_profiles
+                )
+                if galaxy.has_light_profile
+                else galaxy.image_from_grid(grid=grid)
+                for galaxy in plane.galaxies
+            )
+
+        return plane.image_from_grid(grid=grid)
+
+    def image_of_light_profile_from_grid(self, light_profile, grid):
+
+        if self.light_profile_culling is not None:
+            return self.light_profile_culling.image_from_light_profile_and_grid(
+                light_profile=light_profile, grid=grid
+            )
+
+        return light_profile.image_from_grid(grid=grid)
 
     @grids.grid_like_to_structure
     def deflections_between_planes_from_grid(self, grid, plane_i=0, plane_j=-1):
@@ -249,6 +517,28 @@ class AbstractTracerLensing(AbstractTracer, ABC):
 
     @grids.grid_like_to_structure
     def image_from_grid(self, grid):
+
+        if self.adaptive_supersampling is not None and isinstance(grid, grids.Grid):
+            (
+                binned_image,
+                sub_sizes,
+            ) = self.adaptive_supersampling.binned_image_and_sub_sizes_from_tracer_and_grid(
+                tracer=self, grid=grid
+            )
+            return np.repeat(binned_image, grid.sub_size ** 2)
+
+        if self.tiled_evaluation is not None:
+            if self.tiled_evaluation.is_used_for_grid(
+                grid=grid, total_planes=self.total_planes
+            ):
+                return self.tiled_evaluation.image_from_func_and_grid(
+                    func=lambda grid_tile: sum(
+                        self.images_of_planes_from_grid(grid=grid_tile)
+                    ),
+                    grid=grid,
+                    total_planes=self.total_planes,
+                )
+
         return sum(self.images_of_planes_from_grid(grid=grid))
 
     @grids.grid_like_to_structure_list
@@ -259,8 +549,8 @@ class AbstractTracerLensing(AbstractTracer, ABC):
         )
 
         images_of_planes = [
-            self.planes[plane_index].image_from_grid(
-                grid=traced_grids_of_planes[plane_index]
+            self.image_of_plane_from_grid(
+                plane=self.planes[plane_index], grid=traced_grids_of_planes[plane_index]
             )
             for plane_index in range(len(traced_grids_of_planes))
         ]
@@ -295,6 +585,194 @@ class AbstractTracerLensing(AbstractTracer, ABC):
     def deflections_of_planes_summed_from_grid(self, grid):
         return sum([plane.deflections_from_grid(grid=grid) for plane in self.planes])
 
+    def lensing_jacobian_bundle_from_grid(self, grid, buffer=0.01):
+        """
+        Returns the lensing Jacobian of the tracer on a grid, and the convergence, shear, eigen values and
+        magnification derived from it, as a `LensingJacobianBundle`, using one evaluation of the tracer's deflection
+        angles.
+
+        The `LensingObject` methods which compute these quantities (e.g. `magnification_from_grid`) each compute the
+        Jacobian separately, with every component of the Jacobian evaluating the deflection angles of the grid again.
+        For multi-plane ray-tracing, which evaluates every mass profile of every plane, this dominates the cost of
+        computing critical curves, caustics and magnifications.
+
+        For a uniform `Grid` the Jacobian is computed by differentiating the deflection angles of the grid, as for
+        the `LensingObject` methods, which it is identical to. For irregular (y,x) coordinates (e.g. an ndarray or a
+        `GridIrregular`) it is computed by central differences of the deflection angles on a stencil of the four
+        coordinates a distance `buffer` above, below, left and right of every coordinate, which are all evaluated in
+        one call.
+
+        Parameters
+        ----------
+        grid : aa.Grid or ndarray
+            The (y,x) coordinates the lensing Jacobian is computed on.
+        buffer : float
+            The arc-second spacing of the stencil used for irregular coordinates.
+        """
+        if isinstance(grid, grids.Grid):
+
+            deflections = self.deflections_from_grid(grid=grid)
+
+            y_2d = grid.in_2d[:, 0, 0]
+            x_2d = grid.in_2d[0, :, 1]
+
+            def jacobian_component_from(array_2d):
+                return arrays.Array.manual_mask(array=array_2d, mask=grid.mask)
+
+            return jacobian_bundle.LensingJacobianBundle(
+                a11=jacobian_component_from(
+                    1.0 - np.gradient(deflections.in_2d[:, :, 1], x_2d, axis=1)
+                ),
+                a12=jacobian_component_from(
+                    -1.0 * np.gradient(deflections.in_2d[:, :, 1], y_2d, axis=0)
+                ),
+                a21=jacobian_component_from(
+                    -1.0 * np.gradient(deflections.in_2d[:, :, 0], x_2d, axis=1)
+                ),
+                a22=jacobian_component_from(
+                    1 - np.gradient(deflections.in_2d[:, :, 0], y_2d, axis=0)
+                ),
+                mask=grid.mask,
+            )
+
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        stencil = np.concatenate(
+            (
+                grid + np.array([buffer, 0.0]),
+                grid - np.array([buffer, 0.0]),
+                grid + np.array([0.0, buffer]),
+                grid - np.array([0.0, buffer]),
+            )
+        )
+
+        deflections = np.asarray(self.deflections_from_grid(grid=stencil)).reshape(
+            4, -1, 2
+        )
+
+        deflections_dy = (deflections[0] - deflections[1]) / (2.0 * buffer)
+        deflections_dx = (deflections[2] - deflections[3]) / (2.0 * buffer)
+
+        return jacobian_bundle.LensingJacobianBundle(
+            a11=1.0 - deflections_dx[:, 1],
+            a12=-1.0 * deflections_dy[:, 1],
+            a21=-1.0 * deflections_dx[:, 0],
+            a22=1.0 - deflections_dy[:, 0],
+        )
+
+    def jacobian_from_grid(self, grid):
+        return self.lensing_jacobian_bundle_from_grid(grid=grid).jacobian
+
+    def convergence_via_jacobian_from_grid(self, grid):
+        return self.lensing_jacobian_bundle_from_grid(grid=grid).convergence
+
+    def shear_via_jacobian_from_grid(self, grid):
+        return self.lensing_jacobian_bundle_from_grid(grid=grid).shear
+
+    def tangential_eigen_value_from_grid(self, grid):
+        return self.lensing_jacobian_bundle_from_grid(grid=grid).tangential_eigen_value
+
+    def radial_eigen_value_from_grid(self, grid):
+        return self.lensing_jacobian_bundle_from_grid(grid=grid).radial_eigen_value
+
+    def magnification_from_grid(self, grid):
+        return self.lensing_jacobian_bundle_from_grid(grid=grid).magnification
+
+    @staticmethod
+    def critical_curve_from_grid_and_eigen_values(grid, eigen_values):
+        """
+        Returns the critical curve where the eigen values of the lensing Jacobian computed on a uniform `Grid` are
+        zero, using a marching squares algorithm.
+        """
+        critical_curve_indices = measure.find_contours(eigen_values.in_2d, 0)
+
+        if len(critical_curve_indices) == 0:
+            return []
+
+        critical_curve = grid.geometry.grid_scaled_from_grid_pixels_1d_for_marching_squares(
+            grid_pixels_1d=critical_curve_indices[0],
+            shape_2d=eigen_values.sub_shape_2d,
+        )
+
+        return grids.GridIrregularGrouped(critical_curve)
+
+    def tangential_and_radial_critical_curves(self):
+        """
+        Returns the tangential and radial critical curves of the tracer, which are both computed from the lensing
+        Jacobian of the tracer's calculation grid.
+        """
+        grid = self.calculation_grid
+
+        jacobian = self.lensing_jacobian_bundle_from_grid(grid=grid)
+
+        return (
+            self.critical_curve_from_grid_and_eigen_values(
+                grid=grid, eigen_values=jacobian.tangential_eigen_value
+            ),
+            self.critical_curve_from_grid_and_eigen_values(
+                grid=grid, eigen_values=jacobian.radial_eigen_value
+            ),
+        )
+
+    @property
+    def tangential_critical_curve(self):
+        return self.tangential_and_radial_critical_curves()[0]
+
+    @property
+    def radial_critical_curve(self):
+        return self.tangential_and_radial_critical_curves()[1]
+
+    @property
+    def critical_curves(self):
+        return grids.GridIrregularGrouped(
+            list(self.tangential_and_radial_critical_curves())
+        )
+
+    def caustic_from_critical_curve(self, critical_curve):
+        """
+        Returns the caustic of a critical curve of the tracer, by ray-tracing it to the source-plane.
+        """
+        if len(critical_curve) == 0:
+            return []
+
+        return critical_curve - self.deflections_from_grid(grid=critical_curve)
+
+    def caustics_from_critical_curves(self, critical_curves):
+        """
+        Returns the tangential and radial caustics of the tracer from its critical curves (e.g. as returned by the
+        `critical_curves` property), such that critical curves which have already been computed are not
+        recomputed.
+        """
+        return grids.GridIrregularGrouped(
+            [
+                self.caustic_from_critical_curve(
+                    critical_curve=grids.GridIrregularGrouped(critical_curve)
+                )
+                for critical_curve in critical_curves.in_grouped_list
+            ]
+        )
+
+    @property
+    def tangential_caustic(self):
+        return self.caustic_from_critical_curve(
+            critical_curve=self.tangential_critical_curve
+        )
+
+    @property
+    def radial_caustic(self):
+        return self.caustic_from_critical_curve(
+            critical_curve=self.radial_critical_curve
+        )
+
+    @property
+    def caustics(self):
+        return grids.GridIrregularGrouped(
+            [
+                self.caustic_from_critical_curve(critical_curve=critical_curve)
+                for critical_curve in self.tangential_and_radial_critical_curves()
+            ]
+        )
+
     def grid_at_redshift_from_grid_and_redshift(self, grid, redshift):
         """For an input grid of (y,x) arc-second image-plane coordinates, ray-trace the coordinates to any redshift in \
         the strong lens configuration.
@@ -303,6 +781,8 @@ class AbstractTracerLensing(AbstractTracer, ABC):
         any redshift can be input even if a plane does not exist there, including redshifts before the first plane \
         of the lens system.
 
+        To trace the same grid to many redshifts, use `traced_grids_from_grid`, which traces the grid once.
+
         Parameters
         ----------
         grid : ndsrray or aa.Grid
@@ -310,32 +790,12 @@ class AbstractTracerLensing(AbstractTracer, ABC):
         redshift : float
             The redshift the image-plane grid is traced to.
         """
-
         if redshift <= self.plane_redshifts[0]:
             return grid.copy()
 
-        plane_index_with_redshift = [
-            plane_index
-            for plane_index, plane in enumerate(self.planes)
-            if plane.redshift == redshift
-        ]
-
-        if plane_index_with_redshift:
-            return self.traced_grids_of_planes_from_grid(grid=grid)[
-                plane_index_with_redshift[0]
-            ]
-
-        for plane_index, plane_redshift in enumerate(self.plane_redshifts):
-
-            if redshift < plane_redshift:
-                plane_index_insert = plane_index
-
-        planes = self.planes
-        planes.insert(plane_index_insert, pl.Plane(redshift=redshift, galaxies=[]))
-
-        tracer = Tracer(planes=planes, cosmology=self.cosmology)
-
-        return tracer.traced_grids_of_planes_from_grid(grid=grid)[plane_index_insert]
+        return self.traced_grids_from_grid(grid=grid).grid_at_redshift_from_redshift(
+            redshift=redshift
+        )
 
     @property
     def contribution_map(self):
@@ -486,7 +946,9 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         unmasked_blurred_images_of_planes = []
 
         for plane, traced_padded_grid in zip(self.planes, traced_padded_grids):
-            padded_image_1d = plane.image_from_grid(grid=traced_padded_grid)
+            padded_image_1d = self.image_of_plane_from_grid(
+                plane=plane, grid=traced_padded_grid
+            )
 
             unmasked_blurred_array_2d = padded_grid.mask.unmasked_blurred_array_from_padded_array_psf_and_image_shape(
                 padded_array=padded_image_1d, psf=psf, image_shape=grid.mask.shape
@@ -529,7 +991,10 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         return unmasked_blurred_images_of_planes_and_galaxies
 
     def profile_visibilities_from_grid_and_transformer(self, grid, transformer):
-
+        """
+        The visibilities of the tracer's light profiles, which (as the Fourier transform is linear) are computed by
+        transforming the sum of the images of every plane once, as opposed to transforming every plane's image.
+        """
         if not self.has_light_profile:
             return np.zeros(shape=transformer.uv_wavelengths.shape[0])
 
@@ -541,37 +1006,57 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ):
 
+        """
+        The visibilities of the light profiles of every plane, where the images of every plane are transformed
+        together (see `transformer_util.visibilities_of_images_from`).
+        """
         images_of_planes = self.images_of_planes_from_grid(grid=grid)
-        return [
-            transformer.visibilities_from_image(image=image)
-            for image in images_of_planes
-        ]
+
+        return transformer_util.visibilities_of_images_from(
+            images=images_of_planes, transformer=transformer
+        )
 
     def sparse_image_plane_grids_of_planes_from_grid(
-        self, grid, pixelization_setting=pix.SettingsPixelization()
+        self, grid, pixelization_setting=SettingsPixelization(), plane_indexes=None
     ):
-
+        """
+        The sparse image-plane grid of every plane's pixelization, which is `None` for planes without a
+        pixelization. If `plane_indexes` is input, the sparse grids of only those planes are computed.
+        """
         sparse_image_plane_grids_of_planes = []
 
-        for plane in self.planes:
-            sparse_image_plane_grid = plane.sparse_image_plane_grid_from_grid(
-                grid=grid, settings_pixelization=pixelization_setting
+        for (plane_index, plane) in enumerate(self.planes):
+
+            if plane_indexes is not None and plane_index not in plane_indexes:
+                sparse_image_plane_grids_of_planes.append(None)
+                continue
+
+            sparse_image_plane_grid = kmeans_cache.sparse_image_plane_grid_from(
+                plane=plane, grid=grid, settings_pixelization=pixelization_setting
             )
             sparse_image_plane_grids_of_planes.append(sparse_image_plane_grid)
 
         return sparse_image_plane_grids_of_planes
 
     def traced_sparse_grids_of_planes_from_grid(
-        self, grid, settings_pixelization=pix.SettingsPixelization()
+        self, grid, settings_pixelization=SettingsPixelization(), plane_indexes=None
     ):
+        """
+        The sparse grid of every plane's pixelization traced to that plane, which is `None` for planes without a
+        pixelization. If `plane_indexes` is input, the traced sparse grids of only those planes are computed.
 
+        The sparse grids of all planes are concatenated and ray-traced together once, up to the highest plane with a
+        sparse grid, as opposed to ray-tracing every plane's sparse grid through every plane separately.
+        """
         if (
             settings_pixelization.preload_sparse_grids_of_planes is None
             or settings_pixelization.is_stochastic
         ):
 
             sparse_image_plane_grids_of_planes = self.sparse_image_plane_grids_of_planes_from_grid(
-                grid=grid, pixelization_setting=settings_pixelization
+                grid=grid,
+                pixelization_setting=settings_pixelization,
+                plane_indexes=plane_indexes,
             )
 
         else:
@@ -580,35 +1065,74 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
                 settings_pixelization.preload_sparse_grids_of_planes
             )
 
-        traced_sparse_grids_of_planes = []
+        traced_sparse_grids_of_planes = [None] * len(self.planes)
 
-        for (plane_index, plane) in enumerate(self.planes):
+        sparse_plane_indexes = [
+            plane_index
+            for plane_index in range(len(self.planes))
+            if sparse_image_plane_grids_of_planes[plane_index] is not None
+            and (plane_indexes is None or plane_index in plane_indexes)
+        ]
 
-            if sparse_image_plane_grids_of_planes[plane_index] is None:
-                traced_sparse_grids_of_planes.append(None)
-            else:
-                traced_sparse_grids = self.traced_grids_of_planes_from_grid(
-                    grid=sparse_image_plane_grids_of_planes[plane_index]
-                )
-                traced_sparse_grids_of_planes.append(traced_sparse_grids[plane_index])
+        if not sparse_plane_indexes:
+            return traced_sparse_grids_of_planes
+
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=np.concatenate(
+                [
+                    np.asarray(sparse_image_plane_grids_of_planes[plane_index])
+                    for plane_index in sparse_plane_indexes
+                ]
+            ),
+            plane_index_limit=sparse_plane_indexes[-1],
+        )
+
+        index = 0
+
+        for plane_index in sparse_plane_indexes:
+
+            sparse_grid = sparse_image_plane_grids_of_planes[plane_index]
+
+            # The copy retains the type and attributes of the sparse grid (e.g. the nearest pixelization pixel of
+            # every image pixel of a `GridVoronoi`), which are lost when the sparse grids are concatenated.
+
+            traced_sparse_grid = sparse_grid.copy()
+            traced_sparse_grid[:] = traced_grids_of_planes[plane_index][
+                index : index + sparse_grid.shape[0]
+            ]
+
+            traced_sparse_grids_of_planes[plane_index] = traced_sparse_grid
+
+            index += sparse_grid.shape[0]
 
         return traced_sparse_grids_of_planes
 
     def mappers_of_planes_from_grid(
-        self, grid, settings_pixelization=pix.SettingsPixelization()
+        self, grid, settings_pixelization=SettingsPixelization(), plane_indexes=None
     ):
-
+        """
+        The mapper of every plane's pixelization, which is `None` for planes without a pixelization. If
+        `plane_indexes` is input (e.g. the plane whose pixelization is used by an inversion), the mappers of only
+        those planes are computed and the grid is only ray-traced up to the highest of those planes.
+        """
         mappers_of_planes = []
 
-        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
+        traced_grids_of_planes = self.traced_grids_of_planes_from_grid(
+            grid=grid,
+            plane_index_limit=None if plane_indexes is None else max(plane_indexes),
+        )
 
         traced_sparse_grids_of_planes = self.traced_sparse_grids_of_planes_from_grid(
-            grid=grid, settings_pixelization=settings_pixelization
+            grid=grid,
+            settings_pixelization=settings_pixelization,
+            plane_indexes=plane_indexes,
         )
 
         for (plane_index, plane) in enumerate(self.planes):
 
-            if not plane.has_pixelization:
+            if not plane.has_pixelization or (
+                plane_indexes is not None and plane_index not in plane_indexes
+            ):
                 mappers_of_planes.append(None)
             else:
                 mapper = plane.mapper_from_grid_and_sparse_grid(
@@ -626,20 +1150,62 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         image,
         noise_map,
         convolver,
-        settings_pixelization=pix.SettingsPixelization(),
-        settings_inversion=inv.SettingsInversion(),
+        settings_pixelization=SettingsPixelization(),
+        settings_inversion=SettingsInversion(),
+        inversion_cache=None,
     ):
+        """
+        Returns the inversion of an image using the pixelizations and regularizations of the tracer's planes.
+
+        If only one plane has a pixelization, an `InversionCache` can be input, in which case the quantities of its
+        last inversion which do not change (e.g. the curvature matrix, if the mapping between image and source
+        pixels is unchanged) are reused. Inversions with `use_sparse_matrices=True` are always performed via an
+        `InversionCache`, which is created if none is input.
+
+        If several planes have a pixelization, their reconstructions are solved for jointly (see
+        `InversionImagingMultiPlane`). A joint inversion always computes its blurred mapping matrices as sparse
+        matrices and is solved exactly via block elimination, so any `InversionCache` input is not used and the
+        iterative solver and sparse matrices settings have no effect on it.
+        """
+        plane_indexes = self.plane_indexes_with_pixelizations
 
         mappers_of_planes = self.mappers_of_planes_from_grid(
-            grid=grid, settings_pixelization=settings_pixelization
+            grid=grid,
+            settings_pixelization=settings_pixelization,
+            plane_indexes=plane_indexes,
         )
 
+        if len(plane_indexes) > 1:
+            return multi_plane_inversion.InversionImagingMultiPlane.from_data_mappers_and_regularizations(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mappers=[mappers_of_planes[index] for index in plane_indexes],
+                regularizations=[
+                    self.regularizations_of_planes[index] for index in plane_indexes
+                ],
+                settings=settings_inversion,
+            )
+
+        if inversion_cache is None and settings_inversion.use_sparse_matrices:
+            inversion_cache = inv_cache.InversionCache()
+
+        if inversion_cache is not None:
+            return inversion_cache.inversion_imaging_from(
+                image=image,
+                noise_map=noise_map,
+                convolver=convolver,
+                mapper=mappers_of_planes[plane_indexes[0]],
+                regularization=self.regularizations_of_planes[plane_indexes[0]],
+                settings=settings_inversion,
+            )
+
         return inv.InversionImagingMatrix.from_data_mapper_and_regularization(
             image=image,
             noise_map=noise_map,
             convolver=convolver,
-            mapper=mappers_of_planes[-1],
-            regularization=self.regularizations_of_planes[-1],
+            mapper=mappers_of_planes[plane_indexes[0]],
+            regularization=self.regularizations_of_planes[plane_indexes[0]],
             settings=settings_inversion,
         )
 
@@ -649,19 +1215,51 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         visibilities,
         noise_map,
         transformer,
-        settings_pixelization=pix.SettingsPixelization(),
-        settings_inversion=inv.SettingsInversion(),
+        settings_pixelization=SettingsPixelization(),
+        settings_inversion=SettingsInversion(),
+        inversion_cache=None,
     ):
+        """
+        Returns the inversion of visibilities using the pixelization and regularization of the tracer's plane with a
+        pixelization. Joint inversions of several planes are only supported for imaging, so a `NotImplementedError`
+        is raised if several planes have a pixelization.
+
+        If an `InversionCache` is input, the quantities of its last inversion which do not change (e.g. the
+        curvature matrix, if the mapping between image and source pixels is unchanged) are reused.
+        """
+        plane_indexes = self.plane_indexes_with_pixelizations
+
+        if len(plane_indexes) > 1:
+            raise NotImplementedError(
+                "The visibilities of an interferometer can only be inverted using the pixelization of one plane, "
+                f"but planes {plane_indexes} have pixelizations"
+            )
+
         mappers_of_planes = self.mappers_of_planes_from_grid(
-            grid=grid, settings_pixelization=settings_pixelization
+            grid=grid,
+            settings_pixelization=settings_pixelization,
+            plane_indexes=plane_indexes,
         )
 
+        mapper = mappers_of_planes[plane_indexes[0]]
+        regularization = self.regularizations_of_planes[plane_indexes[0]]
+
+        if inversion_cache is not None:
+            return inversion_cache.inversion_interferometer_from(
+                visibilities=visibilities,
+                noise_map=noise_map,
+                transformer=transformer,
+                mapper=mapper,
+                regularization=regularization,
+                settings=settings_inversion,
+            )
+
         return inv.AbstractInversionInterferometer.from_data_mapper_and_regularization(
             visibilities=visibilities,
             noise_map=noise_map,
             transformer=transformer,
-            mapper=mappers_of_planes[-1],
-            regularization=self.regularizations_of_planes[-1],
+            mapper=mapper,
+            regularization=regularization,
             settings=settings_inversion,
         )
 
@@ -724,28 +1322,41 @@ class AbstractTracerData(AbstractTracerLensing, ABC):
         self, grid, transformer
     ) -> {g.Galaxy: np.ndarray}:
         """
-        A dictionary associating galaxies with their corresponding model images
+        A dictionary associating galaxies with their corresponding model visibilities, where the images of every
+        galaxy are transformed together (see `transformer_util.visibilities_of_images_from`).
         """
 
-        galaxy_profile_visibilities_image_dict = dict()
-
         traced_grids_of_planes = self.traced_grids_of_planes_from_grid(grid=grid)
 
+        galaxies = []
+        images_of_galaxies = []
+
         for (plane_index, plane) in enumerate(self.planes):
-            profile_visibilities_of_galaxies = plane.profile_visibilities_of_galaxies_from_grid_and_transformer(
-                grid=traced_grids_of_planes[plane_index], transformer=transformer
+            galaxies += plane.galaxies
+            images_of_galaxies += plane.images_of_galaxies_from_grid(
+                grid=traced_grids_of_planes[plane_index]
             )
-            for (galaxy_index, galaxy) in enumerate(plane.galaxies):
-                galaxy_profile_visibilities_image_dict[
-                    galaxy
-                ] = profile_visibilities_of_galaxies[galaxy_index]
 
-        return galaxy_profile_visibilities_image_dict
+        profile_visibilities_of_galaxies = transformer_util.visibilities_of_images_from(
+            images=images_of_galaxies, transformer=transformer
+        )
+
+        return dict(zip(galaxies, profile_visibilities_of_galaxies))
 
 
 class Tracer(AbstractTracerData):
     @classmethod
-    def from_galaxies(cls, galaxies, cosmology=cosmo.Planck15):
+    def from_galaxies(
+        cls,
+        galaxies,
+        cosmology=cosmo.Planck15,
+        tree_deflections=None,
+        interpolated_deflections=None,
+        threaded_evaluation=None,
+        tiled_evaluation=None,
+        adaptive_supersampling=None,
+        light_profile_culling=None,
+    ):
 
         plane_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=galaxies)
 
@@ -758,7 +1369,16 @@ class Tracer(AbstractTracerData):
         for plane_index in range(0, len(plane_redshifts)):
             planes.append(pl.Plane(galaxies=galaxies_in_planes[plane_index]))
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            tree_deflections=tree_deflections,
+            interpolated_deflections=interpolated_deflections,
+            threaded_evaluation=threaded_evaluation,
+            tiled_evaluation=tiled_evaluation,
+            adaptive_supersampling=adaptive_supersampling,
+            light_profile_culling=light_profile_culling,
+        )
 
     @classmethod
     def sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
@@ -768,6 +1388,12 @@ class Tracer(AbstractTracerData):
         source_galaxies,
         planes_between_lenses,
         cosmology=cosmo.Planck15,
+        tree_deflections=None,
+        interpolated_deflections=None,
+        threaded_evaluation=None,
+        tiled_evaluation=None,
+        adaptive_supersampling=None,
+        light_profile_culling=None,
     ):
 
         """Ray-tracer for a lens system with any number of planes.
@@ -795,6 +1421,21 @@ class Tracer(AbstractTracerData):
             source-plane borders.
         cosmology : astropy.cosmology
             The cosmology of the ray-tracing calculation.
+        tree_deflections : TreeDeflections
+            If input, the deflection angles of planes with many mass profiles (e.g. line-of-sight halos) are \
+            computed using this tree-code.
+        interpolated_deflections : InterpolatedDeflections
+            If input, the deflection angles of every plane are interpolated from a coarse grid.
+        threaded_evaluation : ThreadedEvaluation
+            If input, the deflection angles and images of the profiles of every plane are evaluated on a pool of \
+            threads.
+        tiled_evaluation : TiledEvaluation
+            If input, the image of the tracer is computed by ray-tracing tiles of the grid one at a time.
+        adaptive_supersampling : AdaptiveSupersampling
+            If input, the image of the tracer is computed by supersampling every pixel at the sub-size its \
+            ray-tracing requires.
+        light_profile_culling : LightProfileCulling
+            If input, the light profiles of every plane are only evaluated where their intensity is not negligible.
         """
 
         lens_redshifts = plane_util.ordered_plane_redshifts_from(galaxies=lens_galaxies)
@@ -823,4 +1464,13 @@ class Tracer(AbstractTracerData):
                 )
             )
 
-        return Tracer(planes=planes, cosmology=cosmology)
+        return Tracer(
+            planes=planes,
+            cosmology=cosmology,
+            tree_deflections=tree_deflections,
+            interpolated_deflections=interpolated_deflections,
+            threaded_evaluation=threaded_evaluation,
+            tiled_evaluation=tiled_evaluation,
+            adaptive_supersampling=adaptive_supersampling,
+            light_profile_culling=light_profile_culling,
+        )
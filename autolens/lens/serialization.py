@@ -0,0 +1,419 @@
+import base64
+from functools import lru_cache
+import importlib
+import inspect
+import json
+import numpy as np
+from os import path
+from astropy import cosmology as cosmo
+from autoarray.mask import mask_2d as msk
+from autoarray.structures import arrays
+from autogalaxy.galaxy import galaxy as g
+from autogalaxy.plane import plane as pl
+
+from autolens import exc
+
+SERIALIZATION_VERSION = 1
+
+
+class TracerSerializer:
+    def __init__(self):
+        """
+        Serializes a `Tracer` to a compact, versioned pair of files, as opposed to pickling its object graph:
+
+        - `{filename}.json` describes the tracer: the class and constructor arguments of every galaxy's profiles,
+          pixelization, regularization and hyper galaxy, every galaxy's redshift, the planes, the cosmology and the
+          tracer's evaluation strategies (e.g. `TreeDeflections`).
+
+        - `{filename}.npy` contains the values of every array attached to a galaxy (e.g. its hyper images),
+          concatenated into one flat array, whose masks are bit-packed in the `.json` file. Arrays shared by galaxies
+          (e.g. the hyper model image) are stored once.
+
+        When a tracer is loaded, the values of the `.npy` file are memory-mapped (using the offset of its header stored
+        in the `.json` file) and every array is a view of them, such that the hyper images are only read from disk
+        when (and if) they are used.
+
+        An object is described by the arguments of its class's constructor, which must all be attributes of the
+        object. If they are not (e.g. a `SphericalNFWMCRLudlow`, whose mass is converted to the parameters of a
+        `SphericalNFW`) the object is described by the nearest parent class whose constructor arguments are, which
+        is an identical profile.
+        """
+        self.values = []
+        self.total_values = 0
+        self.array_ids = {}
+        self.mask_ids = {}
+        self.masks = []
+
+    def tracer_dict_from(self, tracer):
+        return {
+            "version": SERIALIZATION_VERSION,
+            "type": class_path_from(cls=tracer.__class__),
+            "cosmology": cosmology_dict_from(cosmology=tracer.cosmology),
+            "planes": [
+                {
+                    "redshift": json_value_from(value=plane.redshift),
+                    "galaxies": [
+                        self.galaxy_dict_from(galaxy=galaxy)
+                        for galaxy in plane.galaxies
+                    ],
+                }
+                for plane in tracer.planes
+            ],
+            "strategies": {
+                name: object_dict_from(obj=strategy)
+                for name, strategy in tracer.strategies.items()
+            },
+            "masks": self.masks,
+        }
+
+    def galaxy_dict_from(self, galaxy):
+
+        galaxy_dict = {}
+
+        for key, value in galaxy.__dict__.items():
+
+            if key == "id":
+                continue
+
+            if isinstance(value, np.ndarray):
+                galaxy_dict[key] = {"array": self.array_dict_from(array=value)}
+            elif is_object(value=value):
+                galaxy_dict[key] = object_dict_from(obj=value)
+            else:
+                galaxy_dict[key] = json_value_from(value=value)
+
+        return galaxy_dict
+
+    def array_dict_from(self, array):
+
+        if id(array) in self.array_ids:
+            return self.array_ids[id(array)]
+
+        array_dict = {
+            "offset": self.values_offset_from(values=np.asarray(array)),
+            "shape": list(array.shape),
+            "dtype": str(array.dtype),
+            "mask": None,
+        }
+
+        if isinstance(array, arrays.Array):
+            array_dict["mask"] = self.mask_index_from(mask=array.mask)
+
+        self.array_ids[id(array)] = array_dict
+
+        return array_dict
+
+    def mask_index_from(self, mask):
+
+        if id(mask) not in self.mask_ids:
+
+            self.mask_ids[id(mask)] = len(self.masks)
+
+            self.masks.append(
+                {
+                    "mask": base64.b64encode(
+                        np.packbits(np.asarray(mask, dtype="bool"))
+                    ).decode("ascii"),
+                    "shape": list(mask.shape),
+                    "pixel_scales": list(mask.pixel_scales),
+                    "sub_size": mask.sub_size,
+                    "origin": list(mask.origin),
+                }
+            )
+
+        return self.mask_ids[id(mask)]
+
+    def values_offset_from(self, values):
+
+        offset = self.total_values
+
+        self.values.append(values.astype("float64").ravel())
+        self.total_values += values.size
+
+        return offset
+
+    def save(self, tracer, file_path, filename="tracer"):
+
+        tracer_dict = self.tracer_dict_from(tracer=tracer)
+
+        tracer_dict["values"] = None
+
+        if self.total_values > 0:
+
+            with open(path.join(file_path, f"{filename}.npy"), "wb") as f:
+
+                np.save(f, np.concatenate(self.values))
+
+                tracer_dict["values"] = {
+                    "offset": f.tell() - 8 * self.total_values,
+                    "size": self.total_values,
+                }
+
+        with open(path.join(file_path, f"{filename}.json"), "w") as f:
+            json.dump(tracer_dict, f)
+
+
+class TracerDeserializer:
+    def __init__(self, values=None):
+        """
+        Creates a `Tracer` from the files output by a `TracerSerializer`, where the values of its arrays are views
+        of the (memory-mapped) flat array of values.
+        """
+        self.values = values
+        self.arrays = {}
+        self.mask_dicts = []
+        self.masks = {}
+
+    @classmethod
+    def load(cls, file_path, filename="tracer"):
+
+        with open(path.join(file_path, f"{filename}.json"), "r") as f:
+            tracer_dict = json.load(f)
+
+        values = None
+
+        if tracer_dict.get("values") is not None:
+
+            values = np.memmap(
+                path.join(file_path, f"{filename}.npy"),
+                dtype="float64",
+                mode="r",
+                offset=tracer_dict["values"]["offset"],
+                shape=(tracer_dict["values"]["size"],),
+            )
+
+        return cls(values=values).tracer_from(tracer_dict=tracer_dict)
+
+    def tracer_from(self, tracer_dict):
+
+        if tracer_dict["version"] > SERIALIZATION_VERSION:
+            raise exc.SerializationException(
+                f"The tracer was serialized with version {tracer_dict['version']}, which is newer than the "
+                f"supported version {SERIALIZATION_VERSION}."
+            )
+
+        self.mask_dicts = tracer_dict["masks"]
+
+        planes = [
+            pl.Plane(
+                redshift=plane_dict["redshift"],
+                galaxies=[
+                    self.galaxy_from(galaxy_dict=galaxy_dict)
+                    for galaxy_dict in plane_dict["galaxies"]
+                ],
+            )
+            for plane_dict in tracer_dict["planes"]
+        ]
+
+        tracer_class = class_from(class_path=tracer_dict["type"])
+
+        strategies = {
+            name: object_from(object_dict=tracer_dict["strategies"].get(name))
+            for name in tracer_class.strategy_names
+        }
+
+        return tracer_class(
+            planes=planes,
+            cosmology=cosmology_from(cosmology_dict=tracer_dict["cosmology"]),
+            **strategies,
+        )
+
+    def galaxy_from(self, galaxy_dict):
+
+        galaxy_arrays = {}
+        galaxy_kwargs = {}
+
+        for key, value in galaxy_dict.items():
+
+            if isinstance(value, dict) and "array" in value:
+                galaxy_arrays[key] = self.array_from(array_dict=value["array"])
+            elif isinstance(value, dict):
+                galaxy_kwargs[key] = object_from(object_dict=value)
+            else:
+                galaxy_kwargs[key] = python_value_from(value=value)
+
+        galaxy = g.Galaxy(**galaxy_kwargs)
+
+        for key, value in galaxy_arrays.items():
+            setattr(galaxy, key, value)
+
+        return galaxy
+
+    def values_from(self, offset, shape):
+        return self.values[offset : offset + int(np.prod(shape))].reshape(shape)
+
+    def array_from(self, array_dict):
+
+        if array_dict["offset"] in self.arrays:
+            return self.arrays[array_dict["offset"]]
+
+        values = self.values_from(
+            offset=array_dict["offset"], shape=array_dict["shape"]
+        )
+
+        if array_dict["dtype"] != "float64":
+            values = values.astype(array_dict["dtype"])
+
+        if array_dict["mask"] is not None:
+            values = arrays.Array(
+                array=values, mask=self.mask_from(index=array_dict["mask"])
+            )
+
+        self.arrays[array_dict["offset"]] = values
+
+        return values
+
+    def mask_from(self, index):
+
+        if index not in self.masks:
+
+            mask_dict = self.mask_dicts[index]
+
+            mask = np.unpackbits(
+                np.frombuffer(base64.b64decode(mask_dict["mask"]), dtype="uint8"),
+                count=int(np.prod(mask_dict["shape"])),
+            )
+
+            self.masks[index] = msk.Mask2D(
+                mask=mask.reshape(mask_dict["shape"]).astype("bool"),
+                pixel_scales=tuple(mask_dict["pixel_scales"]),
+                sub_size=mask_dict["sub_size"],
+                origin=tuple(mask_dict["origin"]),
+            )
+
+        return self.masks[index]
+
+
+def is_object(value):
+    return not isinstance(
+        value, (type(None), bool, int, float, str, tuple, list, np.generic)
+    )
+
+
+def json_value_from(value):
+    if isinstance(value, (tuple, list)):
+        return [json_value_from(value=item) for item in value]
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+def python_value_from(value):
+    if isinstance(value, list):
+        return tuple(python_value_from(value=item) for item in value)
+    return value
+
+
+def class_path_from(cls):
+    return f"{cls.__module__}.{cls.__name__}"
+
+
+@lru_cache(maxsize=None)
+def class_from(class_path):
+
+    module_name, class_name = class_path.rsplit(".", 1)
+
+    if not module_name.split(".")[0] in ("autolens", "autogalaxy", "autoarray"):
+        raise exc.SerializationException(
+            f"The class {class_path} is not a PyAutoLens, PyAutoGalaxy or PyAutoArray class."
+        )
+
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def constructor_arguments_from(cls):
+    return [
+        name
+        for name, parameter in inspect.signature(cls.__init__).parameters.items()
+        if name != "self"
+        and parameter.kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    ]
+
+
+def object_dict_from(obj):
+    """
+    Returns the class of an object and the values of the arguments of its constructor, using the nearest class of
+    its method resolution order whose constructor arguments are all attributes of the object.
+    """
+    if obj is None:
+        return None
+
+    for cls in obj.__class__.__mro__:
+
+        if cls is object:
+            break
+
+        argument_names = constructor_arguments_from(cls=cls)
+
+        if all(hasattr(obj, name) for name in argument_names):
+            return {
+                "type": class_path_from(cls=cls),
+                "arguments": {
+                    name: json_value_from(value=getattr(obj, name))
+                    for name in argument_names
+                },
+            }
+
+    raise exc.SerializationException(
+        f"The {obj.__class__.__name__} cannot be serialized, because the arguments of its constructor are not "
+        f"attributes."
+    )
+
+
+def object_from(object_dict):
+
+    if object_dict is None:
+        return None
+
+    return class_from(class_path=object_dict["type"])(
+        **{
+            name: python_value_from(value=value)
+            for name, value in object_dict["arguments"].items()
+        }
+    )
+
+
+def cosmology_dict_from(cosmology):
+    """
+    Returns a description of an astropy cosmology, which is its name if it is one of astropy's built-in cosmologies
+    (e.g. Planck15) or its class and parameters otherwise.
+    """
+    if cosmology.name in cosmo.parameters.available and cosmology is getattr(
+        cosmo, cosmology.name
+    ):
+        return {"name": cosmology.name}
+
+    arguments = {}
+
+    for name in constructor_arguments_from(cls=cosmology.__class__):
+
+        value = getattr(cosmology, name)
+
+        if hasattr(value, "value"):
+            value = value.value
+
+        arguments[name] = json_value_from(value=np.asarray(value).tolist())
+
+    return {"type": cosmology.__class__.__name__, "arguments": arguments}
+
+
+def cosmology_from(cosmology_dict):
+    """
+    Returns the astropy cosmology of a description output by `cosmology_dict_from`, where the cosmologies of
+    identical descriptions are the same (immutable) instance.
+    """
+    if "name" in cosmology_dict:
+        return getattr(cosmo, cosmology_dict["name"])
+
+    return cosmology_from_json(
+        cosmology_json=json.dumps(cosmology_dict, sort_keys=True)
+    )
+
+
+@lru_cache(maxsize=None)
+def cosmology_from_json(cosmology_json):
+
+    cosmology_dict = json.loads(cosmology_json)
+
+    return getattr(cosmo, cosmology_dict["type"])(**cosmology_dict["arguments"])
@@ -1,4 +1,5 @@
 from autoconf import conf
+from autoarray.inversion import pixelizations as pix, inversions as inv
 from autolens import exc
 from autolens.fit import fit_positions
 
@@ -89,3 +90,185 @@ class SettingsLens:
         settings = copy.copy(self)
         settings.positions_threshold = positions_threshold
         return settings
+
+
+class SettingsPixelization(pix.SettingsPixelization):
+    def __init__(
+        self,
+        use_border: bool = False,
+        pixel_limit: int = None,
+        is_stochastic: bool = False,
+        kmeans_seed: int = 0,
+        preload_sparse_grids_of_planes=None,
+        use_mini_batch_kmeans: bool = False,
+    ):
+        """
+        The settings of a pixelization, which extend those of *PyAutoArray* (see `autoarray.SettingsPixelization`
+        for a description of every other setting) with the k-means algorithm used to compute the sparse grids of
+        brightness-adaptive pixelizations.
+
+        Parameters
+        ----------
+        use_mini_batch_kmeans : bool
+            If `True`, the sparse grid of a `VoronoiBrightnessImage` pixelization is computed via mini-batch k-means
+            clustering (see `kmeans_cache.sparse_grid_via_mini_batch_kmeans_from`), which is faster than k-means
+            clustering for large grids.
+        """
+        super().__init__(
+            use_border=use_border,
+            pixel_limit=pixel_limit,
+            is_stochastic=is_stochastic,
+            kmeans_seed=kmeans_seed,
+            preload_sparse_grids_of_planes=preload_sparse_grids_of_planes,
+        )
+
+        self.use_mini_batch_kmeans = use_mini_batch_kmeans
+
+    @property
+    def tag(self):
+        return f"{super().tag[:-1]}{self.use_mini_batch_kmeans_tag}]"
+
+    @property
+    def use_mini_batch_kmeans_tag(self):
+        """Generate a tag for whether the sparse grids of brightness-adaptive pixelizations are computed using \
+        mini-batch k-means.
+
+        This changes the setup folder as follows (the example tags below are the default config tags):
+
+        use_mini_batch_kmeans = `False` -> settings
+        use_mini_batch_kmeans = `True` -> settings__mbkmeans
+        """
+        if not self.use_mini_batch_kmeans:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['pixelization']['mini_batch_kmeans']}"
+
+
+class SettingsInversion(inv.SettingsInversion):
+    def __init__(
+        self,
+        use_linear_operators=False,
+        use_preconditioner=False,
+        tolerance=1e-6,
+        maxiter=250,
+        check_solution=True,
+        use_inversion_cache=False,
+        use_iterative_solver=False,
+        log_det_tolerance=0.05,
+        log_det_max_probes=50,
+        log_det_lanczos_steps=10,
+        use_sparse_matrices=False,
+    ):
+        """
+        The settings of an inversion, which extend those of *PyAutoArray* (see `autoarray.SettingsInversion` for a
+        description of every other setting) with an iterative solver and sparse matrices for inversions performed
+        via an `InversionCache`.
+
+        Parameters
+        ----------
+        use_inversion_cache : bool
+            If `True`, every likelihood evaluation of a phase performs its inversion via the phase's `InversionCache`,
+            which reuses the quantities of the previous inversion which are unchanged (e.g. the curvature matrix, if
+            the mapping between image and source pixels is fixed, as in a hyper phase which only varies the
+            regularization). If the mapping changes every evaluation (e.g. a search over the mass model) the cache
+            cannot reuse anything and only adds the cost of comparing the cached matrices, so it is off by default.
+        use_iterative_solver : bool
+            If `True`, an inversion estimates the log determinant of its curvature regularization matrix via
+            stochastic Lanczos quadrature and solves for its reconstruction via the conjugate gradient method (to the
+            relative `tolerance`, in at most `maxiter` iterations), both relative to the matrix of an earlier
+            inversion, as opposed to computing its Cholesky factorisation (see `InversionCache`). The earlier
+            inversion is kept by the cache, so this requires `use_inversion_cache=True`. The log evidences it gives
+            are approximate and depend on the order models are evaluated in (see `log_det_tolerance`), with the
+            standard error of every inversion's log evidence reported as its `log_evidence_error`, so the
+            maximum likelihood model of a search should be re-fitted without it.
+        log_det_tolerance : float
+            The standard error of the estimated log determinant, above which the matrix is factorised exactly. The
+            log likelihood of an inversion is uncertain by about this amount (in nats), so it should be well below
+            the differences in log likelihood the non-linear search must resolve. The estimate is relative to the
+            matrix which was last factorised exactly, which depends on the order models were evaluated in, so
+            re-evaluating the same model can give a log likelihood which differs by up to about this amount.
+        log_det_max_probes : int
+            The maximum number of random probe vectors used to estimate the log determinant.
+        log_det_lanczos_steps : int
+            The number of Lanczos iterations performed for every probe vector.
+        use_sparse_matrices : bool
+            If `True`, the matrices of an imaging inversion are computed as sparse matrices and its curvature
+            regularization matrix is factorised via a sparse LU decomposition, such that the memory and run time of
+            an inversion scale with the number of non-zero entries of its matrices as opposed to the square and cube
+            of the number of source pixels. Interferometer inversions, whose curvature matrices are dense, are
+            unaffected.
+
+        A joint inversion of the source pixels of several planes always uses sparse blurred mapping matrices and an
+        exact block solve, so the inversion cache, iterative solver and sparse matrices have no effect on it.
+        """
+        if use_iterative_solver and not use_inversion_cache:
+            raise exc.SettingsException(
+                "The iterative solver requires the inversion cache (use_inversion_cache=True)"
+            )
+
+        if use_iterative_solver and use_sparse_matrices:
+            raise exc.SettingsException(
+                "The iterative solver and sparse matrices cannot both be used by an inversion"
+            )
+
+        super().__init__(
+            use_linear_operators=use_linear_operators,
+            use_preconditioner=use_preconditioner,
+            tolerance=tolerance,
+            maxiter=maxiter,
+            check_solution=check_solution,
+        )
+
+        self.use_inversion_cache = use_inversion_cache
+        self.use_iterative_solver = use_iterative_solver
+        self.log_det_tolerance = log_det_tolerance
+        self.log_det_max_probes = log_det_max_probes
+        self.log_det_lanczos_steps = log_det_lanczos_steps
+        self.use_sparse_matrices = use_sparse_matrices
+
+    @property
+    def tag(self):
+        return (
+            f"{super().tag[:-1]}"
+            f"{self.use_inversion_cache_tag}"
+            f"{self.use_iterative_solver_tag}"
+            f"{self.use_sparse_matrices_tag}]"
+        )
+
+    @property
+    def use_inversion_cache_tag(self):
+        """Generate a tag for whether the inversions of a phase use the inversion cache.
+
+        This changes the setup folder as follows (the example tags below are the default config tags):
+
+        use_inversion_cache = `False` -> settings
+        use_inversion_cache = `True` -> settings__cache
+        """
+        if not self.use_inversion_cache:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['inversion']['use_inversion_cache']}"
+
+    @property
+    def use_iterative_solver_tag(self):
+        """Generate a tag for whether inversions use the iterative solver.
+
+        This changes the setup folder as follows (the example tags below are the default config tags):
+
+        use_iterative_solver = `False` -> settings
+        use_iterative_solver = `True` -> settings__iter
+        """
+        if not self.use_iterative_solver:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['inversion']['use_iterative_solver']}"
+
+    @property
+    def use_sparse_matrices_tag(self):
+        """Generate a tag for whether inversions use sparse matrices.
+
+        This changes the setup folder as follows (the example tags below are the default config tags):
+
+        use_sparse_matrices = `False` -> settings
+        use_sparse_matrices = `True` -> settings__sparse
+        """
+        if not self.use_sparse_matrices:
+            return ""
+        return f"__{conf.instance['notation']['settings_tags']['inversion']['use_sparse_matrices']}"
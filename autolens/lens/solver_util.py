@@ -0,0 +1,405 @@
+import numpy as np
+from scipy import linalg, sparse
+from scipy.sparse import linalg as sparse_linalg
+
+from autoarray import exc
+
+
+def reconstruction_via_conjugate_gradient_from(
+    curvature_reg_matrix,
+    data_vector,
+    preconditioner_cholesky,
+    initial_reconstruction=None,
+    tolerance=1e-6,
+    maxiter=250,
+):
+    """
+    Solve for the reconstruction of an inversion via the preconditioned conjugate gradient method, where the
+    preconditioner is the Cholesky factorisation of a reference curvature regularization matrix (e.g. that of an
+    earlier inversion of a similar model).
+
+    The solver is warm-started from `initial_reconstruction` (e.g. the reconstruction of the previous inversion).
+    When fitting a model successive inversions are often similar, so both the preconditioner and the initial
+    reconstruction are close to the solution and few iterations are needed.
+
+    Returns the reconstruction, or `None` if the solver did not converge to the relative `tolerance` within
+    `maxiter` iterations.
+
+    Parameters
+    ----------
+    curvature_reg_matrix : np.ndarray
+        The curvature regularization matrix (F + H) of the inversion.
+    data_vector : np.ndarray
+        The data vector (D) of the inversion.
+    preconditioner_cholesky : (np.ndarray, bool)
+        The Cholesky factorisation (as returned by `scipy.linalg.cho_factor`) of the reference matrix.
+    initial_reconstruction : np.ndarray or None
+        The reconstruction the solver starts from, which is zero if `None`.
+    tolerance : float
+        The relative tolerance of the residual of the solution.
+    maxiter : int
+        The maximum number of iterations.
+    """
+    preconditioner = sparse_linalg.LinearOperator(
+        shape=curvature_reg_matrix.shape,
+        matvec=lambda vector: linalg.cho_solve(
+            preconditioner_cholesky, vector, check_finite=False
+        ),
+        dtype="float64",
+    )
+
+    if initial_reconstruction is not None:
+        if initial_reconstruction.shape != data_vector.shape:
+            initial_reconstruction = None
+
+    reconstruction, info = sparse_linalg.cg(
+        curvature_reg_matrix,
+        data_vector,
+        x0=initial_reconstruction,
+        tol=tolerance,
+        atol=0.0,
+        maxiter=maxiter,
+        M=preconditioner,
+    )
+
+    if info != 0:
+        return None
+
+    return reconstruction
+
+
+def sparse_lu_from(matrix):
+    """
+    The sparse LU decomposition of a sparse symmetric positive-definite matrix (e.g. the curvature regularization
+    matrix of an inversion whose matrices are sparse), which is used to solve linear systems of the matrix and to
+    compute its log determinant (see `log_determinant_from_sparse_lu`).
+
+    The rows and columns are reordered by the minimum degree ordering of the matrix's sparsity pattern, which reduces
+    the number of non-zero entries created during the decomposition, and pivots are taken from the diagonal, such
+    that the decomposition is equivalent to a sparse Cholesky decomposition. A non-positive pivot means the matrix is
+    not positive-definite, in which case an `InversionException` is raised.
+    """
+    try:
+        lu = sparse_linalg.splu(
+            sparse.csc_matrix(matrix),
+            permc_spec="MMD_AT_PLUS_A",
+            diag_pivot_thresh=0.0,
+            options=dict(SymmetricMode=True),
+        )
+    except RuntimeError:
+        raise exc.InversionException()
+
+    if np.any(lu.perm_r != lu.perm_c) or np.any(lu.U.diagonal() <= 0.0):
+        raise exc.InversionException()
+
+    return lu
+
+
+def log_determinant_from_sparse_lu(lu):
+    """
+    The log determinant of a positive-definite matrix from its sparse LU decomposition (see `sparse_lu_from`), which
+    is the sum of the logs of the diagonal of U.
+    """
+    return float(np.sum(np.log(lu.U.diagonal())))
+
+
+def log_determinant_via_sparse_lu_from(matrix):
+    """
+    The log determinant of a sparse positive-definite matrix (e.g. the regularization matrix of a pixelization, whose
+    only non-zero entries pair every pixel with its neighbors), computed from its sparse LU decomposition. This is
+    much faster than the dense Cholesky decomposition of `autoarray.inversions.log_determinant_of_matrix_cholesky`.
+    """
+    return log_determinant_from_sparse_lu(lu=sparse_lu_from(matrix=matrix))
+
+
+def block_cholesky_from(blocks):
+    """
+    The block Cholesky factorisation of a symmetric positive-definite matrix which is partitioned into blocks (e.g.
+    the joint curvature regularization matrix of an inversion of several planes, where every block pairs the pixels
+    of two planes).
+
+    `blocks[i][j]` is the block of rows i and columns j for every j <= i, where off-diagonal blocks which are zero
+    are `None`. The factorisation is performed via block elimination: the diagonal block of every row is updated
+    by the factors of the rows before it (its Schur complement) and factorised via a dense Cholesky decomposition,
+    and the blocks below it are then solved for. Blocks which couple nothing (e.g. those of planes whose images do
+    not overlap) are skipped, so planes which are independent of all others are factorised independently and the
+    joint matrix is never formed.
+
+    Returns the lower triangular factors, in the same layout as `blocks`, where `factors[i][i]` is a lower
+    triangular matrix and the factor of every zero off-diagonal block is `None`. An `InversionException` is raised
+    if the matrix is not positive-definite.
+    """
+    total_blocks = len(blocks)
+
+    factors = [[None] * total_blocks for _ in range(total_blocks)]
+
+    for k in range(total_blocks):
+
+        diagonal = np.array(blocks[k][k], dtype="float64")
+
+        for j in range(k):
+            if factors[k][j] is not None:
+                diagonal -= factors[k][j] @ factors[k][j].T
+
+        try:
+            lower = np.linalg.cholesky(diagonal)
+        except np.linalg.LinAlgError:
+            raise exc.InversionException()
+
+        factors[k][k] = lower
+
+        for i in range(k + 1, total_blocks):
+
+            block = None if blocks[i][k] is None else np.array(blocks[i][k])
+
+            for j in range(k):
+                if factors[i][j] is not None and factors[k][j] is not None:
+
+                    update = factors[i][j] @ factors[k][j].T
+                    block = -update if block is None else block - update
+
+            if block is not None:
+                factors[i][k] = linalg.solve_triangular(
+                    lower, block.T, lower=True, check_finite=False
+                ).T
+
+    return factors
+
+
+def log_determinant_from_block_cholesky(factors):
+    """
+    The log determinant of a matrix from its block Cholesky factorisation (see `block_cholesky_from`), which is
+    the sum of the log determinants of its diagonal factors.
+    """
+    return float(
+        sum(2.0 * np.sum(np.log(np.diag(factors[k][k]))) for k in range(len(factors)))
+    )
+
+
+def solution_via_block_cholesky_from(factors, vectors):
+    """
+    Solve the linear system of a matrix from its block Cholesky factorisation (see `block_cholesky_from`) via block
+    forward and back substitution, where `vectors` is the right-hand side split into the blocks of the matrix.
+
+    Returns the solution, split into the same blocks.
+    """
+    total_blocks = len(factors)
+
+    solutions = [None] * total_blocks
+
+    for k in range(total_blocks):
+
+        vector = np.array(vectors[k], dtype="float64")
+
+        for j in range(k):
+            if factors[k][j] is not None:
+                vector -= factors[k][j] @ solutions[j]
+
+        solutions[k] = linalg.solve_triangular(
+            factors[k][k], vector, lower=True, check_finite=False
+        )
+
+    for k in reversed(range(total_blocks)):
+
+        vector = solutions[k]
+
+        for i in range(k + 1, total_blocks):
+            if factors[i][k] is not None:
+                vector = vector - factors[i][k].T @ solutions[i]
+
+        solutions[k] = linalg.solve_triangular(
+            factors[k][k], vector, lower=True, trans=1, check_finite=False
+        )
+
+    return solutions
+
+
+def inverse_diagonal_block_via_block_cholesky_from(factors, index):
+    """
+    The diagonal block `index` of the inverse of a matrix from its block Cholesky factorisation (see
+    `block_cholesky_from`), e.g. the covariance of the reconstruction of one plane of a joint inversion, which is
+    marginalized over the reconstructions of every other plane.
+
+    For the factorisation A = L L^T the inverse is A^-1 = L^-T L^-1, so its diagonal block k is the sum of X_ik^T X_ik
+    over the blocks X_ik = (L^-1)_ik of block column k of L^-1, which are computed via block forward substitution.
+    Block columns of L^-1 which are zero (e.g. those of planes independent of the plane `index`) are skipped.
+    """
+    total_blocks = len(factors)
+
+    inverse_columns = [None] * total_blocks
+
+    inverse_columns[index] = linalg.solve_triangular(
+        factors[index][index],
+        np.eye(factors[index][index].shape[0]),
+        lower=True,
+        check_finite=False,
+    )
+
+    inverse_block = inverse_columns[index].T @ inverse_columns[index]
+
+    for i in range(index + 1, total_blocks):
+
+        column = None
+
+        for j in range(index, i):
+            if factors[i][j] is not None and inverse_columns[j] is not None:
+
+                update = factors[i][j] @ inverse_columns[j]
+                column = update if column is None else column + update
+
+        if column is not None:
+
+            inverse_columns[i] = -linalg.solve_triangular(
+                factors[i][i], column, lower=True, check_finite=False
+            )
+
+            inverse_block += inverse_columns[i].T @ inverse_columns[i]
+
+    return inverse_block
+
+
+def log_determinant_via_stochastic_lanczos_quadrature_from(
+    matrix,
+    reference_cholesky,
+    reference_log_det,
+    lanczos_steps=10,
+    tolerance=0.05,
+    max_probes=50,
+    probes_per_batch=10,
+    seed=1,
+):
+    """
+    An estimate of the log determinant of a positive-definite matrix A relative to that of a reference matrix
+    R = L L^T (e.g. the curvature regularization matrix of an earlier inversion of a similar model), computed using
+    stochastic Lanczos quadrature, which only requires products of A with vectors as opposed to its O(N^3) Cholesky
+    decomposition:
+
+    ln[det(A)] = ln[det(R)] + trace(ln[M]), where M = L^-1 A L^-T and trace(ln[M]) ~ mean(z^T ln[M] z)
+
+    Every random probe vector z (of entries -1 and 1) gives an unbiased estimate of the trace, where z^T ln[M] z is
+    evaluated by Gauss quadrature over the eigenvalues of the tridiagonal matrix of `lanczos_steps` Lanczos
+    iterations started from z. The closer A is to R, the closer M is to the identity matrix, such that fewer Lanczos
+    iterations and probes are needed for an accurate estimate.
+
+    Probes are added in batches of `probes_per_batch` (whose Lanczos iterations are performed together) until the
+    standard error of the estimate is below `tolerance`. If `max_probes` probes are not expected to reach this
+    tolerance (extrapolating the standard error of the probes so far) the estimate is abandoned and `None` is
+    returned, in which case the log determinant should be computed exactly. The probes are drawn using a fixed
+    `seed`, such that the estimate is a deterministic function of A and R.
+
+    Returns the estimate (or `None`) and its standard error.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        The positive-definite matrix A whose log determinant is estimated.
+    reference_cholesky : (np.ndarray, bool)
+        The Cholesky factorisation (as returned by `scipy.linalg.cho_factor`) of the reference matrix R.
+    reference_log_det : float
+        The log determinant of the reference matrix R.
+    lanczos_steps : int
+        The number of Lanczos iterations performed for every probe.
+    tolerance : float
+        The standard error below which no more probes are added.
+    max_probes : int
+        The maximum number of probes.
+    probes_per_batch : int
+        The number of probes added every batch.
+    seed : int
+        The seed of the random number generator the probes are drawn from.
+    """
+    lower, is_lower = reference_cholesky
+
+    def matrix_product_from(vectors):
+        vectors = linalg.solve_triangular(
+            lower, vectors, lower=is_lower, trans=0 if not is_lower else 1
+        )
+        return linalg.solve_triangular(
+            lower, matrix @ vectors, lower=is_lower, trans=1 if not is_lower else 0
+        )
+
+    pixels = matrix.shape[0]
+
+    random_state = np.random.RandomState(seed)
+
+    estimates = []
+
+    while True:
+
+        probes = random_state.choice([-1.0, 1.0], size=(pixels, probes_per_batch))
+
+        estimates += list(
+            pixels
+            * quadratic_forms_of_log_via_lanczos_from(
+                matrix_product_from=matrix_product_from,
+                vectors=probes / np.sqrt(pixels),
+                lanczos_steps=min(lanczos_steps, pixels),
+            )
+        )
+
+        standard_error = np.std(estimates, ddof=1) / np.sqrt(len(estimates))
+
+        if standard_error < tolerance:
+            return reference_log_det + np.mean(estimates), standard_error
+
+        if standard_error * np.sqrt(len(estimates) / max_probes) >= tolerance:
+            return None, standard_error
+
+
+def quadratic_forms_of_log_via_lanczos_from(
+    matrix_product_from, vectors, lanczos_steps
+):
+    """
+    The quadratic form v^T ln[M] v of every unit vector v in the columns of `vectors`, evaluated via Gauss
+    quadrature using the tridiagonal matrix of `lanczos_steps` Lanczos iterations of the matrix M started from v.
+
+    The Lanczos iterations of every vector are performed together, such that every iteration is one product of M
+    (computed by the function `matrix_product_from`) with a matrix of vectors. The iterations of a vector stop early
+    if its Krylov subspace is exhausted.
+    """
+    total_vectors = vectors.shape[1]
+
+    alphas = np.zeros((lanczos_steps, total_vectors))
+    betas = np.zeros((lanczos_steps, total_vectors))
+    steps = np.full(total_vectors, lanczos_steps)
+
+    vector = vectors.copy()
+    vector_previous = np.zeros_like(vectors)
+    beta = np.zeros(total_vectors)
+
+    for step in range(lanczos_steps):
+
+        w = matrix_product_from(vector) - beta * vector_previous
+
+        alpha = np.sum(vector * w, axis=0)
+        w -= alpha * vector
+
+        alphas[step] = alpha
+
+        beta = np.sqrt(np.sum(w * w, axis=0))
+        betas[step] = beta
+
+        breakdown = (beta < 1.0e-10) & (steps == lanczos_steps)
+        steps[breakdown] = step + 1
+
+        beta = np.where(beta < 1.0e-10, 1.0, beta)
+
+        vector_previous = vector
+        vector = w / beta
+
+    quadratic_forms = np.zeros(total_vectors)
+
+    for index in range(total_vectors):
+
+        total_steps = steps[index]
+
+        eigenvalues, eigenvectors = linalg.eigh_tridiagonal(
+            alphas[:total_steps, index], betas[: total_steps - 1, index]
+        )
+
+        if np.any(eigenvalues <= 0.0):
+            raise exc.InversionException()
+
+        quadratic_forms[index] = np.sum(eigenvectors[0] ** 2 * np.log(eigenvalues))
+
+    return quadratic_forms
@@ -0,0 +1,211 @@
+import numpy as np
+from scipy import sparse
+
+from autoarray.inversion import regularization as reg
+
+
+def mapping_matrix_sparse_from(mapper):
+    """
+    The mapping matrix of a mapper (see `autoarray.Mapper.mapping_matrix`) as a sparse matrix, which is computed
+    directly from the mappings between the sub-grid and pixelization, such that only its non-zero entries (one for
+    every sub-pixel) are stored and iterated over.
+    """
+    return sparse.csr_matrix(
+        (
+            np.full(
+                mapper.pixelization_1d_index_for_sub_mask_1d_index.shape[0],
+                mapper.grid.mask.sub_fraction,
+            ),
+            (
+                mapper._mask_1d_index_for_sub_mask_1d_index,
+                mapper.pixelization_1d_index_for_sub_mask_1d_index,
+            ),
+        ),
+        shape=(mapper.grid.mask.pixels_in_mask, mapper.pixels),
+    )
+
+
+def convolution_matrix_sparse_from(convolver):
+    """
+    The sparse matrix which convolves an image (of the masked pixels of a convolver) with the PSF kernel, such that
+    the product of this matrix and a mapping matrix is the blurred mapping matrix computed by
+    `autoarray.Convolver.convolve_mapping_matrix`.
+
+    Every column of the matrix is the kernel frame of an image pixel, which has at most as many entries as the
+    kernel, so the matrix has O(N) non-zero entries for N masked image pixels.
+    """
+    frame_1d_lengths = convolver.image_frame_1d_lengths
+
+    in_frame = (
+        np.arange(convolver.image_frame_1d_indexes.shape[1]) < frame_1d_lengths[:, None]
+    )
+
+    return sparse.csr_matrix(
+        (
+            convolver.image_frame_1d_kernels[in_frame],
+            (
+                convolver.image_frame_1d_indexes[in_frame],
+                np.repeat(np.arange(frame_1d_lengths.shape[0]), frame_1d_lengths),
+            ),
+        ),
+        shape=(frame_1d_lengths.shape[0], frame_1d_lengths.shape[0]),
+    )
+
+
+def curvature_matrix_sparse_from(blurred_mapping_matrix, noise_map):
+    """
+    The curvature matrix F = B^T W B of a sparse blurred mapping matrix B, where W is the diagonal matrix of inverse
+    noise-map variances, as a sparse matrix.
+
+    Only pairs of pixelization pixels whose blurred images overlap are non-zero, so for a PSF which is small
+    compared to the source this matrix is mostly zero.
+    """
+    return (
+        blurred_mapping_matrix.T
+        @ sparse.diags(1.0 / np.square(np.asarray(noise_map)))
+        @ blurred_mapping_matrix
+    ).tocsc()
+
+
+def data_vector_sparse_from(blurred_mapping_matrix, image, noise_map):
+    """
+    The data vector D = B^T W d of a sparse blurred mapping matrix B, where W is the diagonal matrix of inverse
+    noise-map variances and d the image.
+    """
+    return blurred_mapping_matrix.T @ (
+        np.asarray(image) / np.square(np.asarray(noise_map))
+    )
+
+
+def regularization_matrix_sparse_from(regularization, mapper):
+    """
+    The regularization matrix of a regularization scheme and mapper as a sparse matrix, which is non-zero only on
+    its diagonal and for every pair of neighboring pixels.
+
+    The `Constant` and `AdaptiveBrightness` schemes are computed directly from the pixel neighbors of the
+    pixelization, whereas every other scheme is computed as a dense matrix and converted.
+    """
+    pixelization_grid = mapper.pixelization_grid
+
+    if isinstance(regularization, reg.Constant):
+        return constant_regularization_matrix_sparse_from(
+            coefficient=regularization.coefficient,
+            pixel_neighbors=pixelization_grid.pixel_neighbors,
+            pixel_neighbors_size=pixelization_grid.pixel_neighbors_size,
+        )
+
+    if isinstance(regularization, reg.AdaptiveBrightness):
+        return weighted_regularization_matrix_sparse_from(
+            regularization_weights=regularization.regularization_weights_from_mapper(
+                mapper=mapper
+            ),
+            pixel_neighbors=pixelization_grid.pixel_neighbors,
+            pixel_neighbors_size=pixelization_grid.pixel_neighbors_size,
+        )
+
+    return sparse.csc_matrix(
+        regularization.regularization_matrix_from_mapper(mapper=mapper)
+    )
+
+
+def neighbor_pairs_from(pixel_neighbors, pixel_neighbors_size):
+    """
+    The indexes (i, j) of every pixel i and each of its neighbors j, in the order they are iterated over by the
+    regularization matrix functions of `autoarray.util.regularization_util`.
+    """
+    pixel_neighbors = np.asarray(pixel_neighbors)
+    pixel_neighbors_size = np.asarray(pixel_neighbors_size)
+
+    is_neighbor = np.arange(pixel_neighbors.shape[1]) < pixel_neighbors_size[:, None]
+
+    return (
+        np.repeat(np.arange(pixel_neighbors.shape[0]), pixel_neighbors_size),
+        pixel_neighbors[is_neighbor],
+    )
+
+
+def constant_regularization_matrix_sparse_from(
+    coefficient, pixel_neighbors, pixel_neighbors_size
+):
+    """
+    The sparse regularization matrix of the constant regularization scheme, which is the same as
+    `regularization_util.constant_regularization_matrix_from`.
+    """
+    pixels = len(pixel_neighbors)
+
+    regularization_coefficient = coefficient ** 2.0
+
+    pixel_indexes, neighbor_indexes = neighbor_pairs_from(
+        pixel_neighbors=pixel_neighbors, pixel_neighbors_size=pixel_neighbors_size
+    )
+
+    return sparse.csc_matrix(
+        (
+            np.concatenate(
+                (
+                    1e-8
+                    + regularization_coefficient * np.asarray(pixel_neighbors_size),
+                    np.full(pixel_indexes.shape[0], -regularization_coefficient),
+                )
+            ),
+            (
+                np.concatenate((np.arange(pixels), pixel_indexes)),
+                np.concatenate((np.arange(pixels), neighbor_indexes)),
+            ),
+        ),
+        shape=(pixels, pixels),
+    )
+
+
+def weighted_regularization_matrix_sparse_from(
+    regularization_weights, pixel_neighbors, pixel_neighbors_size
+):
+    """
+    The sparse regularization matrix of the weighted regularization scheme, which is the same as
+    `regularization_util.weighted_regularization_matrix_from` (where duplicate entries are summed in a different
+    order, so the two are equal up to numerical precision).
+    """
+    pixels = len(regularization_weights)
+
+    regularization_weight = np.asarray(regularization_weights) ** 2.0
+
+    pixel_indexes, neighbor_indexes = neighbor_pairs_from(
+        pixel_neighbors=pixel_neighbors, pixel_neighbors_size=pixel_neighbors_size
+    )
+
+    neighbor_weights = regularization_weight[neighbor_indexes]
+
+    return sparse.csc_matrix(
+        (
+            np.concatenate(
+                (
+                    np.full(pixels, 1e-8),
+                    neighbor_weights,
+                    neighbor_weights,
+                    -neighbor_weights,
+                    -neighbor_weights,
+                )
+            ),
+            (
+                np.concatenate(
+                    (
+                        np.arange(pixels),
+                        pixel_indexes,
+                        neighbor_indexes,
+                        pixel_indexes,
+                        neighbor_indexes,
+                    )
+                ),
+                np.concatenate(
+                    (
+                        np.arange(pixels),
+                        pixel_indexes,
+                        neighbor_indexes,
+                        neighbor_indexes,
+                        pixel_indexes,
+                    )
+                ),
+            ),
+        ),
+        shape=(pixels, pixels),
+    )
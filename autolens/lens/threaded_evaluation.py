@@ -0,0 +1,134 @@
+from concurrent import futures
+import numpy as np
+import os
+import threading
+
+_executors = {}
+_executors_lock = threading.Lock()
+
+
+def shared_executor_from(name, number_of_threads):
+    """
+    Returns the thread pool of `number_of_threads` threads shared by every instance of an evaluation strategy
+    (labelled by `name`), which is created when it is first used and shut down when the interpreter exits.
+
+    Sharing one pool per process, as opposed to one per instance, means the copies of a strategy made for every model
+    instance of a non-linear search do not each leave a pool of idle threads behind. Pools are per process, so a
+    process forked after a pool was created (e.g. a parallel search) creates its own. Strategies which are nested (e.g.
+    a `ThreadedEvaluation` evaluated within the tiles of a `TiledEvaluation`) use different names, such that a
+    thread of one never waits on tasks queued behind it on the same pool.
+    """
+    key = (os.getpid(), name, number_of_threads)
+
+    with _executors_lock:
+        if key not in _executors:
+            _executors[key] = futures.ThreadPoolExecutor(max_workers=number_of_threads)
+        return _executors[key]
+
+
+class ThreadedEvaluation:
+    def __init__(self, number_of_threads: int = None, minimum_profiles: int = 2):
+        """
+        Evaluates the deflection angles and images of the profiles of a plane on a pool of threads, as opposed to
+        summing every galaxy and profile of the plane one after another.
+
+        NumPy releases the GIL for most array operations on large grids, so the light and mass profiles of a plane
+        (e.g. a lens galaxy's bulge, disk, dark matter halo and external shear, plus any subhalos) can be evaluated
+        concurrently by threads of a single process, which has none of the start-up and data-transfer overhead of
+        parallelizing a fit over processes.
+
+        The profile values computed by the threads are reduced in the same order as the serial calculation (the
+        profiles of every galaxy are summed in order, followed by the galaxies of the plane), so the deflection
+        angles and images are bit-for-bit identical to those computed without threading.
+
+        Parameters
+        ----------
+        number_of_threads : int
+            The number of threads profiles are evaluated on, where `None` uses the number of CPUs of the machine.
+        minimum_profiles : int
+            Planes with fewer light (or mass) profiles than this evaluate their images (or deflection angles)
+            serially.
+        """
+        self.number_of_threads = number_of_threads or os.cpu_count() or 1
+        self.minimum_profiles = minimum_profiles
+
+    @property
+    def executor(self):
+        return shared_executor_from(
+            name="threaded_evaluation", number_of_threads=self.number_of_threads
+        )
+
+    def is_used_for_profiles(self, total_profiles):
+        return self.number_of_threads > 1 and total_profiles >= self.minimum_profiles
+
+    def is_used_for_plane_deflections(self, plane):
+        return self.is_used_for_profiles(total_profiles=len(plane.mass_profiles))
+
+    def is_used_for_plane_image(self, plane):
+        return self.is_used_for_profiles(
+            total_profiles=sum(len(galaxy.light_profiles) for galaxy in plane.galaxies)
+        )
+
+    def deflections_from_plane_and_grid(self, plane, grid):
+        """
+        Returns the deflection angles of every mass profile of a plane summed on a grid, with every mass profile's
+        deflection angles evaluated on the thread pool.
+        """
+        return self.summed_values_from_galaxies(
+            galaxies=plane.galaxies,
+            profiles_of_galaxy=lambda galaxy: galaxy.mass_profiles,
+            func=lambda profile: profile.deflections_from_grid(grid=grid),
+            zeros=lambda: np.zeros(shape=(grid.shape[0], 2)),
+        )
+
+    def image_from_plane_and_grid(self, plane, grid, image_func=None):
+        """
+        Returns the image of every light profile of a plane summed on a grid, with every light profile's image
+        evaluated on the thread pool.
+
+        If input, `image_func(light_profile, grid)` computes the image of every light profile, as opposed to its
+        `image_from_grid` method.
+        """
+        if image_func is None:
+            image_func = lambda light_profile, grid: light_profile.image_from_grid(
+                grid=grid
+            )
+
+        return self.summed_values_from_galaxies(
+            galaxies=plane.galaxies,
+            profiles_of_galaxy=lambda galaxy: galaxy.light_profiles,
+            func=lambda profile: image_func(profile, grid),
+            zeros=lambda: np.zeros(shape=(grid.shape[0],)),
+        )
+
+    def summed_values_from_galaxies(self, galaxies, profiles_of_galaxy, func, zeros):
+        """
+        Evaluate a function of every profile of a list of galaxies on the thread pool and sum the values of each
+        galaxy's profiles and then of the galaxies, in the order they are listed.
+
+        A galaxy without profiles contributes an array of zeros (from the `zeros` function), as it does when its
+        values are computed serially.
+        """
+        if not galaxies:
+            return zeros()
+
+        profiles_of_galaxies = [profiles_of_galaxy(galaxy) for galaxy in galaxies]
+
+        values = list(
+            self.executor.map(
+                func,
+                [profile for profiles in profiles_of_galaxies for profile in profiles],
+            )
+        )
+
+        values_of_galaxies = []
+
+        for profiles in profiles_of_galaxies:
+
+            if profiles:
+                values_of_galaxies.append(sum(values[: len(profiles)]))
+                values = values[len(profiles) :]
+            else:
+                values_of_galaxies.append(zeros())
+
+        return sum(values_of_galaxies)
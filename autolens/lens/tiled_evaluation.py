@@ -0,0 +1,102 @@
+import numpy as np
+
+from autolens.lens import threaded_evaluation
+
+
+class TiledEvaluation:
+    def __init__(
+        self,
+        memory_budget_mb: float = 1024.0,
+        number_of_threads: int = 1,
+        bytes_per_coordinate_per_plane: int = 128,
+    ):
+        """
+        Evaluates the image of a tracer on a grid in tiles, where every tile is a contiguous slice of the (sub-)grid
+        that is ray-traced through every plane and has its light profiles evaluated independently of the others.
+
+        Computing the image of a large grid (e.g. a wide-field simulation of a cluster) in one go stores the traced
+        grid of every plane, the deflection angles of every plane with mass and the temporary arrays of every
+        profile evaluation for every coordinate of the grid at once, which for a 4000 x 4000 grid with a sub_size of 4
+        is many gigabytes. Tiling bounds the memory used to that of one tile per thread, with only the image of the
+        full grid stored.
+
+        The size of a tile is the number of coordinates whose ray-tracing is estimated to fit within the memory budget,
+        using an estimate of the memory used per coordinate and plane. Tiles are independent, so the image is
+        identical to evaluating the grid in one go irrespective of the tiling or number of threads, including when
+        the tracer has `InterpolatedDeflections` (whose cells are aligned to multiples of their pixel scale, so are
+        the same for every tile) provided every tile has more coordinates than its coarse grid.
+
+        The exception is a tracer with `TreeDeflections`, which builds the tree of every tile's traced coordinates
+        separately, as building the tree of the full grid would require ray-tracing the full grid at once. The
+        deflections of a tile then differ from those of the full grid by up to the expansion error of the tree-code
+        (which scales as its `opening_angle`**3), as opposed to being identical.
+
+        Parameters
+        ----------
+        memory_budget_mb : float
+            The memory (in megabytes) the ray-tracing and light profile evaluation of all tiles evaluated at once (one
+            per thread) is estimated to use.
+        number_of_threads : int
+            The number of threads tiles are evaluated on.
+        bytes_per_coordinate_per_plane : int
+            The estimated number of bytes used to ray-trace one coordinate through one plane and evaluate the plane's
+            profiles at that coordinate (its traced grid, deflection angles, image and profile temporaries).
+        """
+        self.memory_budget_mb = memory_budget_mb
+        self.number_of_threads = number_of_threads
+        self.bytes_per_coordinate_per_plane = bytes_per_coordinate_per_plane
+
+    @property
+    def executor(self):
+        return threaded_evaluation.shared_executor_from(
+            name="tiled_evaluation", number_of_threads=self.number_of_threads
+        )
+
+    def tile_size_from_total_planes(self, total_planes):
+        """
+        The number of coordinates in a tile, such that one tile per thread ray-traced through `total_planes` planes
+        fits within the memory budget.
+        """
+        tile_bytes = 1.0e6 * self.memory_budget_mb / self.number_of_threads
+
+        return max(
+            1, int(tile_bytes / (self.bytes_per_coordinate_per_plane * total_planes))
+        )
+
+    def tile_slices_from(self, total_coordinates, total_planes):
+        tile_size = self.tile_size_from_total_planes(total_planes=total_planes)
+
+        return [
+            slice(start, min(start + tile_size, total_coordinates))
+            for start in range(0, total_coordinates, tile_size)
+        ]
+
+    def is_used_for_grid(self, grid, total_planes):
+        return np.shape(grid)[0] > self.tile_size_from_total_planes(
+            total_planes=total_planes
+        )
+
+    def image_from_func_and_grid(self, func, grid, total_planes):
+        """
+        Returns the image of a function, which computes an image on an ndarray of (y,x) coordinates of shape
+        [total_coordinates, 2], on a grid by evaluating it on every tile of the grid. The image is returned as an
+        ndarray of shape [total_coordinates].
+        """
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        image = np.zeros(shape=grid.shape[0])
+
+        def evaluate_tile(tile):
+            image[tile] = func(grid[tile])
+
+        tile_slices = self.tile_slices_from(
+            total_coordinates=grid.shape[0], total_planes=total_planes
+        )
+
+        if self.number_of_threads > 1:
+            list(self.executor.map(evaluate_tile, tile_slices))
+        else:
+            for tile in tile_slices:
+                evaluate_tile(tile)
+
+        return image
@@ -0,0 +1,61 @@
+class TracedGrids:
+    def __init__(self, tracer, grid, traced_grids_of_planes, deflections_of_planes):
+        """
+        The result of ray-tracing a grid through every plane of a tracer, which stores the traced grid and
+        deflection angles of every plane (see `Tracer.traced_grids_from_grid`).
+
+        The grid at any redshift (e.g. for line-of-sight or time-delay calculations) is computed from the stored
+        deflection angles of every plane in front of that redshift, scaled by the tracer's scaling factors to that
+        redshift, such that no mass profile is evaluated again.
+
+        Parameters
+        ----------
+        tracer : Tracer
+            The tracer the grid was ray-traced through.
+        grid : aa.Grid or ndarray
+            The image-plane grid of (y,x) arc-second coordinates which was ray-traced.
+        traced_grids_of_planes : [aa.Grid or ndarray]
+            The traced grid of every plane of the tracer.
+        deflections_of_planes : [ndarray or None]
+            The deflection angles of every plane of the tracer, computed on its traced grid, or `None` for planes
+            without a mass profile.
+        """
+        self.tracer = tracer
+        self.grid = grid
+        self.traced_grids_of_planes = traced_grids_of_planes
+        self.deflections_of_planes = deflections_of_planes
+
+    def grid_at_redshift_from_redshift(self, redshift):
+        """
+        The grid ray-traced to any redshift, including redshifts without a plane and redshifts in front of the first
+        plane (where it is the image-plane grid) or behind the last plane.
+
+        Parameters
+        ----------
+        redshift : float
+            The redshift the image-plane grid is traced to.
+        """
+        plane_redshifts = self.tracer.plane_redshifts
+
+        if redshift <= plane_redshifts[0]:
+            return self.grid.copy()
+
+        if redshift in plane_redshifts:
+            return self.traced_grids_of_planes[plane_redshifts.index(redshift)]
+
+        scaling_factors = self.tracer.scaling_factors_to_redshift_from_redshift(
+            redshift=redshift
+        )
+
+        grid_at_redshift = self.grid.copy()
+
+        for deflections, scaling_factor in zip(
+            self.deflections_of_planes, scaling_factors
+        ):
+
+            if deflections is None or scaling_factor is None:
+                continue
+
+            grid_at_redshift -= scaling_factor * deflections
+
+        return grid_at_redshift
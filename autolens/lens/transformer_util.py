@@ -0,0 +1,157 @@
+import numpy as np
+
+from autoarray.operators import transformer as trans
+from autoarray.structures import visibilities as vis
+from autolens import decorator_util
+
+
+@decorator_util.jit()
+def visibilities_of_images_via_preload_jit_from(
+    images_1d, preloaded_reals, preloaded_imags
+):
+    """
+    The direct Fourier transform of every image in `images_1d` (of shape [total_images, total_image_pixels]), which
+    reads every preloaded cosine and sine term once for all images, as opposed to once per image.
+
+    The visibilities of every image are identical to those of
+    `autoarray.util.transformer_util.visibilities_via_preload_jit_from`.
+    """
+    visibilities = 0 + 0j * np.zeros(
+        shape=(images_1d.shape[0], preloaded_reals.shape[1])
+    )
+
+    for image_1d_index in range(images_1d.shape[1]):
+        for vis_1d_index in range(preloaded_reals.shape[1]):
+
+            preloaded_real = preloaded_reals[image_1d_index, vis_1d_index]
+            preloaded_imag = preloaded_imags[image_1d_index, vis_1d_index]
+
+            for image_index in range(images_1d.shape[0]):
+
+                vis_real = images_1d[image_index, image_1d_index] * preloaded_real
+                vis_imag = images_1d[image_index, image_1d_index] * preloaded_imag
+                visibilities[image_index, vis_1d_index] += vis_real + 1j * vis_imag
+
+    return visibilities
+
+
+@decorator_util.jit()
+def visibilities_of_images_jit_from(images_1d, grid_radians, uv_wavelengths):
+    """
+    The direct Fourier transform of every image in `images_1d` (of shape [total_images, total_image_pixels]), which
+    computes the cosine and sine terms of every (image-pixel, visibility) pair once for all images, as opposed to
+    once per image.
+
+    The visibilities of every image are identical to those of `autoarray.util.transformer_util.visibilities_jit`.
+    """
+    visibilities = 0 + 0j * np.zeros(
+        shape=(images_1d.shape[0], uv_wavelengths.shape[0])
+    )
+
+    for image_1d_index in range(images_1d.shape[1]):
+        for vis_1d_index in range(uv_wavelengths.shape[0]):
+
+            cos_term = np.cos(
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+            sin_term = np.sin(
+                -2.0
+                * np.pi
+                * (
+                    grid_radians[image_1d_index, 1] * uv_wavelengths[vis_1d_index, 0]
+                    + grid_radians[image_1d_index, 0] * uv_wavelengths[vis_1d_index, 1]
+                )
+            )
+
+            for image_index in range(images_1d.shape[0]):
+
+                vis_real = images_1d[image_index, image_1d_index] * cos_term
+                vis_imag = images_1d[image_index, image_1d_index] * sin_term
+                visibilities[image_index, vis_1d_index] += vis_real + 1j * vis_imag
+
+    return visibilities
+
+
+def visibilities_of_images_from(images, transformer):
+    """
+    The visibilities of every image in a list (e.g. the image of every plane or galaxy of a tracer), which exploits
+    the linearity of the Fourier transform to avoid a full transform per image:
+
+    - Images which are all zeros (e.g. a plane without light profiles) have zero visibilities and are not
+      transformed.
+
+    - For a `TransformerDFT`, the remaining images are stacked and transformed together in one pass over the
+      (image-pixel, visibility) pairs, such that the cosine and sine terms of the transform are computed (or read
+      from the preloaded transforms) once, instead of once per image.
+
+    - Other transformers (e.g. `TransformerNUFFT`, whose cost is dominated by its FFT) transform every remaining
+      image separately.
+
+    The visibilities of every image are identical to those of `transformer.visibilities_from_image`.
+
+    Parameters
+    ----------
+    images : [aa.Array or ndarray]
+        The images whose visibilities are computed.
+    transformer : TransformerDFT or TransformerNUFFT
+        The transformer which maps an image to the uv-plane.
+    """
+    visibilities_of_images = [None] * len(images)
+
+    image_indexes = []
+
+    for image_index, image in enumerate(images):
+
+        if np.any(image):
+            image_indexes.append(image_index)
+        else:
+            visibilities_of_images[image_index] = vis.Visibilities.zeros(
+                shape_1d=(transformer.uv_wavelengths.shape[0],)
+            )
+
+    if not image_indexes:
+        return visibilities_of_images
+
+    if not isinstance(transformer, trans.TransformerDFT):
+
+        for image_index in image_indexes:
+            visibilities_of_images[image_index] = transformer.visibilities_from_image(
+                image=images[image_index]
+            )
+
+        return visibilities_of_images
+
+    images_1d = np.stack(
+        [
+            np.asarray(images[image_index].in_1d_binned, dtype="float64")
+            for image_index in image_indexes
+        ]
+    )
+
+    if transformer.preload_transform:
+
+        visibilities = visibilities_of_images_via_preload_jit_from(
+            images_1d=images_1d,
+            preloaded_reals=transformer.preload_real_transforms,
+            preloaded_imags=transformer.preload_imag_transforms,
+        )
+
+    else:
+
+        visibilities = visibilities_of_images_jit_from(
+            images_1d=images_1d,
+            grid_radians=np.asarray(transformer.grid),
+            uv_wavelengths=transformer.uv_wavelengths,
+        )
+
+    for row, image_index in enumerate(image_indexes):
+        visibilities_of_images[image_index] = vis.Visibilities(
+            visibilities=visibilities[row]
+        )
+
+    return visibilities_of_images
@@ -0,0 +1,216 @@
+import numpy as np
+
+"""
+The (y,x) offsets of the 3x3 stencil, in units of the half-size of a tree node, on which the deflections of a mass
+profile are evaluated to expand them over the node. The stencil is ordered [(-1,-1), (-1,0), (-1,1), (0,-1), ...].
+"""
+stencil_offsets = np.array([(y, x) for y in (-1.0, 0.0, 1.0) for x in (-1.0, 0.0, 1.0)])
+
+
+class GridTree:
+    def __init__(self, grid, leaf_size):
+        """
+        A binary tree of the (y,x) coordinates of a grid, where every node is the bounding box of a subset of the
+        coordinates. Nodes are split in two along the longest side of their bounding box at the median coordinate,
+        until they contain fewer than `leaf_size` coordinates.
+
+        Parameters
+        ----------
+        grid : np.ndarray
+            The (y,x) coordinates of the tree, with shape [total_coordinates, 2].
+        leaf_size : int
+            The maximum number of coordinates in a leaf node.
+        """
+        self.grid = grid
+        self.leaf_size = leaf_size
+
+        self.indexes = []
+        self.centres = []
+        self.half_sizes = []
+        self.children = []
+
+        self._add_node(indexes=np.arange(grid.shape[0]))
+
+        self.centres = np.asarray(self.centres)
+        self.half_sizes = np.asarray(self.half_sizes)
+        self.radii = np.sqrt(2.0) * self.half_sizes
+
+    @property
+    def total_nodes(self):
+        return len(self.indexes)
+
+    def _add_node(self, indexes):
+
+        node = len(self.indexes)
+
+        grid = self.grid[indexes]
+
+        grid_min = np.min(grid, axis=0)
+        grid_max = np.max(grid, axis=0)
+
+        self.indexes.append(indexes)
+        self.centres.append(0.5 * (grid_min + grid_max))
+        self.half_sizes.append(0.5 * np.max(grid_max - grid_min))
+        self.children.append(None)
+
+        if len(indexes) > self.leaf_size:
+
+            axis = np.argmax(grid_max - grid_min)
+            median = len(indexes) // 2
+
+            order = np.argpartition(grid[:, axis], median)
+
+            self.children[node] = (
+                self._add_node(indexes=indexes[order[:median]]),
+                self._add_node(indexes=indexes[order[median:]]),
+            )
+
+        return node
+
+    def expansion_and_leaf_nodes_from_centre(self, centre, opening_angle):
+        """
+        Traverse the tree from its root, returning the nodes over which the deflections of a mass profile at
+        `centre` are expanded and the leaf nodes on which they are evaluated exactly.
+
+        A node is expanded if its radius divided by its distance from the centre is below the opening angle, with
+        its children traversed if not. Leaf nodes which are not expanded are evaluated exactly.
+        """
+        expansion_nodes = []
+        leaf_nodes = []
+
+        nodes = [0]
+
+        while nodes:
+
+            node = nodes.pop()
+
+            distance = np.sqrt(np.sum((self.centres[node] - centre) ** 2.0))
+
+            if self.radii[node] < opening_angle * distance:
+                expansion_nodes.append(node)
+            elif self.children[node] is None:
+                leaf_nodes.append(node)
+            else:
+                nodes.extend(self.children[node])
+
+        return expansion_nodes, leaf_nodes
+
+    @property
+    def stencil_grids(self):
+        """
+        The (y,x) coordinates of the stencil of every node, with shape [total_nodes, 9, 2]. The stencil of a node
+        with a half-size of zero (e.g. all its coordinates are identical) uses a half-size of 1.0.
+        """
+        half_sizes = np.where(self.half_sizes > 0.0, self.half_sizes, 1.0)
+
+        return (
+            self.centres[:, None, :]
+            + half_sizes[:, None, None] * stencil_offsets[None, :, :]
+        )
+
+
+def biquadratic_weights_from(offsets):
+    """
+    The weights of the 3x3 stencil values which biquadratically interpolate them to (y,x) offsets from the stencil
+    centre, in units of the stencil half-size. Returns an array of shape [total_offsets, 9].
+    """
+
+    def lagrange_weights(u):
+        return np.stack((0.5 * u * (u - 1.0), 1.0 - u ** 2.0, 0.5 * u * (u + 1.0)))
+
+    weights_y = lagrange_weights(offsets[:, 0])
+    weights_x = lagrange_weights(offsets[:, 1])
+
+    return np.einsum("in,jn->nij", weights_y, weights_x).reshape(-1, 9)
+
+
+class TreeDeflections:
+    def __init__(
+        self, opening_angle: float = 0.2, leaf_size: int = 64, minimum_mass_profiles=10
+    ):
+        """
+        Computes the deflection angles of a plane with many mass profiles (e.g. line-of-sight halos or cluster
+        members) using a tree-code, as opposed to summing the deflections of every mass profile on every coordinate
+        of the grid (which scales as O(N_profile x N_grid)).
+
+        The (y,x) coordinates of the grid are put in a `GridTree`. For every mass profile, nodes of the tree which
+        are far from the profile's centre (relative to their size) are not evaluated coordinate by coordinate.
+        Instead, the profile's deflections are evaluated on a 3x3 stencil covering the node, with the stencil values
+        of every far profile summed and biquadratically interpolated to the node's coordinates once. Only the
+        profiles near a leaf node are evaluated exactly on its coordinates. The cost therefore scales as
+        O(N_profile log N_grid + N_grid log N_grid).
+
+        The error of the expansion is controlled by the `opening_angle`: a node of radius r is expanded for a
+        profile at distance d if r / d < opening_angle, with the error of its interpolated deflections scaling as
+        opening_angle**3. An `opening_angle` of 0.0 evaluates every profile exactly.
+
+        Parameters
+        ----------
+        opening_angle : float
+            The ratio of a node's radius to its distance from a mass profile below which the profile's deflections
+            over the node are expanded.
+        leaf_size : int
+            The maximum number of coordinates in a leaf node of the tree.
+        minimum_mass_profiles : int
+            Planes with fewer mass profiles than this compute their deflections exactly, as the tree-code is only
+            faster for many profiles.
+        """
+        self.opening_angle = opening_angle
+        self.leaf_size = leaf_size
+        self.minimum_mass_profiles = minimum_mass_profiles
+
+    def is_used_for_plane(self, plane):
+        return len(plane.mass_profiles) >= self.minimum_mass_profiles
+
+    def deflections_from_plane_and_grid(self, plane, grid):
+        """
+        Returns the deflection angles of every mass profile of a plane summed on a grid, as an ndarray of shape
+        [total_coordinates, 2].
+        """
+        grid = np.asarray(grid).reshape(-1, 2)
+
+        tree = GridTree(grid=grid, leaf_size=self.leaf_size)
+        stencil_grids = tree.stencil_grids
+
+        deflections = np.zeros(grid.shape)
+        stencil_deflections = np.zeros((tree.total_nodes, 9, 2))
+        is_expanded = np.full(tree.total_nodes, False)
+
+        for mass_profile in plane.mass_profiles:
+
+            expansion_nodes, leaf_nodes = tree.expansion_and_leaf_nodes_from_centre(
+                centre=np.asarray(mass_profile.centre),
+                opening_angle=self.opening_angle,
+            )
+
+            if expansion_nodes:
+
+                stencil_deflections[expansion_nodes] += np.asarray(
+                    mass_profile.deflections_from_grid(
+                        grid=stencil_grids[expansion_nodes].reshape(-1, 2)
+                    )
+                ).reshape(-1, 9, 2)
+
+                is_expanded[expansion_nodes] = True
+
+            if leaf_nodes:
+
+                indexes = np.concatenate([tree.indexes[node] for node in leaf_nodes])
+
+                deflections[indexes] += np.asarray(
+                    mass_profile.deflections_from_grid(grid=grid[indexes])
+                )
+
+        for node in np.nonzero(is_expanded)[0]:
+
+            indexes = tree.indexes[node]
+
+            offsets = (grid[indexes] - stencil_grids[node, 4]) / (
+                stencil_grids[node, 8] - stencil_grids[node, 4]
+            )
+
+            deflections[indexes] += np.dot(
+                biquadratic_weights_from(offsets=offsets), stencil_deflections[node]
+            )
+
+        return deflections
@@ -0,0 +1,167 @@
+"""
+Ahead-of-time compilation of the autolens Numba kernels.
+
+By default every process compiles a Numba kernel the first time it is called, which for a grid search of thousands
+of short jobs on a super computer adds a compile stall of several seconds to every job (Numba's on-disk cache is
+usually disabled on super computers via the `[numba] cache` config, as the default cache directory is next to the
+source files). This module compiles every kernel into a shared cache directory once, after which workers load the
+compiled kernels from that directory instead of compiling them:
+
+    python -m autolens.numba_cache /path/to/shared/numba_cache
+
+Workers then call the warm-up hook at start-up, before fitting any lenses:
+
+    from autolens import numba_cache
+
+    numba_cache.warm_up(cache_dir="/path/to/shared/numba_cache")
+
+The cached kernels are only valid for the autolens installation, Numba version and CPU architecture they were
+compiled with, so the cache should be built from the same environment and node type the jobs run on.
+"""
+import argparse
+import numba
+import numpy as np
+import os
+import time
+
+import autolens as al
+from autolens import decorator_util
+from autolens.lens import positions_solver
+from autolens.lens import transformer_util
+
+
+def warm_up_positions_solver():
+    """
+    Compile the kernels of the `PositionsFinder`, by solving for the multiple images of a simple lens with every
+    option that calls a kernel turned on. The kernels are therefore compiled for the same argument types that a
+    real model-fit uses.
+    """
+    grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.2)
+
+    solver = al.PositionsFinder(
+        grid=grid,
+        pixel_scale_precision=0.1,
+        distance_from_source_centre=0.1,
+        distance_from_mass_profile_centre=0.01,
+    )
+
+    solver.solve(
+        lensing_obj=al.mp.SphericalIsothermal(centre=(0.0, 0.0), einstein_radius=1.0),
+        source_plane_coordinate=(0.0, 0.1),
+    )
+
+    positions_solver.pair_coordinate_to_closest_pixel_on_grid(
+        coordinate=(0.0, 0.1), grid_1d=np.asarray(grid)
+    )
+
+
+def warm_up_transformer_util():
+    """
+    Compile the kernels which compute the visibilities of many images together, by transforming the images of the
+    planes of a simple lens with a `TransformerDFT` with and without preloading.
+    """
+    mask = al.Mask2D.circular(shape_2d=(7, 7), pixel_scales=0.1, radius=0.2)
+
+    tracer = al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5,
+                light=al.lp.SphericalSersic(),
+                mass=al.mp.SphericalIsothermal(),
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.SphericalSersic()),
+        ]
+    )
+
+    for preload_transform in (True, False):
+
+        transformer = al.TransformerDFT(
+            uv_wavelengths=np.ones(shape=(2, 2)),
+            real_space_mask=mask,
+            preload_transform=preload_transform,
+        )
+
+        tracer.profile_visibilities_of_planes_from_grid_and_transformer(
+            grid=al.Grid.from_mask(mask=mask), transformer=transformer
+        )
+
+
+"""
+The functions which compile the autolens kernels. A kernel decorated with `decorator_util.jit` which is not called by
+one of these functions is not compiled ahead of time, and is listed by `uncompiled_kernels`.
+"""
+warm_up_functions = [warm_up_positions_solver, warm_up_transformer_util]
+
+
+def enable_cache_dir(cache_dir):
+    """
+    Cache every autolens kernel in the directory `cache_dir`, irrespective of the `[numba] cache` config.
+
+    Kernels compiled after this call are written to the directory and kernels which already have a compiled version
+    in the directory are loaded from it instead of being compiled. This should therefore be called before any
+    kernel is used, as kernels this process has already compiled are not written to the directory.
+    """
+    if not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    numba.config.CACHE_DIR = cache_dir
+
+    for kernel in decorator_util.kernels:
+        kernel.enable_caching()
+
+
+def uncompiled_kernels():
+    return [
+        kernel.py_func.__qualname__
+        for kernel in decorator_util.kernels
+        if not kernel.signatures
+    ]
+
+
+def warm_up(cache_dir=None):
+    """
+    Compile every autolens kernel, loading them from the directory `cache_dir` if it contains a compiled version of
+    the kernel (e.g. created by running this module from the command line) and writing them to it if not.
+
+    If `cache_dir` is `None`, the kernels are compiled (or loaded) using the `[numba] cache` config.
+
+    Returns
+    -------
+    float
+        The time taken to compile or load the kernels in seconds.
+    """
+    start = time.time()
+
+    if cache_dir is not None:
+        enable_cache_dir(cache_dir=cache_dir)
+
+    for warm_up_function in warm_up_functions:
+        warm_up_function()
+
+    return time.time() - start
+
+
+def main(args=None):
+
+    parser = argparse.ArgumentParser(
+        description="Compile every autolens Numba kernel into a shared cache directory."
+    )
+    parser.add_argument(
+        "cache_dir", help="The directory the compiled kernels are cached in."
+    )
+
+    args = parser.parse_args(args=args)
+
+    warm_up_time = warm_up(cache_dir=args.cache_dir)
+
+    print(
+        f"Compiled {len(decorator_util.kernels) - len(uncompiled_kernels())} autolens Numba kernels into "
+        f"{args.cache_dir} in {warm_up_time:.2f}s."
+    )
+
+    for kernel_name in uncompiled_kernels():
+        print(f"Kernel {kernel_name} is not compiled by a warm-up function.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+from astropy.io import fits
+from concurrent import futures
+import logging
+import numpy as np
+import os
+
+from autoconf import conf
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def _output_executor():
+    """
+    The single background thread used to write bundles asynchronously. One worker is used so that bundles are
+    written in the order they are submitted and only one file is ever open on the (possibly shared) filesystem.
+    """
+    global _executor
+
+    if _executor is None:
+        _executor = futures.ThreadPoolExecutor(max_workers=1)
+
+    return _executor
+
+
+def _log_exception_of_write(file_path):
+    """
+    Returns the done-callback of the asynchronous write of a bundle to `file_path`, which logs the exception the
+    write raised (if any), such that a failed write is reported even if its `Future` is never checked.
+    """
+
+    def callback(future):
+
+        exception = future.exception()
+
+        if exception is not None:
+            logger.error(
+                f"Asynchronous output of the fits bundle {file_path} failed",
+                exc_info=exception,
+            )
+
+    return callback
+
+
+class FitsBundle:
+    def __init__(self):
+        """
+        A collection of named 2D arrays which are output together as one multi-extension .fits file.
+
+        Writing every quantity of a fit to its own .fits file (as the visualizer's individual plotters do) produces
+        many small files, which is slow on shared filesystems (e.g. Lustre) where every file open and close hits the
+        metadata servers. A bundle instead writes every quantity as a named HDU of a single file.
+
+        Arrays are added to the bundle in the order they are output, with the name of each array used as the
+        `EXTNAME` of its HDU. Single value quantities (e.g. the log likelihood of a fit) are added to the header of
+        the primary HDU.
+        """
+        self.arrays = {}
+        self.header = {}
+
+    def add_array(self, name, array):
+        """
+        Add an array to the bundle, which is output as the HDU `name` (converted to upper case).
+
+        Autoarray structures (e.g. an `Array`) are output in 2D, whereas complex arrays (e.g. `Visibilities`) are
+        output with their real and imaginary components as two columns.
+        """
+        if array is None:
+            return
+
+        if hasattr(array, "in_2d"):
+            array = array.in_2d
+
+        array = np.asarray(array)
+
+        if np.iscomplexobj(array):
+            array = np.stack((array.real, array.imag), axis=-1)
+
+        self.arrays[name.upper()] = array
+
+    def add_header_value(self, key, value):
+        if value is not None:
+            self.header[key.upper()] = value
+
+    @property
+    def names(self):
+        return list(self.arrays.keys())
+
+    @property
+    def hdu_list(self):
+
+        flip_for_ds9 = conf.instance["general"]["fits"]["flip_for_ds9"]
+
+        primary_header = fits.Header()
+
+        for key, value in self.header.items():
+            primary_header[key] = value
+
+        hdu_list = fits.HDUList([fits.PrimaryHDU(header=primary_header)])
+
+        for name, array in self.arrays.items():
+
+            if flip_for_ds9 and array.ndim >= 2:
+                array = np.flipud(array)
+
+            hdu_list.append(fits.ImageHDU(data=array, name=name))
+
+        return hdu_list
+
+    def output_to_fits(self, file_path, overwrite=False, asynchronous=False):
+        """
+        Output the bundle to a multi-extension .fits file.
+
+        The HDU list is created in the calling thread, so the bundle can be modified or discarded straight after this
+        call. If `asynchronous` is `True` only the write to hard-disk is performed in a background thread, with the
+        `Future` of that write returned. An exception raised by the write is logged, as well as being set on the
+        `Future`.
+
+        Parameters
+        ----------
+        file_path : str
+            The path the file is output to, including the filename and the ``.fits`` extension.
+        overwrite : bool
+            If a file already exists at the path, if overwrite=True it is overwritten else an error is raised.
+        asynchronous : bool
+            If `True`, the file is written in a background thread.
+        """
+        file_dir = os.path.split(file_path)[0]
+
+        if file_dir and not os.path.exists(file_dir):
+            os.makedirs(file_dir)
+
+        hdu_list = self.hdu_list
+
+        if asynchronous:
+
+            future = _output_executor().submit(
+                hdu_list.writeto, file_path, overwrite=overwrite
+            )
+            future.add_done_callback(_log_exception_of_write(file_path=file_path))
+
+            return future
+
+        hdu_list.writeto(file_path, overwrite=overwrite)
+
+    @classmethod
+    def from_tracer_and_grid(cls, tracer, grid):
+        """
+        Returns a bundle of the quantities output by `ray_tracing_plots.individual`, that is the image, source-plane
+        image, convergence, potential, deflection angles and magnification of a tracer.
+        """
+        bundle = cls()
+
+        bundle.add_array(name="image", array=tracer.image_from_grid(grid=grid))
+
+        traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(grid=grid)
+
+        bundle.add_array(
+            name="source_plane",
+            array=tracer.source_plane.plane_image_from_grid(
+                grid=traced_grids_of_planes[-1]
+            ).array,
+        )
+
+        if tracer.has_mass_profile:
+
+            deflections = tracer.deflections_from_grid(grid=grid)
+
+            bundle.add_array(
+                name="convergence", array=tracer.convergence_from_grid(grid=grid)
+            )
+            bundle.add_array(
+                name="potential", array=tracer.potential_from_grid(grid=grid)
+            )
+            bundle.add_array(name="deflections_y", array=deflections.in_2d[:, :, 0])
+            bundle.add_array(name="deflections_x", array=deflections.in_2d[:, :, 1])
+            bundle.add_array(
+                name="magnification", array=tracer.magnification_from_grid(grid=grid)
+            )
+
+        return bundle
+
+    @classmethod
+    def from_fit_imaging(cls, fit):
+        """
+        Returns a bundle of the quantities output by `fit_imaging_plots.individuals` and
+        `inversion_plots.individuals`, including the model image, subtracted image and plane image of every plane.
+        """
+        bundle = cls()
+
+        bundle.add_header_value(key="loglike", value=fit.log_likelihood)
+        bundle.add_header_value(key="fom", value=fit.figure_of_merit)
+
+        bundle.add_array(name="image", array=fit.image)
+        bundle.add_array(name="noise_map", array=fit.noise_map)
+        bundle.add_array(name="signal_to_noise_map", array=fit.signal_to_noise_map)
+        bundle.add_array(name="model_image", array=fit.model_image)
+        bundle.add_array(name="residual_map", array=fit.residual_map)
+        bundle.add_array(
+            name="normalized_residual_map", array=fit.normalized_residual_map
+        )
+        bundle.add_array(name="chi_squared_map", array=fit.chi_squared_map)
+
+        model_images_of_planes = fit.model_images_of_planes
+
+        for plane_index, model_image_of_plane in enumerate(model_images_of_planes):
+
+            bundle.add_array(
+                name=f"model_image_of_plane_{plane_index}", array=model_image_of_plane
+            )
+
+            other_planes_model_images = [
+                model_image
+                for i, model_image in enumerate(model_images_of_planes)
+                if i != plane_index
+            ]
+
+            bundle.add_array(
+                name=f"subtracted_image_of_plane_{plane_index}",
+                array=fit.image - sum(other_planes_model_images),
+            )
+
+        bundle._add_plane_images_of_fit(fit=fit)
+        bundle._add_inversion_of_fit(fit=fit)
+
+        return bundle
+
+    @classmethod
+    def from_fit_interferometer(cls, fit):
+        """
+        Returns a bundle of the quantities output by `fit_interferometer_plots.individuals` and
+        `inversion_plots.individuals`. Visibility quantities are output with their real and imaginary components as
+        two columns.
+        """
+        bundle = cls()
+
+        bundle.add_header_value(key="loglike", value=fit.log_likelihood)
+        bundle.add_header_value(key="fom", value=fit.figure_of_merit)
+
+        bundle.add_array(name="visibilities", array=fit.visibilities)
+        bundle.add_array(name="noise_map", array=fit.noise_map)
+        bundle.add_array(name="model_visibilities", array=fit.model_visibilities)
+        bundle.add_array(name="residual_map", array=fit.residual_map)
+        bundle.add_array(
+            name="normalized_residual_map", array=fit.normalized_residual_map
+        )
+        bundle.add_array(name="chi_squared_map", array=fit.chi_squared_map)
+
+        bundle._add_plane_images_of_fit(fit=fit)
+        bundle._add_inversion_of_fit(fit=fit)
+
+        return bundle
+
+    def _add_plane_images_of_fit(self, fit):
+
+        traced_grids_of_planes = fit.tracer.traced_grids_of_planes_from_grid(
+            grid=fit.grid
+        )
+
+        for plane_index, plane in enumerate(fit.tracer.planes):
+
+            if plane.has_light_profile:
+
+                self.add_array(
+                    name=f"plane_image_of_plane_{plane_index}",
+                    array=plane.plane_image_from_grid(
+                        grid=traced_grids_of_planes[plane_index]
+                    ).array,
+                )
+
+    def _add_inversion_of_fit(self, fit):
+
+        if fit.inversion is None:
+            return
+
+        self.add_array(
+            name="reconstructed_image", array=fit.inversion.mapped_reconstructed_image
+        )
+        self.add_array(name="reconstruction", array=fit.inversion.reconstruction)
+        self.add_array(
+            name="interpolated_reconstruction",
+            array=fit.inversion.interpolated_reconstruction_from_shape_2d(),
+        )
+        self.add_array(
+            name="interpolated_errors",
+            array=fit.inversion.interpolated_errors_from_shape_2d(),
+        )
@@ -5,6 +5,7 @@ from autoarray.exc import PixelizationException, InversionException, GridExcepti
 from autofit.exc import FitException
 from autogalaxy.pipeline.phase.dataset import analysis as ag_analysis
 from autolens.fit import fit
+from autolens.lens import inversion_cache
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 from autogalaxy.pipeline.phase.imaging.analysis import Attributes as AgAttributes
@@ -27,6 +28,8 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             masked_dataset=masked_imaging
         )
 
+        self.inversion_cache = inversion_cache.InversionCache()
+
     @property
     def masked_imaging(self):
         return self.masked_dataset
@@ -66,6 +69,8 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
                     tracer=tracer,
                     hyper_image_sky=hyper_image_sky,
                     hyper_background_noise=hyper_background_noise,
+                    likelihood_only=True,
+                    use_inversion_cache=self.settings.settings_inversion.use_inversion_cache,
                 ).figure_of_merit
             except (
                 PixelizationException,
@@ -110,7 +115,13 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             return np.mean(figures_of_merit)
 
     def masked_imaging_fit_for_tracer(
-        self, tracer, hyper_image_sky, hyper_background_noise, use_hyper_scalings=True
+        self,
+        tracer,
+        hyper_image_sky,
+        hyper_background_noise,
+        use_hyper_scalings=True,
+        likelihood_only=False,
+        use_inversion_cache=False,
     ):
 
         return fit.FitImaging(
@@ -121,6 +132,8 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             use_hyper_scaling=use_hyper_scalings,
             settings_pixelization=self.settings.settings_pixelization,
             settings_inversion=self.settings.settings_inversion,
+            likelihood_only=likelihood_only,
+            inversion_cache=self.inversion_cache if use_inversion_cache else None,
         )
 
     def stochastic_log_evidences_for_instance(self, instance):
@@ -193,9 +206,13 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
             try:
 
+                critical_curves = tracer.critical_curves
+
                 visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
-                    preloaded_critical_curves=tracer.critical_curves,
-                    preloaded_caustics=tracer.caustics,
+                    preloaded_critical_curves=critical_curves,
+                    preloaded_caustics=tracer.caustics_from_critical_curves(
+                        critical_curves=critical_curves
+                    ),
                 )
 
             except (Exception, IndexError, ValueError):
@@ -7,6 +7,7 @@ from autogalaxy.galaxy import galaxy as g
 from autogalaxy.pipeline.phase.dataset import analysis as ag_analysis
 from autogalaxy.pipeline.phase.interferometer.analysis import Attributes as AgAttributes
 from autolens.fit import fit
+from autolens.lens import inversion_cache
 from autolens.pipeline import visualizer
 from autolens.pipeline.phase.dataset import analysis as analysis_dataset
 
@@ -25,6 +26,8 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             masked_dataset=masked_interferometer
         )
 
+        self.inversion_cache = inversion_cache.InversionCache()
+
         result = ag_analysis.last_result_with_use_as_hyper_dataset(results=results)
 
         if result is not None:
@@ -72,7 +75,9 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
         try:
             fit = self.masked_interferometer_fit_for_tracer(
-                tracer=tracer, hyper_background_noise=hyper_background_noise
+                tracer=tracer,
+                hyper_background_noise=hyper_background_noise,
+                use_inversion_cache=self.settings.settings_inversion.use_inversion_cache,
             )
             return fit.figure_of_merit
         except (
@@ -122,7 +127,11 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
         return instance
 
     def masked_interferometer_fit_for_tracer(
-        self, tracer, hyper_background_noise, use_hyper_scalings=True
+        self,
+        tracer,
+        hyper_background_noise,
+        use_hyper_scalings=True,
+        use_inversion_cache=False,
     ):
 
         return fit.FitInterferometer(
@@ -132,6 +141,7 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
             use_hyper_scaling=use_hyper_scalings,
             settings_pixelization=self.settings.settings_pixelization,
             settings_inversion=self.settings.settings_inversion,
+            inversion_cache=self.inversion_cache if use_inversion_cache else None,
         )
 
     def stochastic_log_evidences_for_instance(self, instance):
@@ -199,9 +209,13 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
             try:
 
+                critical_curves = tracer.critical_curves
+
                 visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
-                    preloaded_critical_curves=tracer.critical_curves,
-                    preloaded_caustics=tracer.caustics,
+                    preloaded_critical_curves=critical_curves,
+                    preloaded_caustics=tracer.caustics_from_critical_curves(
+                        critical_curves=critical_curves
+                    ),
                 )
 
             except (Exception, IndexError, ValueError):
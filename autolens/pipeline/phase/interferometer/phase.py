@@ -1,3 +1,4 @@
+import logging
 from os import path
 import autofit as af
 from astropy import cosmology as cosmo
@@ -9,6 +10,14 @@ from autolens.pipeline.phase.settings import SettingsPhaseInterferometer
 from autolens.pipeline.phase.interferometer.analysis import Analysis
 from autolens.pipeline.phase.interferometer.result import Result
 
+logger = logging.getLogger(__name__)
+
+"""
+The phase error (in radians) of binning the visibilities in the uv-plane (see `UVBinning.max_phase_error_from`) above
+which a warning is logged, as the binned fit is only accurate if it is well below 1.0.
+"""
+UV_BINNING_MAX_PHASE_ERROR_WARNING = 0.1
+
 
 class PhaseInterferometer(dataset.PhaseDataset):
     galaxies = af.PhaseProperty("galaxies")
@@ -86,7 +95,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
             settings=self.settings.settings_masked_interferometer,
         )
 
-        self.output_phase_info()
+        self.output_phase_info(masked_interferometer=masked_interferometer)
 
         return self.Analysis(
             masked_interferometer=masked_interferometer,
@@ -95,7 +104,7 @@ class PhaseInterferometer(dataset.PhaseDataset):
             results=results,
         )
 
-    def output_phase_info(self):
+    def output_phase_info(self, masked_interferometer=None):
 
         file_phase_info = path.join(self.search.paths.output_path, "phase.info")
 
@@ -113,4 +122,44 @@ class PhaseInterferometer(dataset.PhaseDataset):
             )
             phase_info.write("Cosmology = {} \n".format(self.cosmology))
 
+            if (
+                masked_interferometer is not None
+                and masked_interferometer.uv_binning is not None
+            ):
+                self.output_uv_binning_info(
+                    phase_info=phase_info, masked_interferometer=masked_interferometer
+                )
+
             phase_info.close()
+
+    def output_uv_binning_info(self, phase_info, masked_interferometer):
+        """
+        Write the uv-plane binning of the visibilities to the phase info and log its maximum phase error, warning if
+        it is large enough that the binned fit is inaccurate.
+        """
+        uv_binning = masked_interferometer.uv_binning
+        max_phase_error = masked_interferometer.uv_binning_max_phase_error
+
+        phase_info.write(
+            "UV Bin Size = {} \n".format(
+                self.settings.settings_masked_interferometer.uv_bin_size
+            )
+        )
+        phase_info.write(
+            "UV Binning Compression = {} \n".format(uv_binning.compression)
+        )
+        phase_info.write("UV Binning Max Phase Error = {} \n".format(max_phase_error))
+
+        message = (
+            f"{self.search.paths.name}: binning the visibilities in the uv-plane reduces "
+            f"{uv_binning.total_visibilities} visibilities to {uv_binning.total_binned_visibilities}, with a "
+            f"maximum phase error of {max_phase_error:.3g} radians"
+        )
+
+        if max_phase_error >= UV_BINNING_MAX_PHASE_ERROR_WARNING:
+            logger.warning(
+                f"{message}, which is not well below 1.0, so the binned fit may be inaccurate. Reduce the "
+                f"uv_bin_size to reduce it."
+            )
+        else:
+            logger.info(message)
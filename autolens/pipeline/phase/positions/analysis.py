@@ -75,9 +75,13 @@ class Analysis(ag_analysis.Analysis, analysis_dataset.Analysis):
 
             try:
 
+                critical_curves = tracer.critical_curves
+
                 visualizer = self.visualizer.new_visualizer_with_preloaded_critical_curves_and_caustics(
-                    preloaded_critical_curves=tracer.critical_curves,
-                    preloaded_caustics=tracer.caustics,
+                    preloaded_critical_curves=critical_curves,
+                    preloaded_caustics=tracer.caustics_from_critical_curves(
+                        critical_curves=critical_curves
+                    ),
                 )
 
             except (Exception, IndexError, ValueError):
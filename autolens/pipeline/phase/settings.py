@@ -1,16 +1,20 @@
 from autoconf import conf
-from autoarray.inversion import pixelizations as pix, inversions as inv
-from autogalaxy.dataset import imaging, interferometer
 from autogalaxy.pipeline.phase import settings
-from autolens.lens.settings import SettingsLens
+from autolens.dataset import imaging
+from autolens.dataset import interferometer
+from autolens.lens.settings import (
+    SettingsLens,
+    SettingsPixelization,
+    SettingsInversion,
+)
 
 
 class SettingsPhaseImaging(settings.SettingsPhaseImaging):
     def __init__(
         self,
         settings_masked_imaging=imaging.SettingsMaskedImaging(),
-        settings_pixelization=pix.SettingsPixelization(use_border=True),
-        settings_inversion=inv.SettingsInversion(),
+        settings_pixelization=SettingsPixelization(use_border=True),
+        settings_inversion=SettingsInversion(),
         settings_lens=SettingsLens(),
         log_likelihood_cap=None,
     ):
@@ -50,8 +54,8 @@ class SettingsPhaseInterferometer(settings.SettingsPhaseInterferometer):
     def __init__(
         self,
         settings_masked_interferometer=interferometer.SettingsMaskedInterferometer(),
-        settings_pixelization=pix.SettingsPixelization(use_border=True),
-        settings_inversion=inv.SettingsInversion(),
+        settings_pixelization=SettingsPixelization(use_border=True),
+        settings_inversion=SettingsInversion(),
         settings_lens=SettingsLens(),
         log_likelihood_cap=None,
     ):
@@ -9,6 +9,7 @@ import autoarray as aa
 from autoarray.plot import mat_objs
 from autogalaxy.plot import fit_galaxy_plots, hyper_plots, inversion_plots
 from autogalaxy.plot import lensing_plotters
+from autolens.pipeline import fits_bundle
 from autolens.plot import ray_tracing_plots, fit_imaging_plots, fit_interferometer_plots
 
 
@@ -45,6 +46,10 @@ class AbstractVisualizer:
             "ray_tracing", "magnification"
         )
 
+        self.fits_bundle_ray_tracing = plot_setting("fits_bundle", "ray_tracing")
+        self.fits_bundle_fit = plot_setting("fits_bundle", "fit")
+        self.fits_bundle_asynchronous = plot_setting("fits_bundle", "asynchronous")
+
     @staticmethod
     def plotter_from_paths(paths: af.Paths, subfolders=None, format="png"):
         if subfolders is None:
@@ -69,6 +74,17 @@ class AbstractVisualizer:
             )
         )
 
+    def output_fits_bundle(self, paths: af.Paths, bundle, subfolders, filename):
+        """
+        Output a `FitsBundle` as one multi-extension .fits file in the image path of the phase, which is written in a
+        background thread if the visualize config sets `asynchronous=True` in the `fits_bundle` section.
+        """
+        return bundle.output_to_fits(
+            file_path=path.join(paths.image_path, subfolders, f"{filename}.fits"),
+            overwrite=True,
+            asynchronous=self.fits_bundle_asynchronous,
+        )
+
     def new_visualizer_with_preloaded_critical_curves_and_caustics(
         self, preloaded_critical_curves, preloaded_caustics
     ):
@@ -271,6 +287,19 @@ class PhaseDatasetVisualizer(AbstractVisualizer):
 
     def visualize_ray_tracing_in_fits(self, paths: af.Paths, tracer):
 
+        if self.fits_bundle_ray_tracing:
+
+            self.output_fits_bundle(
+                paths=paths,
+                bundle=fits_bundle.FitsBundle.from_tracer_and_grid(
+                    tracer=tracer, grid=self.masked_dataset.grid
+                ),
+                subfolders=path.join("ray_tracing", "fits"),
+                filename="ray_tracing",
+            )
+
+            return
+
         fits_plotter = self.plotter_from_paths(
             paths=paths, subfolders=path.join("ray_tracing", "fits"), format="fits"
         )
@@ -561,6 +590,17 @@ class PhaseImagingVisualizer(PhaseDatasetVisualizer):
 
     def visualize_fit_in_fits(self, paths: af.Paths, fit):
 
+        if self.fits_bundle_fit:
+
+            self.output_fits_bundle(
+                paths=paths,
+                bundle=fits_bundle.FitsBundle.from_fit_imaging(fit=fit),
+                subfolders=path.join("fit_imaging", "fits"),
+                filename="fit_imaging",
+            )
+
+            return
+
         fits_plotter = self.plotter_from_paths(
             paths=paths, subfolders=path.join("fit_imaging", "fits"), format="fits"
         )
@@ -777,54 +817,64 @@ class PhaseInterferometerVisualizer(PhaseDatasetVisualizer):
 
             if self.plot_fit_all_at_end_fits:
 
-                fits_plotter = self.plotter_from_paths(
-                    paths=paths,
-                    subfolders=path.join("fit_interferometer", "fits"),
-                    format="fits",
-                )
+                self.visualize_fit_in_fits(paths=paths, fit=fit)
 
-                fit_interferometer_plots.individuals(
-                    fit=fit,
-                    plot_visibilities=True,
-                    plot_noise_map=True,
-                    plot_signal_to_noise_map=True,
-                    plot_model_visibilities=True,
-                    plot_residual_map=True,
-                    plot_normalized_residual_map=True,
-                    plot_chi_squared_map=True,
-                    include=self.include,
-                    plotter=fits_plotter,
-                )
+    def visualize_fit_in_fits(self, paths: af.Paths, fit):
 
-                if fit.inversion is not None:
-                    fits_plotter = self.plotter_from_paths(
-                        paths=paths,
-                        subfolders=path.join("inversion", "fits"),
-                        format="fits",
-                    )
+        if self.fits_bundle_fit:
+
+            self.output_fits_bundle(
+                paths=paths,
+                bundle=fits_bundle.FitsBundle.from_fit_interferometer(fit=fit),
+                subfolders=path.join("fit_interferometer", "fits"),
+                filename="fit_interferometer",
+            )
+
+            return
+
+        fits_plotter = self.plotter_from_paths(
+            paths=paths,
+            subfolders=path.join("fit_interferometer", "fits"),
+            format="fits",
+        )
+
+        fit_interferometer_plots.individuals(
+            fit=fit,
+            plot_visibilities=True,
+            plot_noise_map=True,
+            plot_signal_to_noise_map=True,
+            plot_model_visibilities=True,
+            plot_residual_map=True,
+            plot_normalized_residual_map=True,
+            plot_chi_squared_map=True,
+            include=self.include,
+            plotter=fits_plotter,
+        )
+
+        if fit.inversion is not None:
+            fits_plotter = self.plotter_from_paths(
+                paths=paths, subfolders=path.join("inversion", "fits"), format="fits"
+            )
+
+            inversion_plots.individuals(
+                inversion=fit.inversion,
+                image_positions=self.include.positions_from_fit(fit=fit),
+                source_positions=self.include.positions_of_plane_from_fit_and_plane_index(
+                    fit=fit, plane_index=-1
+                ),
+                grid=self.include.inversion_image_pixelization_grid_from_fit(fit=fit),
+                light_profile_centres=self.include.light_profile_centres_from_obj(
+                    obj=fit.tracer.image_plane
+                ),
+                mass_profile_centres=self.include.mass_profile_centres_from_obj(
+                    obj=fit.tracer.image_plane
+                ),
+                critical_curves=self.include.critical_curves_from_obj(obj=fit.tracer),
+                caustics=self.include.caustics_from_obj(obj=fit.tracer),
+                plot_reconstructed_image=True,
+                plot_interpolated_reconstruction=True,
+                plot_interpolated_errors=True,
+                include=self.include,
+                plotter=fits_plotter,
+            )
 
-                    inversion_plots.individuals(
-                        inversion=fit.inversion,
-                        image_positions=self.include.positions_from_fit(fit=fit),
-                        source_positions=self.include.positions_of_plane_from_fit_and_plane_index(
-                            fit=fit, plane_index=-1
-                        ),
-                        grid=self.include.inversion_image_pixelization_grid_from_fit(
-                            fit=fit
-                        ),
-                        light_profile_centres=self.include.light_profile_centres_from_obj(
-                            obj=fit.tracer.image_plane
-                        ),
-                        mass_profile_centres=self.include.mass_profile_centres_from_obj(
-                            obj=fit.tracer.image_plane
-                        ),
-                        critical_curves=self.include.critical_curves_from_obj(
-                            obj=fit.tracer
-                        ),
-                        caustics=self.include.caustics_from_obj(obj=fit.tracer),
-                        plot_reconstructed_image=True,
-                        plot_interpolated_reconstruction=True,
-                        plot_interpolated_errors=True,
-                        include=self.include,
-                        plotter=plotter,
-                    )
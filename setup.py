@@ -67,5 +67,8 @@ setup(
     packages=find_packages(exclude=["docs"]),
     install_requires=requirements,
     extras_require={"test": ["coverage", "pytest", "pytest-cov"]},
+    entry_points={
+        "console_scripts": ["autolens-numba-cache=autolens.numba_cache:main"]
+    },
     cmd_class={"test": RunTests},
 )
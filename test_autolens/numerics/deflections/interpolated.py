@@ -0,0 +1,96 @@
+"""
+Compares the ray-tracing of a `Tracer` using `InterpolatedDeflections` to exact evaluation of the deflection angles,
+for the mass profiles of the other deflection angle numerics scripts (isothermal, power-law and Sersic) at the
+sub-grid sizes used in model-fits.
+
+For every profile the run time of tracing the sub-grid to the source-plane and the maximum arc-second difference of
+the traced grids are printed.
+"""
+import time
+
+import numpy as np
+import autolens as al
+
+"""The pixel scale of the dataset and the mask's radius."""
+pixel_scales = 0.05
+radius = 3.0
+
+"""The arc-second size of the cells the deflection angles are interpolated from and the maximum error of a cell."""
+interpolated_deflections = al.InterpolatedDeflections(
+    pixel_scale=0.05, maximum_error=1.0e-3
+)
+
+mass_profiles = {
+    "Elliptical Isothermal": al.mp.EllipticalIsothermal(
+        centre=(0.0, 0.0), elliptical_comps=(0.111111, 0.0), einstein_radius=1.0
+    ),
+    "Elliptical Power-Law": al.mp.EllipticalPowerLaw(
+        centre=(0.0, 0.0),
+        elliptical_comps=(0.0, 0.111111),
+        einstein_radius=1.0,
+        slope=2.2,
+    ),
+    "Elliptical Sersic": al.mp.EllipticalSersic(
+        centre=(0.0, 0.0),
+        elliptical_comps=(0.096225, -0.055555),
+        intensity=0.1,
+        effective_radius=0.8,
+        sersic_index=3.0,
+        mass_to_light_ratio=1.0,
+    ),
+}
+
+source_galaxy = al.Galaxy(
+    redshift=1.0,
+    light=al.lp.EllipticalSersic(
+        centre=(0.1, 0.1),
+        elliptical_comps=(0.096225, -0.055555),
+        intensity=0.3,
+        effective_radius=1.0,
+        sersic_index=2.5,
+    ),
+)
+
+for sub_size in [4, 8]:
+
+    mask = al.Mask2D.circular(
+        shape_2d=(150, 150), pixel_scales=pixel_scales, sub_size=sub_size, radius=radius
+    )
+
+    grid = al.Grid.from_mask(mask=mask)
+
+    for name, mass_profile in mass_profiles.items():
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=mass_profile,
+                shear=al.mp.ExternalShear(elliptical_comps=(0.0, 0.05)),
+            ),
+            source_galaxy,
+        ]
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        start = time.time()
+        traced_grid = tracer.traced_grids_of_planes_from_grid(grid=grid)[-1]
+        exact_time = time.time() - start
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=galaxies, interpolated_deflections=interpolated_deflections
+        )
+
+        start = time.time()
+        interpolated_traced_grid = tracer.traced_grids_of_planes_from_grid(grid=grid)[
+            -1
+        ]
+        interpolated_time = time.time() - start
+
+        maximum_error = np.max(
+            np.abs(np.asarray(interpolated_traced_grid) - np.asarray(traced_grid))
+        )
+
+        print(
+            f"{name} (sub_size = {sub_size}): exact {exact_time:.3f}s, interpolated {interpolated_time:.3f}s, "
+            f'maximum error {maximum_error:.2e}".'
+        )
@@ -0,0 +1,83 @@
+"""
+Compares the log likelihood of fitting the `mass_sie__source_sersic` test datasets with their true lens model in
+double precision (float64) and single precision (float32, via `SettingsMaskedImaging(use_float32=True)`), for every
+instrument the datasets are simulated at.
+
+For every instrument the log likelihood of both fits, their absolute and relative difference and the run time of a
+fit are printed. The relative difference should be well below the precision a non-linear search samples the log
+likelihood to (e.g. changes in the log likelihood of ~0.1 between samples).
+
+The datasets are simulated by running `test_autolens/simulators/imaging/simulate_datasets.py`.
+"""
+import time
+
+import autolens as al
+from test_autolens.simulators.imaging import instrument_util
+
+"""The number of fits each run time is averaged over."""
+repeats = 10
+
+dataset_name = "mass_sie__source_sersic"
+
+lens_galaxy = al.Galaxy(
+    redshift=0.5,
+    mass=al.mp.EllipticalIsothermal(
+        centre=(0.0, 0.0), einstein_radius=1.6, elliptical_comps=(0.17647, 0.0)
+    ),
+)
+
+source_galaxy = al.Galaxy(
+    redshift=1.0,
+    light=al.lp.EllipticalSersic(
+        centre=(0.0, 0.0),
+        elliptical_comps=(-0.055555, 0.096225),
+        intensity=0.4,
+        effective_radius=0.5,
+        sersic_index=1.0,
+    ),
+)
+
+tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
+
+for instrument in ["vro", "euclid", "hst", "ao"]:
+
+    imaging = instrument_util.load_test_imaging(
+        dataset_name=dataset_name, instrument=instrument
+    )
+
+    mask = al.Mask2D.circular(
+        shape_2d=imaging.shape_2d, pixel_scales=imaging.pixel_scales, radius=3.0
+    )
+
+    print(f"{instrument}:")
+
+    log_likelihoods = {}
+
+    for use_float32 in [False, True]:
+
+        masked_imaging = al.MaskedImaging(
+            imaging=imaging,
+            mask=mask,
+            settings=al.SettingsMaskedImaging(sub_size=4, use_float32=use_float32),
+        )
+
+        start = time.time()
+
+        for i in range(repeats):
+            fit = al.FitImaging(masked_imaging=masked_imaging, tracer=tracer)
+
+        fit_time = (time.time() - start) / repeats
+
+        log_likelihoods[use_float32] = fit.log_likelihood
+
+        print(
+            f"    use_float32={use_float32}: log likelihood = {fit.log_likelihood}, "
+            f"fit time = {fit_time:.4f}s"
+        )
+
+    difference = abs(log_likelihoods[True] - log_likelihoods[False])
+
+    print(
+        f"    Absolute difference = {difference}, "
+        f"relative difference = {difference / abs(log_likelihoods[False])}"
+    )
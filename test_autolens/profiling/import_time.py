@@ -0,0 +1,61 @@
+"""
+Measures the time taken to import autolens in a fresh Python process, which is the start-up cost paid by every
+worker of a process pool.
+
+The import of `autolens` itself is compared to accessing its lazily loaded subpackages (plotting, aggregator and
+phases), which are only imported when a script uses them. Python's `-X importtime` option is used to split the time
+spent importing autolens modules from the time spent importing its dependencies (autoarray, autogalaxy, etc.).
+"""
+import subprocess
+import sys
+
+repeats = 5
+
+statements = {
+    "import autolens": "import autolens",
+    "import autolens + plot": "import autolens as al; al.plot",
+    "import autolens + agg": "import autolens as al; al.agg",
+    "import autolens + PhaseImaging": "import autolens as al; al.PhaseImaging",
+}
+
+
+def import_times_from_statement(statement):
+    """
+    Returns the total import time and the time spent in autolens modules (in seconds) of a statement run in a new
+    process, using the self time of every module listed by `-X importtime`.
+    """
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    ).stderr
+
+    total_time = 0.0
+    autolens_time = 0.0
+
+    for line in stderr.splitlines():
+
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+
+        self_time, _, module = line[len("import time:") :].split("|")
+
+        total_time += float(self_time) * 1.0e-6
+
+        if module.strip().startswith("autolens"):
+            autolens_time += float(self_time) * 1.0e-6
+
+    return total_time, autolens_time
+
+
+for name, statement in statements.items():
+
+    times = [import_times_from_statement(statement=statement) for i in range(repeats)]
+
+    total_time, autolens_time = min(times)
+
+    print(
+        f"{name} : total = {total_time:.3f}s, autolens modules = {autolens_time:.3f}s "
+        f"(best of {repeats})"
+    )
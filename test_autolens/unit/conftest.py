@@ -19,6 +19,7 @@ def set_config_path():
     conf.instance = conf.Config(
         path.join(directory, "..", "config"),
         path.join(directory, "..", "pipeline", "output"),
+        output_path=path.join(directory, "..", "output"),
     )
     return conf.instance
 
@@ -44,6 +44,54 @@ class TestMaskedImaging:
         assert (masked_imaging_7x7.blurring_grid.in_1d == blurring_grid_7x7).all()
         assert (masked_imaging_7x7.blurring_grid == blurring_grid).all()
 
+    def test__use_float32__dataset_grids_and_convolver_are_single_precision(
+        self, imaging_7x7, sub_mask_7x7
+    ):
+
+        masked_imaging_7x7 = al.MaskedImaging(
+            imaging=imaging_7x7,
+            mask=sub_mask_7x7,
+            settings=al.SettingsMaskedImaging(use_float32=True),
+        )
+
+        assert masked_imaging_7x7.use_float32 is True
+
+        assert masked_imaging_7x7.image.dtype == np.float32
+        assert masked_imaging_7x7.noise_map.dtype == np.float32
+        assert masked_imaging_7x7.grid.dtype == np.float32
+        assert masked_imaging_7x7.blurring_grid.dtype == np.float32
+        assert masked_imaging_7x7.convolver.image_frame_1d_kernels.dtype == np.float32
+        assert masked_imaging_7x7.convolver.image_frame_1d_indexes.dtype == np.int32
+
+        assert (masked_imaging_7x7.image.in_1d == np.ones(9)).all()
+        assert (masked_imaging_7x7.noise_map.in_1d == 2.0 * np.ones(9)).all()
+        assert isinstance(masked_imaging_7x7.grid, al.Grid)
+
+        masked_imaging_7x7 = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+        assert masked_imaging_7x7.use_float32 is False
+        assert masked_imaging_7x7.grid.dtype == np.float64
+
+
+class TestSettingsMaskedImaging:
+    def test__float32_tag(self):
+
+        settings = al.SettingsMaskedImaging(use_float32=False)
+        assert settings.float32_tag == ""
+
+        settings = al.SettingsMaskedImaging(use_float32=True)
+        assert settings.float32_tag == "__f32"
+
+    def test__tag__float32_tag_is_inside_settings_tag(self):
+
+        settings = al.SettingsMaskedImaging(sub_size=2, use_float32=True)
+
+        assert settings.tag_no_inversion.endswith("__f32]")
+        assert settings.tag_with_inversion.endswith("__f32]")
+        assert settings.tag_no_inversion.replace("__f32", "") == (
+            al.SettingsMaskedImaging(sub_size=2).tag_no_inversion
+        )
+
 
 class TestSimulatorImaging:
     def test__from_tracer_and_grid__same_as_tracer_image(self):
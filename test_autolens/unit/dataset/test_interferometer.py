@@ -123,6 +123,103 @@ class TestMaskedInterferometer:
 
         assert masked_interferometer_7.noise_map[0] == 10.0 + 0.0j
 
+    def test__uv_bin_size__visibilities_are_binned_in_uv_plane(self, sub_mask_7x7):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=[1.0 + 4.0j, 3.0 + 2.0j, 5.0 + 5.0j, 100.0 + 100.0j]
+            ),
+            noise_map=al.VisibilitiesNoiseMap.manual_1d(
+                visibilities=[1.0 + 1.0j, 1.0 + 2.0j, 1.0 + 1.0j, 1.0 + 1.0j]
+            ),
+            uv_wavelengths=np.array(
+                [[10.0, 10.0], [30.0, 30.0], [150.0, 10.0], [20.0, 20.0]]
+            ),
+        )
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer,
+            visibilities_mask=np.array([False, False, False, True]),
+            real_space_mask=sub_mask_7x7,
+            settings=al.SettingsMaskedInterferometer(
+                transformer_class=al.TransformerDFT, uv_bin_size=100.0
+            ),
+        )
+
+        assert masked_interferometer.visibilities == pytest.approx(
+            np.array([2.0 + 3.6j, 5.0 + 5.0j]), 1.0e-8
+        )
+        assert (masked_interferometer.visibilities_mask == np.full(2, False)).all()
+        assert masked_interferometer.noise_map == pytest.approx(
+            np.array([(1.0 / np.sqrt(2.0)) + (1.0 / np.sqrt(1.25)) * 1j, 1.0 + 1.0j]),
+            1.0e-8,
+        )
+        assert masked_interferometer.interferometer.uv_wavelengths == pytest.approx(
+            np.array([[(2.0 * 10.0 + 1.25 * 30.0) / 3.25] * 2, [150.0, 10.0]]), 1.0e-8,
+        )
+        assert (
+            masked_interferometer.transformer.uv_wavelengths
+            == masked_interferometer.interferometer.uv_wavelengths
+        ).all()
+
+        uv_binning = masked_interferometer.uv_binning
+
+        assert uv_binning.total_visibilities == 3
+        assert uv_binning.total_binned_visibilities == 2
+        assert uv_binning.compression == 1.5
+        assert uv_binning.max_uv_offset == pytest.approx(
+            np.sqrt(2.0) * (30.0 - 57.5 / 3.25), 1.0e-8
+        )
+        assert masked_interferometer.uv_binning_max_phase_error == pytest.approx(
+            uv_binning.max_phase_error_from(real_space_mask=sub_mask_7x7), 1.0e-8
+        )
+        assert masked_interferometer.uv_binning_max_phase_error > 0.0
+
+    def test__uv_bin_size_none__visibilities_are_not_binned(
+        self, interferometer_7, sub_mask_7x7, visibilities_mask_7
+    ):
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=sub_mask_7x7,
+        )
+
+        assert masked_interferometer.uv_binning is None
+        assert masked_interferometer.uv_binning_max_phase_error == 0.0
+        assert (
+            masked_interferometer.visibilities == interferometer_7.visibilities
+        ).all()
+
+
+class TestSettingsMaskedInterferometer:
+    def test__uv_bin_size_tag(self):
+
+        settings = al.SettingsMaskedInterferometer(uv_bin_size=None)
+        assert settings.uv_bin_size_tag == ""
+
+        settings = al.SettingsMaskedInterferometer(uv_bin_size=1000.0)
+        assert settings.uv_bin_size_tag == "__uvbin_1000"
+
+        settings = al.SettingsMaskedInterferometer(uv_bin_size=2.5e5)
+        assert settings.uv_bin_size_tag == "__uvbin_250000"
+
+        settings = al.SettingsMaskedInterferometer(uv_bin_size=1.0e6)
+        assert settings.uv_bin_size_tag == "__uvbin_1000000"
+
+        settings = al.SettingsMaskedInterferometer(uv_bin_size=0.5)
+        assert settings.uv_bin_size_tag == "__uvbin_0.5"
+
+    def test__tag__uv_bin_size_tag_is_inside_settings_tag(self):
+
+        settings = al.SettingsMaskedInterferometer(sub_size=2, uv_bin_size=1000.0)
+
+        assert settings.tag_no_inversion.endswith("__uvbin_1000]")
+        assert settings.tag_with_inversion.endswith("__uvbin_1000]")
+        assert settings.tag_no_inversion.replace("__uvbin_1000", "") == (
+            al.SettingsMaskedInterferometer(sub_size=2).tag_no_inversion
+        )
+
 
 class TestSimulatorInterferometer:
     def test__from_tracer__same_as_tracer_input(self):
@@ -0,0 +1,136 @@
+import os
+import shutil
+from os import path
+
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.dataset import transformer_cache
+
+test_path = path.join(
+    "{}".format(path.dirname(path.realpath(__file__))), "files", "transformers"
+)
+
+
+@pytest.fixture(name="cache_path")
+def make_cache_path():
+
+    if path.exists(test_path):
+        shutil.rmtree(test_path)
+
+    yield test_path
+
+    if path.exists(test_path):
+        shutil.rmtree(path.dirname(test_path))
+
+
+@pytest.fixture(name="uv_wavelengths")
+def make_uv_wavelengths():
+    return np.random.RandomState(seed=1).uniform(-1.0e5, 1.0e5, size=(2000, 2))
+
+
+class TestTransformerCache:
+    @pytest.mark.parametrize(
+        "transformer_class", [al.TransformerDFT, al.TransformerNUFFT]
+    )
+    def test__cached_transformer_is_memory_mapped_and_identical(
+        self, cache_path, uv_wavelengths, mask_7x7, transformer_class
+    ):
+
+        transformer = transformer_class(
+            uv_wavelengths=uv_wavelengths, real_space_mask=mask_7x7
+        )
+
+        transformer_cached = transformer_cache.transformer_from(
+            transformer_class=transformer_class,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=mask_7x7,
+            cache_path=cache_path,
+        )
+
+        assert len(os.listdir(cache_path)) == 1
+
+        transformer_loaded = transformer_cache.transformer_from(
+            transformer_class=transformer_class,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=mask_7x7,
+            cache_path=cache_path,
+        )
+
+        assert len(os.listdir(cache_path)) == 1
+        assert type(transformer_loaded) == transformer_class
+        assert isinstance(transformer_loaded.uv_wavelengths, np.memmap)
+
+        image = al.Array.manual_mask(
+            array=np.arange(1.0, 10.0), mask=mask_7x7.mask_sub_1
+        )
+
+        visibilities = transformer.visibilities_from_image(image=image)
+
+        assert (
+            transformer_cached.visibilities_from_image(image=image) == visibilities
+        ).all()
+        assert (
+            transformer_loaded.visibilities_from_image(image=image) == visibilities
+        ).all()
+
+    def test__key_depends_on_class_uv_wavelengths_and_mask(
+        self, uv_wavelengths, mask_7x7
+    ):
+
+        key = transformer_cache.transformer_key_from(
+            transformer_class=al.TransformerDFT,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=mask_7x7,
+        )
+
+        assert key == transformer_cache.transformer_key_from(
+            transformer_class=al.TransformerDFT,
+            uv_wavelengths=uv_wavelengths.copy(),
+            real_space_mask=al.Mask2D.manual(
+                mask=mask_7x7, pixel_scales=mask_7x7.pixel_scales, sub_size=2
+            ),
+        )
+        assert key != transformer_cache.transformer_key_from(
+            transformer_class=al.TransformerNUFFT,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=mask_7x7,
+        )
+        assert key != transformer_cache.transformer_key_from(
+            transformer_class=al.TransformerDFT,
+            uv_wavelengths=2.0 * uv_wavelengths,
+            real_space_mask=mask_7x7,
+        )
+        assert key != transformer_cache.transformer_key_from(
+            transformer_class=al.TransformerDFT,
+            uv_wavelengths=uv_wavelengths,
+            real_space_mask=al.Mask2D.manual(
+                mask=mask_7x7, pixel_scales=(2.0, 2.0), sub_size=1
+            ),
+        )
+
+    def test__masked_interferometer_uses_cache_path_of_config(
+        self,
+        cache_path,
+        interferometer_7,
+        sub_mask_7x7,
+        visibilities_mask_7,
+        monkeypatch,
+    ):
+
+        assert transformer_cache.cache_path_from_config() is None
+
+        monkeypatch.setattr(
+            transformer_cache, "cache_path_from_config", lambda: cache_path
+        )
+
+        masked_interferometer = al.MaskedInterferometer(
+            interferometer=interferometer_7,
+            visibilities_mask=visibilities_mask_7,
+            real_space_mask=sub_mask_7x7,
+        )
+
+        assert type(masked_interferometer.transformer) == al.TransformerNUFFT
+        assert masked_interferometer.settings.transformer_class is al.TransformerNUFFT
+        assert len(os.listdir(cache_path)) == 1
@@ -1,6 +1,7 @@
 import autolens as al
 import numpy as np
 import pytest
+import scipy.linalg
 from autoarray.inversion import inversions
 from autogalaxy.mock.mock import MockLightProfile
 
@@ -656,6 +657,108 @@ class TestFitImaging:
                 )
             ).all()
 
+    class TestLikelihoodOnly:
+        def test__figure_of_merit_matches_full_fit__profiles_and_hyper_methods(
+            self, masked_imaging_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                hyper_galaxy=al.HyperGalaxy(
+                    contribution_factor=1.0, noise_factor=1.0, noise_power=1.0
+                ),
+                hyper_model_image=np.ones(9),
+                hyper_galaxy_image=np.ones(9),
+                hyper_minimum_value=0.0,
+            )
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            fit = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_image_sky=al.hyper_data.HyperImageSky(sky_scale=1.0),
+                hyper_background_noise=al.hyper_data.HyperBackgroundNoise(
+                    noise_scale=1.0
+                ),
+            )
+
+            fit_likelihood_only = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                hyper_image_sky=al.hyper_data.HyperImageSky(sky_scale=1.0),
+                hyper_background_noise=al.hyper_data.HyperBackgroundNoise(
+                    noise_scale=1.0
+                ),
+                likelihood_only=True,
+            )
+
+            assert fit_likelihood_only.figure_of_merit == fit.figure_of_merit
+            assert (
+                fit_likelihood_only.profile_subtracted_image
+                == fit.profile_subtracted_image
+            ).all()
+
+        def test__noise_normalization_is_reused_until_noise_map_changes(
+            self, masked_imaging_7x7
+        ):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                    )
+                ]
+            )
+
+            fit = al.FitImaging(
+                masked_imaging=masked_imaging_7x7, tracer=tracer, likelihood_only=True
+            )
+
+            assert fit.figure_of_merit == pytest.approx(fit.log_likelihood, 1.0e-8)
+            assert masked_imaging_7x7.noise_normalization == pytest.approx(
+                fit.noise_normalization, 1.0e-8
+            )
+
+            masked_imaging_7x7._noise_normalization = 1.0
+
+            assert masked_imaging_7x7.noise_normalization == 1.0
+
+            masked_imaging_7x7.noise_map = 2.0 * masked_imaging_7x7.noise_map
+
+            assert masked_imaging_7x7.noise_normalization == pytest.approx(
+                al.util.fit.noise_normalization_from(
+                    noise_map=masked_imaging_7x7.noise_map
+                ),
+                1.0e-8,
+            )
+
+        def test__figure_of_merit_matches_full_fit__inversion(self, masked_imaging_7x7):
+
+            galaxy_light = al.Galaxy(
+                redshift=0.5, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            pix = al.pix.Rectangular(shape=(3, 3))
+            reg = al.reg.Constant(coefficient=1.0)
+            galaxy_pix = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy_light, galaxy_pix])
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            fit_likelihood_only = al.FitImaging(
+                masked_imaging=masked_imaging_7x7, tracer=tracer, likelihood_only=True
+            )
+
+            assert fit_likelihood_only.figure_of_merit == fit.log_evidence
+
     class TestCompareToManualProfilesOnly:
         def test___all_lens_fit_quantities__no_hyper_methods(self, masked_imaging_7x7):
 
@@ -939,6 +1042,42 @@ class TestFitImaging:
                 == fit.unmasked_blurred_image_of_planes_and_galaxies[1][0]
             ).all()
 
+        def test___use_float32__log_likelihood_matches_double_precision(
+            self, imaging_7x7, sub_mask_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                light_profile=al.lp.EllipticalSersic(intensity=1.0),
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0, light_profile=al.lp.EllipticalSersic(intensity=1.0)
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            masked_imaging = al.MaskedImaging(imaging=imaging_7x7, mask=sub_mask_7x7)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging, tracer=tracer)
+
+            masked_imaging_float32 = al.MaskedImaging(
+                imaging=imaging_7x7,
+                mask=sub_mask_7x7,
+                settings=al.SettingsMaskedImaging(use_float32=True),
+            )
+
+            fit_float32 = al.FitImaging(
+                masked_imaging=masked_imaging_float32, tracer=tracer
+            )
+
+            assert fit_float32.grid.dtype == np.float32
+            assert fit_float32.image.dtype == np.float32
+
+            assert fit_float32.log_likelihood == pytest.approx(
+                fit.log_likelihood, 1.0e-4
+            )
+
     class TestCompareToManualInversionOnly:
         def test___all_lens_fit_quantities__no_hyper_methods(self, masked_imaging_7x7):
 
@@ -1060,6 +1199,125 @@ class TestFitImaging:
                 fit.galaxy_model_image_dict[g1].in_2d, 1.0e-4
             )
 
+        def test___multiple_planes_with_pixelizations__joint_inversion_of_all_planes(
+            self, masked_imaging_7x7
+        ):
+
+            reg_0 = al.reg.Constant(coefficient=1.0)
+            reg_1 = al.reg.Constant(coefficient=2.0)
+
+            g0 = al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                mass=al.mp.SphericalIsothermal(einstein_radius=0.1),
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=reg_0,
+            )
+            g2 = al.Galaxy(
+                redshift=2.0,
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=reg_1,
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+
+            mappers_of_planes = tracer.mappers_of_planes_from_grid(
+                grid=masked_imaging_7x7.grid_inversion
+            )
+
+            blurred_mapping_matrix = np.hstack(
+                [
+                    masked_imaging_7x7.convolver.convolve_mapping_matrix(
+                        mapping_matrix=mapper.mapping_matrix
+                    )
+                    for mapper in mappers_of_planes[1:]
+                ]
+            )
+
+            regularization_matrix = scipy.linalg.block_diag(
+                reg_0.regularization_matrix_from_mapper(mapper=mappers_of_planes[1]),
+                reg_1.regularization_matrix_from_mapper(mapper=mappers_of_planes[2]),
+            )
+
+            curvature_reg_matrix = (
+                al.util.inversion.curvature_matrix_via_mapping_matrix_from(
+                    mapping_matrix=blurred_mapping_matrix,
+                    noise_map=masked_imaging_7x7.noise_map,
+                )
+                + regularization_matrix
+            )
+
+            reconstruction = np.linalg.solve(
+                curvature_reg_matrix,
+                al.util.inversion.data_vector_via_blurred_mapping_matrix_from(
+                    blurred_mapping_matrix=blurred_mapping_matrix,
+                    image=masked_imaging_7x7.image,
+                    noise_map=masked_imaging_7x7.noise_map,
+                ),
+            )
+
+            assert fit.inversion.inversions[0].reconstruction == pytest.approx(
+                reconstruction[:9], 1.0e-4
+            )
+            assert fit.inversion.inversions[1].reconstruction == pytest.approx(
+                reconstruction[9:], 1.0e-4
+            )
+
+            covariance = np.linalg.inv(curvature_reg_matrix)
+
+            assert fit.inversion.inversions[0].errors == pytest.approx(
+                np.diagonal(covariance)[:9], 1.0e-4
+            )
+            assert fit.inversion.errors_with_covariance == pytest.approx(
+                covariance[9:, 9:], 1.0e-4
+            )
+
+            fit_sparse = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                settings_inversion=al.SettingsInversion(use_sparse_matrices=True),
+            )
+
+            assert fit_sparse.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+
+            assert fit.galaxy_model_image_dict[g1] == pytest.approx(
+                blurred_mapping_matrix[:, :9] @ reconstruction[:9], 1.0e-4
+            )
+            assert fit.galaxy_model_image_dict[g2] == pytest.approx(
+                blurred_mapping_matrix[:, 9:] @ reconstruction[9:], 1.0e-4
+            )
+            assert fit.model_images_of_planes[2] == pytest.approx(
+                fit.galaxy_model_image_dict[g2], 1.0e-4
+            )
+
+            chi_squared_map = al.util.fit.chi_squared_map_from(
+                residual_map=masked_imaging_7x7.image
+                - blurred_mapping_matrix @ reconstruction,
+                noise_map=masked_imaging_7x7.noise_map,
+            )
+
+            log_evidence = al.util.fit.log_evidence_from(
+                chi_squared=al.util.fit.chi_squared_from(
+                    chi_squared_map=chi_squared_map
+                ),
+                regularization_term=reconstruction
+                @ regularization_matrix
+                @ reconstruction,
+                log_curvature_regularization_term=np.linalg.slogdet(
+                    curvature_reg_matrix
+                )[1],
+                log_regularization_term=np.linalg.slogdet(regularization_matrix)[1],
+                noise_normalization=al.util.fit.noise_normalization_from(
+                    noise_map=masked_imaging_7x7.noise_map
+                ),
+            )
+
+            assert fit.log_evidence == pytest.approx(log_evidence, 1.0e-4)
+
         def test___all_lens_fit_quantities__include_hyper_methods(
             self, masked_imaging_7x7
         ):
@@ -1658,11 +1916,10 @@ class TestFitInterferometer:
 
             tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
 
-            fit = al.FitInterferometer(
-                masked_interferometer=masked_interferometer_7, tracer=tracer
-            )
-
-            assert fit.total_inversions == 3
+            with pytest.raises(NotImplementedError):
+                al.FitInterferometer(
+                    masked_interferometer=masked_interferometer_7, tracer=tracer
+                )
 
     class TestLikelihood:
         def test__1x2_image__1x2_visibilities__simple_fourier_transform(self):
@@ -2253,6 +2510,46 @@ class TestFitInterferometer:
                 fit.galaxy_model_visibilities_dict[g1].in_1d, 1.0e-4
             )
 
+        def test___pixelization_not_in_last_plane__inversion_uses_plane_with_pixelization(
+            self, masked_interferometer_7
+        ):
+            pix = al.pix.Rectangular(shape=(3, 3))
+            reg = al.reg.Constant(coefficient=1.0)
+
+            g0 = al.Galaxy(redshift=0.5, pixelization=pix, regularization=reg)
+            g1 = al.Galaxy(redshift=1.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            fit = al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+
+            mapper = pix.mapper_from_grid_and_sparse_grid(
+                grid=masked_interferometer_7.grid, sparse_grid=None
+            )
+
+            inversion = inversions.InversionInterferometerMatrix.from_data_mapper_and_regularization(
+                mapper=mapper,
+                regularization=reg,
+                visibilities=masked_interferometer_7.visibilities,
+                noise_map=masked_interferometer_7.noise_map,
+                transformer=masked_interferometer_7.transformer,
+            )
+
+            assert fit.inversion.reconstruction == pytest.approx(
+                inversion.reconstruction, 1.0e-4
+            )
+
+            g1 = al.Galaxy(redshift=1.0, pixelization=pix, regularization=reg)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1])
+
+            with pytest.raises(NotImplementedError):
+                al.FitInterferometer(
+                    masked_interferometer=masked_interferometer_7, tracer=tracer
+                )
+
         def test___all_lens_fit_quantities__hyper_background_noise(
             self, masked_interferometer_7
         ):
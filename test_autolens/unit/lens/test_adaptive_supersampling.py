@@ -0,0 +1,142 @@
+import autolens as al
+import numpy as np
+import pytest
+
+
+class TestAdaptiveSupersampling:
+    def test__binned_image_variations_and_spacings(self, sub_grid_7x7):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light=al.lp.SphericalSersic(intensity=1.0)),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        adaptive_supersampling = al.AdaptiveSupersampling()
+
+        (
+            binned_image,
+            variations,
+            spacings,
+        ) = adaptive_supersampling.binned_image_variations_and_spacings_from(
+            tracer=tracer, grid=sub_grid_7x7
+        )
+
+        image = tracer.image_from_grid(grid=sub_grid_7x7)
+
+        assert binned_image == pytest.approx(np.asarray(image.in_1d_binned), 1.0e-8)
+        assert variations == pytest.approx(
+            np.max(np.asarray(image).reshape(9, 4), axis=1)
+            - np.min(np.asarray(image).reshape(9, 4), axis=1),
+            1.0e-8,
+        )
+        assert spacings == pytest.approx(np.full(9, np.sqrt(2.0) * 0.5), 1.0e-4)
+
+    def test__sub_size_1__spacings_from_pixel_scales__pixels_not_refined(
+        self, blurring_grid_7x7
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light=al.lp.SphericalSersic(intensity=1.0)),
+                al.Galaxy(redshift=1.0),
+            ]
+        )
+
+        adaptive_supersampling = al.AdaptiveSupersampling(source_plane_resolution=2.0)
+
+        (
+            binned_image,
+            variations,
+            spacings,
+        ) = adaptive_supersampling.binned_image_variations_and_spacings_from(
+            tracer=tracer, grid=blurring_grid_7x7
+        )
+
+        assert variations == pytest.approx(np.zeros(16), 1.0e-8)
+        assert spacings == pytest.approx(np.full(16, np.sqrt(2.0)), 1.0e-4)
+
+        (
+            image,
+            sub_sizes,
+        ) = adaptive_supersampling.binned_image_and_sub_sizes_from_tracer_and_grid(
+            tracer=tracer, grid=blurring_grid_7x7
+        )
+
+        assert image == pytest.approx(binned_image, 1.0e-8)
+        assert (sub_sizes == 1).all()
+
+    def test__is_converged_from(self):
+
+        adaptive_supersampling = al.AdaptiveSupersampling(fractional_accuracy=0.9)
+
+        is_converged = adaptive_supersampling.is_converged_from(
+            image_lower_sub=np.array([1.0, 1.0, 0.95, 0.0, 0.0]),
+            image_higher_sub=np.array([1.0, 2.0, 1.0, 0.0, 1.0]),
+        )
+
+        assert (is_converged == np.array([True, False, True, True, False])).all()
+
+    def test__pixels_with_varying_source_are_supersampled_to_converge_to_high_sub_size_image(
+        self,
+    ):
+
+        mask = al.Mask2D.circular(
+            shape_2d=(60, 60), pixel_scales=0.05, radius=1.5, sub_size=2
+        )
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            mass=al.mp.EllipticalIsothermal(
+                einstein_radius=1.0, elliptical_comps=(0.1, 0.0)
+            ),
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0,
+            light=al.lp.EllipticalSersic(
+                centre=(0.05, 0.05), intensity=1.0, effective_radius=0.2
+            ),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
+
+        image_sub_2 = np.asarray(
+            tracer.image_from_grid(grid=al.Grid.from_mask(mask=mask)).in_1d_binned
+        )
+        image_sub_16 = np.asarray(
+            tracer.image_from_grid(
+                grid=al.Grid.from_mask(
+                    mask=mask.mask_new_sub_size_from_mask(mask=mask, sub_size=16)
+                )
+            ).in_1d_binned
+        )
+
+        adaptive_supersampling = al.AdaptiveSupersampling(
+            sub_steps=(4, 8, 16), relative_variation=0.03
+        )
+
+        (
+            image,
+            sub_sizes,
+        ) = adaptive_supersampling.binned_image_and_sub_sizes_from_tracer_and_grid(
+            tracer=tracer, grid=al.Grid.from_mask(mask=mask)
+        )
+
+        assert np.min(sub_sizes) == 2
+        assert np.max(sub_sizes) == 16
+        assert np.mean(sub_sizes ** 2.0) < 64.0
+
+        assert np.max(np.abs(image - image_sub_16)) < 0.1 * np.max(
+            np.abs(image_sub_2 - image_sub_16)
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[lens_galaxy, source_galaxy],
+            adaptive_supersampling=adaptive_supersampling,
+        )
+
+        image_tracer = tracer.image_from_grid(grid=al.Grid.from_mask(mask=mask))
+
+        assert isinstance(image_tracer, al.Array)
+        assert np.asarray(image_tracer.in_1d_binned) == pytest.approx(image, 1.0e-8)
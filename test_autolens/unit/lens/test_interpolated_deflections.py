@@ -0,0 +1,127 @@
+import autolens as al
+import numpy as np
+import pytest
+
+
+class TestInterpolatedDeflections:
+    def test__linear_deflections_are_interpolated_exactly(self):
+
+        grid = np.asarray(
+            al.Grid.uniform(
+                shape_2d=(10, 10), pixel_scales=0.1, sub_size=4, origin=(2.05, 2.05)
+            )
+        )
+
+        shear = al.mp.ExternalShear(elliptical_comps=(0.1, 0.05))
+
+        interpolated_deflections = al.InterpolatedDeflections(
+            pixel_scale=0.3, maximum_error=1.0e-8
+        )
+
+        evaluated_grids = []
+
+        def func(grid):
+            evaluated_grids.append(grid)
+            return shear.deflections_from_grid(grid=grid)
+
+        deflections = interpolated_deflections.deflections_from_func_and_grid(
+            func=func, grid=grid
+        )
+
+        assert deflections == pytest.approx(
+            shear.deflections_from_grid(grid=grid), 1.0e-6
+        )
+
+        assert len(evaluated_grids) == 2
+        assert evaluated_grids[0].shape[0] == 25
+        assert evaluated_grids[1].shape[0] == 56
+
+    def test__error_at_edge_midpoints_but_not_centre__cells_evaluated_exactly(self):
+
+        grid = np.asarray(
+            al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.1, sub_size=4)
+        )
+
+        def func(grid):
+            return np.stack(
+                (grid[:, 0] ** 2.0 - grid[:, 1] ** 2.0, np.zeros(grid.shape[0])),
+                axis=-1,
+            )
+
+        deflections = al.InterpolatedDeflections(
+            pixel_scale=0.3, maximum_error=1.0e-3
+        ).deflections_from_func_and_grid(func=func, grid=grid)
+
+        assert deflections == pytest.approx(func(grid), 1.0e-8)
+
+    def test__cells_above_maximum_error_are_evaluated_exactly(self):
+
+        grid = np.asarray(
+            al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.1, sub_size=4)
+        )
+
+        mass = al.mp.SphericalIsothermal(centre=(0.05, 0.05), einstein_radius=1.0)
+
+        deflections = al.InterpolatedDeflections(
+            pixel_scale=0.1, maximum_error=1.0e-3
+        ).deflections_from_func_and_grid(func=mass.deflections_from_grid, grid=grid)
+
+        exact_deflections = mass.deflections_from_grid(grid=grid)
+
+        assert np.max(np.abs(deflections - exact_deflections)) < 2.0e-3
+
+        deflections = al.InterpolatedDeflections(
+            pixel_scale=0.1, maximum_error=0.0
+        ).deflections_from_func_and_grid(func=mass.deflections_from_grid, grid=grid)
+
+        assert deflections == pytest.approx(exact_deflections, 1.0e-8)
+
+    def test__grids_with_fewer_coordinates_than_coarse_grid_are_evaluated_exactly(self):
+
+        grid = np.array([[0.0, 1.0], [1.0, 0.0]])
+
+        mass = al.mp.SphericalIsothermal(einstein_radius=1.0)
+
+        deflections = al.InterpolatedDeflections(
+            pixel_scale=0.1
+        ).deflections_from_func_and_grid(func=mass.deflections_from_grid, grid=grid)
+
+        assert deflections == pytest.approx(np.array([[0.0, 1.0], [1.0, 0.0]]), 1.0e-4)
+
+    def test__tracer_with_interpolated_deflections__traced_grids_match_exact_tracing(
+        self, sub_grid_7x7
+    ):
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.05, 0.05),
+                    elliptical_comps=(0.1, 0.0),
+                    einstein_radius=1.0,
+                ),
+            ),
+            al.Galaxy(
+                redshift=0.75, mass=al.mp.SphericalIsothermal(einstein_radius=0.1)
+            ),
+            al.Galaxy(redshift=1.0),
+        ]
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        interpolated_tracer = al.Tracer.from_galaxies(
+            galaxies=galaxies,
+            interpolated_deflections=al.InterpolatedDeflections(
+                pixel_scale=0.1, maximum_error=1.0e-4
+            ),
+        )
+
+        traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+        interpolated_traced_grids = interpolated_tracer.traced_grids_of_planes_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        assert isinstance(interpolated_traced_grids[2], al.Grid)
+        assert interpolated_traced_grids[2] == pytest.approx(
+            traced_grids[2], abs=1.0e-3
+        )
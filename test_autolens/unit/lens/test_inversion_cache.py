@@ -0,0 +1,240 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+import autolens as al
+from autoarray import exc
+from autolens.lens import inversion_cache
+
+
+def tracer_from(centre=(0.0, 0.0), coefficient=1.0):
+
+    lens = al.Galaxy(
+        redshift=0.5,
+        mass=al.mp.SphericalIsothermal(centre=centre, einstein_radius=1.0),
+    )
+
+    source = al.Galaxy(
+        redshift=1.0,
+        pixelization=al.pix.Rectangular(shape=(3, 3)),
+        regularization=al.reg.Constant(coefficient=coefficient),
+    )
+
+    return al.Tracer.from_galaxies(galaxies=[lens, source])
+
+
+class TestInversionCache:
+    def test__imaging__same_inversion_as_without_cache_and_curvature_matrix_reused(
+        self, masked_imaging_7x7
+    ):
+
+        cache = inversion_cache.InversionCache()
+
+        for coefficient in [1.0, 2.0, 2.0]:
+
+            tracer = tracer_from(coefficient=coefficient)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+            fit_cached = al.FitImaging(
+                masked_imaging=masked_imaging_7x7, tracer=tracer, inversion_cache=cache,
+            )
+
+            assert fit_cached.inversion.reconstruction == pytest.approx(
+                fit.inversion.reconstruction, 1.0e-8
+            )
+            assert fit_cached.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+
+        assert cache.curvature_matrix_reuses == 2
+
+        fit_cached = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer_from(centre=(0.3, 0.1)),
+            inversion_cache=cache,
+        )
+
+        assert cache.curvature_matrix_reuses == 2
+
+    def test__interferometer__same_inversion_as_without_cache_and_curvature_matrix_reused(
+        self, masked_interferometer_7
+    ):
+
+        cache = inversion_cache.InversionCache()
+
+        for coefficient in [1.0, 2.0]:
+
+            tracer = tracer_from(coefficient=coefficient)
+
+            fit = al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7, tracer=tracer
+            )
+            fit_cached = al.FitInterferometer(
+                masked_interferometer=masked_interferometer_7,
+                tracer=tracer,
+                inversion_cache=cache,
+            )
+
+            assert fit_cached.inversion.reconstruction == pytest.approx(
+                fit.inversion.reconstruction, 1.0e-8
+            )
+            assert fit_cached.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+
+        assert cache.curvature_matrix_reuses == 1
+
+    def test__iterative_solver__log_evidence_within_tolerance_of_exact(
+        self, masked_imaging_7x7
+    ):
+
+        cache = inversion_cache.InversionCache()
+
+        settings_inversion = al.SettingsInversion(
+            use_inversion_cache=True,
+            use_iterative_solver=True,
+            tolerance=1.0e-10,
+            log_det_tolerance=0.01,
+        )
+
+        for coefficient in [1.0, 1.01]:
+
+            tracer = tracer_from(coefficient=coefficient)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+            fit_cached = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                settings_inversion=settings_inversion,
+                inversion_cache=cache,
+            )
+
+            assert fit_cached.inversion.reconstruction == pytest.approx(
+                fit.inversion.reconstruction, 1.0e-6
+            )
+            assert fit_cached.log_evidence == pytest.approx(fit.log_evidence, abs=0.05)
+
+        assert cache.iterative_solves == 1
+        assert 0.0 < fit_cached.inversion.log_evidence_error < 0.5 * 0.01
+
+        fit_cached = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer_from(coefficient=3.0),
+            settings_inversion=settings_inversion,
+            inversion_cache=cache,
+        )
+
+        assert cache.iterative_solves == 1
+        assert cache.cholesky is cache.reference_cholesky
+        assert fit_cached.inversion.log_evidence_error == 0.0
+
+    def test__iterative_solver__same_instance_after_different_instance_within_tolerance(
+        self, masked_imaging_7x7
+    ):
+
+        cache = inversion_cache.InversionCache()
+
+        settings_inversion = al.SettingsInversion(
+            use_inversion_cache=True, use_iterative_solver=True
+        )
+
+        def log_evidence_from(coefficient):
+            return al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer_from(coefficient=coefficient),
+                settings_inversion=settings_inversion,
+                inversion_cache=cache,
+            ).log_evidence
+
+        log_evidence_from(coefficient=1.0)
+        log_evidence = log_evidence_from(coefficient=1.1)
+
+        log_evidence_from(coefficient=1.2)
+        log_evidence_after_different_instance = log_evidence_from(coefficient=1.1)
+
+        assert cache.iterative_solves == 2
+
+        assert log_evidence_after_different_instance == pytest.approx(
+            log_evidence, abs=settings_inversion.log_det_tolerance
+        )
+
+        fit = al.FitImaging(
+            masked_imaging=masked_imaging_7x7, tracer=tracer_from(coefficient=1.1)
+        )
+
+        assert log_evidence_after_different_instance == pytest.approx(
+            fit.log_evidence, abs=settings_inversion.log_det_tolerance
+        )
+
+    def test__sparse_matrices__same_inversion_as_dense(self, masked_imaging_7x7):
+
+        cache = inversion_cache.InversionCache()
+
+        settings_inversion = al.SettingsInversion(use_sparse_matrices=True)
+
+        for coefficient in [1.0, 2.0, 2.0]:
+
+            tracer = tracer_from(coefficient=coefficient)
+
+            fit = al.FitImaging(masked_imaging=masked_imaging_7x7, tracer=tracer)
+            fit_sparse = al.FitImaging(
+                masked_imaging=masked_imaging_7x7,
+                tracer=tracer,
+                settings_inversion=settings_inversion,
+                inversion_cache=cache,
+            )
+
+            assert sparse.issparse(fit_sparse.inversion.curvature_reg_matrix)
+            assert fit_sparse.inversion.reconstruction == pytest.approx(
+                fit.inversion.reconstruction, 1.0e-6
+            )
+            assert fit_sparse.inversion.mapped_reconstructed_image == pytest.approx(
+                fit.inversion.mapped_reconstructed_image, 1.0e-6
+            )
+            assert fit_sparse.inversion.errors == pytest.approx(
+                fit.inversion.errors, 1.0e-6
+            )
+            assert fit_sparse.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+
+        assert cache.curvature_matrix_reuses == 2
+
+        fit_sparse = al.FitImaging(
+            masked_imaging=masked_imaging_7x7,
+            tracer=tracer_from(coefficient=2.0),
+            settings_inversion=settings_inversion,
+        )
+
+        assert sparse.issparse(fit_sparse.inversion.curvature_reg_matrix)
+        assert fit_sparse.log_evidence == pytest.approx(fit.log_evidence, 1.0e-8)
+
+    def test__curvature_reg_matrix_not_positive_definite__raises_exception(self):
+
+        cache = inversion_cache.InversionCache()
+
+        cache.curvature_matrix = -1.0 * np.identity(3)
+
+        with pytest.raises(exc.InversionException):
+            cache._reconstruction_from(
+                data_vector=np.ones(3),
+                regularization_matrix=np.zeros((3, 3)),
+                settings=al.SettingsInversion(),
+            )
+
+
+class TestSettingsInversion:
+    def test__use_sparse_matrices_tag(self):
+
+        settings = al.SettingsInversion(use_sparse_matrices=True)
+
+        assert settings.tag == "inv[mat__sparse]"
+
+        with pytest.raises(al.exc.SettingsException):
+            al.SettingsInversion(
+                use_inversion_cache=True,
+                use_iterative_solver=True,
+                use_sparse_matrices=True,
+            )
+
+        with pytest.raises(al.exc.SettingsException):
+            al.SettingsInversion(use_iterative_solver=True)
+
+    def test__use_inversion_cache_tag(self):
+
+        assert al.SettingsInversion().tag == "inv[mat]"
+        assert al.SettingsInversion(use_inversion_cache=True).tag == "inv[mat__cache]"
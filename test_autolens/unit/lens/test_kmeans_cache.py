@@ -0,0 +1,171 @@
+import pytest
+
+import autolens as al
+from autolens.lens import kmeans_cache
+
+
+@pytest.fixture(name="hyper_image_7x7")
+def make_hyper_image_7x7(sub_grid_7x7):
+    return (
+        al.lp.EllipticalSersic(intensity=1.0)
+        .image_from_grid(grid=sub_grid_7x7)
+        .in_1d_binned
+    )
+
+
+@pytest.fixture(name="cache")
+def make_cache(monkeypatch):
+
+    cache = kmeans_cache.KMeansCache(max_size=2)
+
+    monkeypatch.setattr(kmeans_cache, "kmeans_cache", cache)
+
+    return cache
+
+
+def plane_from(hyper_image, pixels=6, weight_power=1.0):
+
+    galaxy = al.Galaxy(
+        redshift=1.0,
+        pixelization=al.pix.VoronoiBrightnessImage(
+            pixels=pixels, weight_floor=0.0, weight_power=weight_power
+        ),
+        regularization=al.reg.Constant(),
+    )
+    galaxy.hyper_galaxy_image = hyper_image
+
+    return al.Plane(redshift=1.0, galaxies=[galaxy])
+
+
+class TestKMeansCache:
+    def test__sparse_grid_identical_to_pixelization_and_reused(
+        self, sub_grid_7x7, hyper_image_7x7, cache
+    ):
+
+        plane = plane_from(hyper_image=hyper_image_7x7)
+
+        sparse_grid = plane.sparse_image_plane_grid_from_grid(grid=sub_grid_7x7)
+
+        sparse_grid_cached = kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane,
+            grid=sub_grid_7x7,
+            settings_pixelization=al.SettingsPixelization(),
+        )
+
+        assert (sparse_grid_cached == sparse_grid).all()
+        assert (
+            sparse_grid_cached.nearest_pixelization_1d_index_for_mask_1d_index
+            == sparse_grid.nearest_pixelization_1d_index_for_mask_1d_index
+        ).all()
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        assert (
+            kmeans_cache.sparse_image_plane_grid_from(
+                plane=plane_from(hyper_image=hyper_image_7x7.copy()),
+                grid=sub_grid_7x7,
+                settings_pixelization=al.SettingsPixelization(),
+            )
+            is sparse_grid_cached
+        )
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane_from(hyper_image=hyper_image_7x7, weight_power=2.0),
+            grid=sub_grid_7x7,
+            settings_pixelization=al.SettingsPixelization(),
+        )
+        kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane,
+            grid=sub_grid_7x7,
+            settings_pixelization=al.SettingsPixelization(kmeans_seed=1),
+        )
+
+        assert (cache.hits, cache.misses) == (1, 3)
+        assert len(cache.sparse_grids) == 2
+
+        kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane,
+            grid=sub_grid_7x7,
+            settings_pixelization=al.SettingsPixelization(),
+        )
+
+        assert (cache.hits, cache.misses) == (1, 4)
+
+    def test__stochastic_sparse_grids_are_not_cached(
+        self, sub_grid_7x7, hyper_image_7x7, cache
+    ):
+
+        kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane_from(hyper_image=hyper_image_7x7),
+            grid=sub_grid_7x7,
+            settings_pixelization=al.SettingsPixelization(is_stochastic=True),
+        )
+
+        assert cache.misses == 0
+        assert len(cache.sparse_grids) == 0
+
+    def test__mini_batch_kmeans(self, sub_grid_7x7, hyper_image_7x7, cache):
+
+        plane = plane_from(hyper_image=hyper_image_7x7)
+
+        settings_pixelization = al.SettingsPixelization(use_mini_batch_kmeans=True)
+
+        sparse_grid = kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane, grid=sub_grid_7x7, settings_pixelization=settings_pixelization
+        )
+
+        assert isinstance(sparse_grid, al.GridVoronoi)
+        assert sparse_grid.shape == (6, 2)
+        assert sparse_grid.nearest_pixelization_1d_index_for_mask_1d_index.shape == (
+            sub_grid_7x7.in_1d_binned.shape[0],
+        )
+        assert (cache.hits, cache.misses) == (0, 1)
+
+        assert (
+            kmeans_cache.sparse_image_plane_grid_from(
+                plane=plane,
+                grid=sub_grid_7x7,
+                settings_pixelization=settings_pixelization,
+            )
+            is sparse_grid
+        )
+        assert (cache.hits, cache.misses) == (1, 1)
+
+        cache.clear()
+
+        sparse_grid_recomputed = kmeans_cache.sparse_image_plane_grid_from(
+            plane=plane, grid=sub_grid_7x7, settings_pixelization=settings_pixelization
+        )
+
+        assert sparse_grid_recomputed is not sparse_grid
+        assert (sparse_grid_recomputed == sparse_grid).all()
+        assert (
+            sparse_grid_recomputed.nearest_pixelization_1d_index_for_mask_1d_index
+            == sparse_grid.nearest_pixelization_1d_index_for_mask_1d_index
+        ).all()
+
+    def test__tracer_uses_cache(self, sub_grid_7x7, hyper_image_7x7, cache):
+
+        plane = plane_from(hyper_image=hyper_image_7x7)
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5)] + plane.galaxies
+        )
+
+        for i in range(2):
+            tracer.sparse_image_plane_grids_of_planes_from_grid(grid=sub_grid_7x7)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+
+
+class TestSettingsPixelization:
+    def test__use_mini_batch_kmeans_tag(self):
+
+        settings = al.SettingsPixelization(use_border=True)
+
+        assert settings.tag == "pix[use_border]"
+
+        settings = al.SettingsPixelization(use_border=True, use_mini_batch_kmeans=True)
+
+        assert settings.tag == "pix[use_border__mbkmeans]"
+        assert settings.settings_with_is_stochastic_true().use_mini_batch_kmeans
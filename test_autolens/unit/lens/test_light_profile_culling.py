@@ -0,0 +1,110 @@
+import autolens as al
+import numpy as np
+import pytest
+
+
+class TestLightProfileCulling:
+    def test__bounding_radius__intensity_at_radius_is_flux_tolerance(self):
+
+        light_profile_culling = al.LightProfileCulling(flux_tolerance=1.0e-4)
+
+        sersic = al.lp.SphericalSersic(
+            intensity=2.0, effective_radius=0.5, sersic_index=2.0
+        )
+
+        bounding_radius = light_profile_culling.bounding_radius_from_light_profile(
+            light_profile=sersic
+        )
+
+        assert sersic.image_from_grid(grid=np.array([[0.0, bounding_radius]]))[
+            0
+        ] == pytest.approx(2.0e-4, 1.0e-4)
+
+        gaussian = al.lp.SphericalGaussian(intensity=2.0, sigma=0.5)
+
+        bounding_radius = light_profile_culling.bounding_radius_from_light_profile(
+            light_profile=gaussian
+        )
+
+        assert gaussian.image_from_grid(grid=np.array([[0.0, bounding_radius]]))[
+            0
+        ] == pytest.approx(2.0e-4, 1.0e-4)
+
+        sersic = al.lp.EllipticalSersic(
+            elliptical_comps=(0.0, 0.333333),
+            intensity=2.0,
+            effective_radius=0.5,
+            sersic_index=2.0,
+        )
+
+        bounding_radius = light_profile_culling.bounding_radius_from_light_profile(
+            light_profile=sersic
+        )
+
+        image_major_axis = sersic.image_from_grid(
+            grid=np.array([[0.0, bounding_radius], [bounding_radius, 0.0]])
+        )
+
+        assert np.max(image_major_axis) == pytest.approx(2.0e-4, 1.0e-4)
+
+        assert (
+            light_profile_culling.bounding_radius_from_light_profile(
+                light_profile=al.lp.EllipticalCoreSersic()
+            )
+            is None
+        )
+
+    def test__image_from_light_profile_and_grid__culled_coordinates_are_zero(self):
+
+        light_profile_culling = al.LightProfileCulling(flux_tolerance=1.0e-4)
+
+        sersic = al.lp.SphericalSersic(
+            centre=(1.0, 1.0), intensity=1.0, effective_radius=0.1, sersic_index=1.0
+        )
+
+        grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.2, sub_size=2)
+
+        image = light_profile_culling.image_from_light_profile_and_grid(
+            light_profile=sersic, grid=grid
+        )
+
+        image_full = sersic.image_from_grid(grid=grid)
+
+        assert isinstance(image, al.Array)
+        assert 0 < np.count_nonzero(image) < grid.shape[0]
+        assert image == pytest.approx(np.asarray(image_full), abs=1.0e-4)
+        assert (image[image != 0.0] == image_full[image != 0.0]).all()
+
+
+class TestTracerWithLightProfileCulling:
+    def test__image__same_as_tracer_without_culling(self, sub_grid_7x7):
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=1.0),
+            mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0,
+            bulge=al.lp.SphericalSersic(
+                centre=(0.1, 0.1), intensity=1.0, effective_radius=0.1
+            ),
+            disk=al.lp.EllipticalCoreSersic(intensity=1.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
+
+        image = tracer.image_from_grid(grid=sub_grid_7x7)
+
+        for threaded_evaluation in [None, al.ThreadedEvaluation(number_of_threads=2)]:
+
+            tracer_culled = al.Tracer.from_galaxies(
+                galaxies=[lens_galaxy, source_galaxy],
+                threaded_evaluation=threaded_evaluation,
+                light_profile_culling=al.LightProfileCulling(flux_tolerance=1.0e-8),
+            )
+
+            image_culled = tracer_culled.image_from_grid(grid=sub_grid_7x7)
+
+            assert isinstance(image_culled, al.Array)
+            assert image_culled == pytest.approx(np.asarray(image), 1.0e-4)
@@ -0,0 +1,142 @@
+import autolens as al
+import numpy as np
+import pytest
+from astropy import cosmology as cosmo
+
+
+class TestLinearDeflections:
+    def test__deflections_convergence_and_potential_of_constant_plus_gradient(self):
+
+        linear_deflections = al.LinearDeflections(
+            centre=(1.0, 0.0),
+            deflections=(0.1, 0.2),
+            gradient=((0.1, 0.05), (0.05, 0.3)),
+        )
+
+        deflections = linear_deflections.deflections_from_grid(
+            grid=np.array([(1.0, 0.0), (2.0, 1.0)])
+        )
+
+        assert deflections[0] == pytest.approx((0.1, 0.2), 1.0e-4)
+        assert deflections[1] == pytest.approx((0.25, 0.55), 1.0e-4)
+
+        convergence = linear_deflections.convergence_from_grid(
+            grid=np.array([(2.0, 1.0)])
+        )
+
+        assert convergence[0] == pytest.approx(0.2, 1.0e-4)
+        assert linear_deflections.convergence_func(grid_radius=1.0) == pytest.approx(
+            0.2, 1.0e-4
+        )
+
+        potential = linear_deflections.potential_from_grid(grid=np.array([(2.0, 1.0)]))
+
+        assert potential[0] == pytest.approx(0.3 + 0.5 * 0.5, 1.0e-4)
+
+
+class TestLineOfSightCulling:
+    def test__galaxies_below_tolerance_are_dropped_and_truncation_error_reported(
+        self, sub_grid_7x7
+    ):
+
+        lens_g0 = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+        source_g0 = al.Galaxy(redshift=2.0, light=al.lp.SphericalSersic(intensity=1.0))
+        los_g0 = al.Galaxy(
+            redshift=0.25,
+            mass=al.mp.SphericalIsothermal(centre=(0.1, 0.1), einstein_radius=0.1),
+        )
+        los_g1 = al.Galaxy(
+            redshift=1.25,
+            mass=al.mp.PointMass(centre=(50.0, 50.0), einstein_radius=0.1),
+        )
+
+        tracer = al.Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
+            lens_galaxies=[lens_g0],
+            line_of_sight_galaxies=[los_g0, los_g1],
+            source_galaxies=[source_g0],
+            planes_between_lenses=[1, 1],
+            cosmology=cosmo.Planck15,
+        )
+
+        culling = al.LineOfSightCulling(
+            tracer=tracer,
+            grid=sub_grid_7x7,
+            line_of_sight_galaxies=[los_g0, los_g1],
+            deflection_tolerance=0.01,
+        )
+
+        assert culling.max_deflections[0] == pytest.approx(0.1, 1.0e-4)
+        assert culling.max_deflections[1] < 0.01
+        assert culling.culled_galaxies == [los_g1]
+        assert culling.total_culled_galaxies == 1
+        assert culling.truncation_error == pytest.approx(
+            culling.max_deflections[1], 1.0e-4
+        )
+
+        assert culling.tracer.plane_redshifts == tracer.plane_redshifts
+        assert culling.tracer.planes[0].galaxies == [los_g0]
+        assert culling.tracer.planes[2].galaxies == []
+
+        image = tracer.image_from_grid(grid=sub_grid_7x7)
+        culled_image = culling.tracer.image_from_grid(grid=sub_grid_7x7)
+
+        assert culled_image == pytest.approx(image, 1.0e-2)
+
+    def test__galaxies_below_tolerance_are_approximated_by_linear_deflections(
+        self, sub_grid_7x7
+    ):
+
+        lens_g0 = al.Galaxy(
+            redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+        )
+        source_g0 = al.Galaxy(redshift=2.0)
+        los_g0 = al.Galaxy(
+            redshift=1.25,
+            mass=al.mp.PointMass(centre=(20.0, 20.0), einstein_radius=0.5),
+        )
+
+        tracer = al.Tracer.sliced_tracer_from_lens_line_of_sight_and_source_galaxies(
+            lens_galaxies=[lens_g0],
+            line_of_sight_galaxies=[los_g0],
+            source_galaxies=[source_g0],
+            planes_between_lenses=[1, 1],
+            cosmology=cosmo.Planck15,
+        )
+
+        culling = al.LineOfSightCulling(
+            tracer=tracer,
+            grid=sub_grid_7x7,
+            line_of_sight_galaxies=[los_g0],
+            deflection_tolerance=0.1,
+            approximate=True,
+        )
+
+        assert culling.culled_galaxies == [los_g0]
+
+        linear_deflections = culling.tracer.planes[2].galaxies[0].mass
+
+        assert isinstance(linear_deflections, al.LinearDeflections)
+        assert culling.truncation_error < 1.0e-4
+
+        traced_grid = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)[-1]
+        culled_traced_grid = culling.tracer.traced_grids_of_planes_from_grid(
+            grid=sub_grid_7x7
+        )[-1]
+
+        assert np.max(np.abs(culled_traced_grid - traced_grid)) < 1.0e-4
+
+    def test__galaxy_not_in_tracer__raises_exception(self, sub_grid_7x7):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5), al.Galaxy(redshift=1.0)]
+        )
+
+        with pytest.raises(ValueError):
+            al.LineOfSightCulling(
+                tracer=tracer,
+                grid=sub_grid_7x7,
+                line_of_sight_galaxies=[al.Galaxy(redshift=0.5)],
+                deflection_tolerance=0.01,
+            )
@@ -6,6 +6,7 @@ from os import path
 import shutil
 from astropy import cosmology as cosmo
 from skimage import measure
+from autogalaxy.lensing import LensingObject
 from autoarray.mock import mock as mock_inv
 
 
@@ -674,6 +675,35 @@ class TestAbstractTracer:
                 [(3.0, 3.0), (4.0, 4.0)],
             ]
 
+    class TestTracerWithPlanes:
+        def test__planes_replaced__cosmology_and_strategies_copied(self):
+
+            g0 = al.Galaxy(redshift=0.5, mass=al.mp.SphericalIsothermal())
+            g1 = al.Galaxy(redshift=1.0)
+
+            tree_deflections = al.TreeDeflections(opening_angle=0.1)
+            tiled_evaluation = al.TiledEvaluation(memory_budget_mb=1.0)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1],
+                cosmology=cosmo.WMAP9,
+                tree_deflections=tree_deflections,
+                tiled_evaluation=tiled_evaluation,
+            )
+
+            plane = al.Plane(redshift=1.0, galaxies=[g1])
+
+            tracer_with_planes = tracer.tracer_with_planes(planes=[plane])
+
+            assert isinstance(tracer_with_planes, al.Tracer)
+            assert tracer_with_planes.planes == [plane]
+            assert tracer_with_planes.plane_redshifts == [1.0]
+            assert tracer_with_planes.cosmology is cosmo.WMAP9
+            assert tracer_with_planes.strategies == tracer.strategies
+            assert tracer_with_planes.tree_deflections is tree_deflections
+            assert tracer_with_planes.tiled_evaluation is tiled_evaluation
+            assert tracer_with_planes.threaded_evaluation is None
+
     class TestPickle:
         def test__tracer_can_be_pickled_and_loaded(self):
 
@@ -1191,6 +1221,70 @@ class TestAbstractTracerLensing:
 
             assert len(traced_grids_of_planes) == 2
 
+        def test__scaling_factors_between_planes__computed_once_and_updated_if_planes_change(
+            self,
+        ):
+
+            g0 = al.Galaxy(redshift=0.5)
+            g1 = al.Galaxy(redshift=1.0)
+            g2 = al.Galaxy(redshift=2.0)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            scaling_factors = tracer.scaling_factors_between_planes
+
+            assert scaling_factors[0][1] == pytest.approx(0.67394, 1e-4)
+            assert scaling_factors[0][2] == pytest.approx(1.0, 1e-4)
+            assert scaling_factors[1][2] == pytest.approx(1.0, 1e-4)
+            assert scaling_factors[1][0] is None
+
+            assert tracer.scaling_factors_between_planes is scaling_factors
+
+            tracer.planes = tracer.planes[0:2]
+
+            assert tracer.scaling_factors_between_planes[0][1] == pytest.approx(
+                1.0, 1e-4
+            )
+
+        def test__planes_without_mass_profiles_do_not_change_traced_grids(
+            self, sub_grid_7x7_simple
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                mass_profile=al.mp.SphericalIsothermal(einstein_radius=1.0),
+            )
+            g2 = al.Galaxy(redshift=2.0)
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[g0, g1, g2], cosmology=cosmo.Planck15
+            )
+
+            tracer_with_empty_plane = al.Tracer.from_galaxies(
+                galaxies=[g0, al.Galaxy(redshift=0.75), g1, g2],
+                cosmology=cosmo.Planck15,
+            )
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+            traced_grids_of_planes_with_empty_plane = tracer_with_empty_plane.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7_simple
+            )
+
+            assert traced_grids_of_planes_with_empty_plane[2] == pytest.approx(
+                traced_grids_of_planes[1], 1e-4
+            )
+            assert traced_grids_of_planes_with_empty_plane[3] == pytest.approx(
+                traced_grids_of_planes[2], 1e-4
+            )
+
     class TestProfileImages:
         def test__x1_plane__single_plane_tracer(self, sub_grid_7x7):
             g0 = al.Galaxy(
@@ -2154,6 +2248,147 @@ class TestAbstractTracerLensing:
 
             assert (grid_at_redshift == sub_grid_7x7.geometry.unmasked_grid_sub_1).all()
 
+        def test__does_not_change_planes_of_tracer(self, sub_grid_7x7):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(redshift=2.0),
+                ]
+            )
+
+            tracer.grid_at_redshift_from_grid_and_redshift(
+                grid=sub_grid_7x7, redshift=1.0
+            )
+
+            assert tracer.total_planes == 2
+            assert [plane.redshift for plane in tracer.planes] == [0.5, 2.0]
+
+    class TestTracedGrids:
+        def test__grid_at_any_redshift__same_as_tracer_with_empty_plane_at_redshift(
+            self, sub_grid_7x7
+        ):
+
+            g0 = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    elliptical_comps=(0.1, 0.0), einstein_radius=1.0
+                ),
+            )
+            g1 = al.Galaxy(
+                redshift=1.0,
+                mass=al.mp.SphericalIsothermal(centre=(0.1, 0.0), einstein_radius=0.5),
+            )
+            g2 = al.Galaxy(redshift=2.0)
+
+            tracer = al.Tracer.from_galaxies(galaxies=[g0, g1, g2])
+
+            traced_grids = tracer.traced_grids_from_grid(grid=sub_grid_7x7)
+
+            traced_grids_of_planes = tracer.traced_grids_of_planes_from_grid(
+                grid=sub_grid_7x7
+            )
+
+            for plane_index in range(3):
+                assert (
+                    traced_grids.traced_grids_of_planes[plane_index]
+                    == traced_grids_of_planes[plane_index]
+                ).all()
+
+            assert (
+                traced_grids.grid_at_redshift_from_redshift(redshift=0.3)
+                == sub_grid_7x7
+            ).all()
+            assert (
+                traced_grids.grid_at_redshift_from_redshift(redshift=1.0)
+                == traced_grids_of_planes[1]
+            ).all()
+
+            for redshift in [0.75, 1.5, 3.0]:
+
+                planes = [
+                    al.Plane(redshift=plane.redshift, galaxies=plane.galaxies)
+                    for plane in tracer.planes
+                ]
+
+                planes.append(al.Plane(redshift=redshift, galaxies=[]))
+                planes = sorted(planes, key=lambda plane: plane.redshift)
+
+                plane_index = [plane.redshift for plane in planes].index(redshift)
+
+                tracer_with_plane = al.Tracer(planes=planes, cosmology=tracer.cosmology)
+
+                grid_at_redshift = traced_grids.grid_at_redshift_from_redshift(
+                    redshift=redshift
+                )
+
+                if redshift < 2.0:
+                    assert grid_at_redshift == pytest.approx(
+                        np.asarray(
+                            tracer_with_plane.traced_grids_of_planes_from_grid(
+                                grid=sub_grid_7x7
+                            )[plane_index]
+                        ),
+                        1.0e-8,
+                    )
+
+                assert (
+                    tracer.grid_at_redshift_from_grid_and_redshift(
+                        grid=sub_grid_7x7, redshift=redshift
+                    )
+                    == grid_at_redshift
+                ).all()
+
+        def test__grid_at_redshift__does_not_evaluate_mass_profiles(self, sub_grid_7x7):
+
+            tracer = al.Tracer.from_galaxies(
+                galaxies=[
+                    al.Galaxy(
+                        redshift=0.5,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=1.0),
+                    ),
+                    al.Galaxy(
+                        redshift=1.0,
+                        mass=al.mp.SphericalIsothermal(einstein_radius=0.5),
+                    ),
+                    al.Galaxy(redshift=2.0),
+                ]
+            )
+
+            traced_grids = tracer.traced_grids_from_grid(grid=sub_grid_7x7)
+
+            deflections_of_plane_from_grid = tracer.deflections_of_plane_from_grid
+
+            calls = []
+
+            def deflections_of_plane_from_grid_counted(plane, grid):
+                calls.append(plane)
+                return deflections_of_plane_from_grid(plane=plane, grid=grid)
+
+            tracer.deflections_of_plane_from_grid = (
+                deflections_of_plane_from_grid_counted
+            )
+
+            for redshift in [0.75, 1.5, 1.75]:
+                traced_grids.grid_at_redshift_from_redshift(redshift=redshift)
+
+            assert calls == []
+
+            assert traced_grids.grid_at_redshift_from_redshift(
+                redshift=1.5
+            ) == pytest.approx(
+                np.asarray(
+                    tracer.grid_at_redshift_from_grid_and_redshift(
+                        grid=sub_grid_7x7, redshift=1.5
+                    )
+                ),
+                1.0e-8,
+            )
+            assert len(calls) == 2
+
     class TestContributionMap:
         def test__contribution_maps_are_same_as_hyper_galaxy_calculation(self):
 
@@ -2251,6 +2486,113 @@ class TestAbstractTracerLensing:
                 == pytest.approx(np.pi * 2.0 ** 2.0, 1.0e-1)
             )
 
+        def test__lensing_jacobian_bundle__same_as_lensing_object_methods(self):
+
+            grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.2, sub_size=2)
+
+            galaxy = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.1, 0.0), elliptical_comps=(0.1, 0.05), einstein_radius=1.0
+                ),
+                shear=al.mp.ExternalShear(elliptical_comps=(0.05, 0.0)),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy, al.Galaxy(redshift=1.0)])
+
+            jacobian = tracer.lensing_jacobian_bundle_from_grid(grid=grid)
+
+            jacobian_via_lensing_object = LensingObject.jacobian_from_grid(
+                tracer, grid=grid
+            )
+
+            for i in range(2):
+                for j in range(2):
+                    assert isinstance(jacobian.jacobian[i][j], al.Array)
+                    assert (
+                        jacobian.jacobian[i][j] == jacobian_via_lensing_object[i][j]
+                    ).all()
+
+            assert isinstance(jacobian.magnification, al.Array)
+            assert (
+                jacobian.convergence
+                == LensingObject.convergence_via_jacobian_from_grid(tracer, grid=grid)
+            ).all()
+            assert (
+                jacobian.shear
+                == LensingObject.shear_via_jacobian_from_grid(tracer, grid=grid)
+            ).all()
+            assert (
+                jacobian.tangential_eigen_value
+                == LensingObject.tangential_eigen_value_from_grid(tracer, grid=grid)
+            ).all()
+            assert (
+                jacobian.radial_eigen_value
+                == LensingObject.radial_eigen_value_from_grid(tracer, grid=grid)
+            ).all()
+            assert (
+                tracer.magnification_from_grid(grid=grid)
+                == LensingObject.magnification_from_grid(tracer, grid=grid)
+            ).all()
+            assert jacobian.det_jacobian == pytest.approx(
+                1.0 / np.asarray(jacobian.magnification), 1.0e-8
+            )
+
+            plane = al.Plane(galaxies=[galaxy])
+
+            assert tracer.critical_curves.in_1d == pytest.approx(
+                np.asarray(plane.critical_curves.in_1d), 1.0e-6
+            )
+            assert tracer.caustics.in_1d == pytest.approx(
+                np.asarray(plane.caustics.in_1d), 1.0e-6
+            )
+            assert tracer.caustics_from_critical_curves(
+                critical_curves=tracer.critical_curves
+            ).in_1d == pytest.approx(np.asarray(tracer.caustics.in_1d), 1.0e-8)
+            assert tracer.tangential_caustic == pytest.approx(
+                np.asarray(plane.tangential_caustic), 1.0e-6
+            )
+            assert tracer.radial_caustic == pytest.approx(
+                np.asarray(plane.radial_caustic), 1.0e-6
+            )
+
+        def test__lensing_jacobian_bundle__irregular_coordinates_use_stencil(self):
+
+            galaxy = al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    elliptical_comps=(0.1, 0.05), einstein_radius=1.0
+                ),
+            )
+
+            tracer = al.Tracer.from_galaxies(galaxies=[galaxy, al.Galaxy(redshift=1.0)])
+
+            grid = np.array([[0.5, 1.0], [-1.2, 0.3], [0.9, -0.9]])
+
+            jacobian = tracer.lensing_jacobian_bundle_from_grid(
+                grid=grid, buffer=1.0e-4
+            )
+
+            convergence = galaxy.convergence_from_grid(grid=grid)
+
+            assert isinstance(jacobian.convergence, np.ndarray)
+            assert jacobian.convergence == pytest.approx(
+                np.asarray(convergence), 1.0e-4
+            )
+
+            tangential_eigen_value = 1.0 - 2.0 * np.asarray(convergence)
+
+            assert jacobian.tangential_eigen_value == pytest.approx(
+                tangential_eigen_value, abs=1.0e-4
+            )
+            assert jacobian.radial_eigen_value == pytest.approx(np.ones(3), abs=1.0e-4)
+
+            magnification = tracer.magnification_from_grid(
+                grid=al.GridIrregularGrouped([[(0.5, 1.0), (-1.2, 0.3), (0.9, -0.9)]])
+            )
+
+            assert magnification == pytest.approx(1.0 / tangential_eigen_value, 1.0e-3)
+
 
 class TestAbstractTracerData:
     class TestBlurredProfileImages:
@@ -2926,6 +3268,13 @@ class TestAbstractTracerData:
             assert traced_pixelization_grids[3] == None
             assert (traced_pixelization_grids[4] == traced_grid_pix1).all()
 
+            traced_pixelization_grids = tracer.traced_sparse_grids_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_indexes=[2]
+            )
+
+            assert (traced_pixelization_grids[2] == traced_grid_pix0).all()
+            assert traced_pixelization_grids[4] == None
+
         def test__x2_planes__no_mass_profiles__use_real_pixelization__doesnt_crash_due_to_auto_arrays(
             self, sub_grid_7x7
         ):
@@ -3010,6 +3359,12 @@ class TestAbstractTracerData:
 
             assert mappers_of_planes == [None, None, 1, None, 2]
 
+            mappers_of_planes = tracer.mappers_of_planes_from_grid(
+                grid=sub_grid_7x7, plane_indexes=[4]
+            )
+
+            assert mappers_of_planes == [None, None, None, None, 2]
+
     class TestInversion:
         def test__x1_inversion_imaging_in_tracer__performs_inversion_correctly(
             self, sub_grid_7x7, masked_imaging_7x7
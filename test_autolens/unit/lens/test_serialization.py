@@ -0,0 +1,187 @@
+import json
+import os
+import pickle
+import shutil
+from os import path
+
+import numpy as np
+import pytest
+from astropy import cosmology as cosmo
+
+import autolens as al
+from autolens import exc
+
+test_path = path.join(
+    "{}".format(path.dirname(path.realpath(__file__))), "files", "serialization"
+)
+
+
+@pytest.fixture(name="serialization_path")
+def make_serialization_path():
+
+    if path.exists(test_path):
+        shutil.rmtree(test_path)
+
+    os.makedirs(test_path)
+
+    yield test_path
+
+    shutil.rmtree(test_path)
+
+
+class TestTracerSerialization:
+    def test__tracer_round_trips_profiles_redshifts_cosmology_and_strategies(
+        self, serialization_path, sub_grid_7x7
+    ):
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(
+                centre=(0.1, 0.2), elliptical_comps=(0.1, 0.05), intensity=1.1
+            ),
+            mass=al.mp.EllipticalIsothermal(
+                centre=(0.1, 0.2), elliptical_comps=(0.3, 0.0), einstein_radius=1.2
+            ),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.02, 0.01)),
+            hyper_galaxy=al.HyperGalaxy(noise_factor=1.5, noise_power=2.0),
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0,
+            pixelization=al.pix.Rectangular(shape=(10, 12)),
+            regularization=al.reg.Constant(coefficient=2.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[lens_galaxy, source_galaxy],
+            cosmology=cosmo.WMAP9,
+            tree_deflections=al.TreeDeflections(opening_angle=0.3),
+        )
+
+        tracer.save(file_path=serialization_path, filename="tracer")
+
+        assert path.exists(path.join(serialization_path, "tracer.json"))
+        assert not path.exists(path.join(serialization_path, "tracer.npy"))
+
+        tracer_loaded = al.Tracer.load(file_path=serialization_path, filename="tracer")
+
+        assert isinstance(tracer_loaded, al.Tracer)
+        assert tracer_loaded.cosmology is cosmo.WMAP9
+        assert tracer_loaded.plane_redshifts == [0.5, 1.0]
+        assert tracer_loaded.galaxies[0] == tracer.galaxies[0]
+        assert tracer_loaded.galaxies[0].light.centre == (0.1, 0.2)
+        assert tracer_loaded.galaxies[1].pixelization.shape == (10, 12)
+        assert tracer_loaded.galaxies[1].regularization.coefficient == 2.0
+        assert tracer_loaded.tree_deflections.opening_angle == 0.3
+        assert tracer_loaded.interpolated_deflections is None
+
+        assert (
+            tracer_loaded.image_from_grid(grid=sub_grid_7x7)
+            == tracer.image_from_grid(grid=sub_grid_7x7)
+        ).all()
+        assert (
+            tracer_loaded.deflections_from_grid(grid=sub_grid_7x7)
+            == tracer.deflections_from_grid(grid=sub_grid_7x7)
+        ).all()
+
+    def test__hyper_images_are_stored_once_and_memory_mapped(
+        self, serialization_path, mask_7x7
+    ):
+
+        hyper_model_image = al.Array.manual_mask(array=np.arange(9.0), mask=mask_7x7)
+
+        galaxies = []
+
+        for i in range(2):
+
+            galaxy = al.Galaxy(
+                redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.0 + i)
+            )
+            galaxy.hyper_model_image = hyper_model_image
+            galaxy.hyper_galaxy_image = al.Array.manual_mask(
+                array=np.full(9, i + 0.5), mask=mask_7x7
+            )
+
+            galaxies.append(galaxy)
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies + [al.Galaxy(redshift=1.0)])
+
+        tracer.save(file_path=serialization_path, filename="tracer")
+
+        assert np.load(path.join(serialization_path, "tracer.npy")).shape == (27,)
+
+        tracer_loaded = al.Tracer.load(file_path=serialization_path, filename="tracer")
+
+        galaxy_0, galaxy_1 = tracer_loaded.galaxies[0], tracer_loaded.galaxies[1]
+
+        assert isinstance(galaxy_0.hyper_model_image, al.Array)
+        assert isinstance(galaxy_0.hyper_model_image.base, np.memmap)
+        assert galaxy_0.hyper_model_image is galaxy_1.hyper_model_image
+        assert (galaxy_0.hyper_model_image == hyper_model_image).all()
+        assert (galaxy_0.hyper_model_image.mask == mask_7x7).all()
+        assert galaxy_0.hyper_model_image.mask.pixel_scales == mask_7x7.pixel_scales
+        assert galaxy_0.hyper_model_image.in_2d == pytest.approx(
+            np.asarray(hyper_model_image.in_2d), 1.0e-8
+        )
+        assert (galaxy_0.hyper_galaxy_image == np.full(9, 0.5)).all()
+        assert (galaxy_1.hyper_galaxy_image == np.full(9, 1.5)).all()
+
+    def test__profile_without_constructor_attributes_and_custom_cosmology(
+        self, serialization_path
+    ):
+
+        mass = al.mp.SphericalNFWMCRLudlow(
+            mass_at_200=1.0e12, redshift_object=0.5, redshift_source=1.0
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[al.Galaxy(redshift=0.5, mass=mass), al.Galaxy(redshift=1.0)],
+            cosmology=cosmo.FlatLambdaCDM(H0=70.0, Om0=0.3),
+        )
+
+        tracer.save(file_path=serialization_path, filename="tracer")
+
+        tracer_loaded = al.Tracer.load(file_path=serialization_path, filename="tracer")
+
+        mass_loaded = tracer_loaded.galaxies[0].mass
+
+        assert isinstance(mass_loaded, al.mp.SphericalNFW)
+        assert mass_loaded.centre == mass.centre
+        assert mass_loaded.kappa_s == mass.kappa_s
+        assert mass_loaded.scale_radius == mass.scale_radius
+
+        assert isinstance(tracer_loaded.cosmology, cosmo.FlatLambdaCDM)
+        assert tracer_loaded.cosmology.H0 == tracer.cosmology.H0
+        assert tracer_loaded.cosmology.Om0 == tracer.cosmology.Om0
+        assert tracer_loaded.cosmology.angular_diameter_distance(
+            1.0
+        ) == tracer.cosmology.angular_diameter_distance(1.0)
+
+    def test__newer_version_raises_exception_and_pickles_are_still_loaded(
+        self, serialization_path
+    ):
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[
+                al.Galaxy(redshift=0.5, light=al.lp.EllipticalSersic(intensity=1.1))
+            ]
+        )
+
+        tracer.save(file_path=serialization_path, filename="tracer")
+
+        with open(path.join(serialization_path, "tracer.json"), "r") as f:
+            tracer_dict = json.load(f)
+
+        tracer_dict["version"] += 1
+
+        with open(path.join(serialization_path, "tracer.json"), "w") as f:
+            json.dump(tracer_dict, f)
+
+        with pytest.raises(exc.SerializationException):
+            al.Tracer.load(file_path=serialization_path, filename="tracer")
+
+        with open(path.join(serialization_path, "tracer_pickle.pickle"), "wb") as f:
+            pickle.dump(tracer, f)
+
+        tracer = al.Tracer.load(file_path=serialization_path, filename="tracer_pickle")
+
+        assert tracer.galaxies[0].light.intensity == 1.1
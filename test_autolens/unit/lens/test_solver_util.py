@@ -0,0 +1,178 @@
+import numpy as np
+import pytest
+from scipy import linalg
+
+import autolens as al
+from autoarray import exc
+from autolens.lens import solver_util
+
+
+@pytest.fixture(name="matrix")
+def make_matrix():
+
+    random_state = np.random.RandomState(seed=1)
+
+    mapping = random_state.normal(size=(200, 50))
+
+    return mapping.T @ mapping + np.identity(50)
+
+
+def perturbed_matrix_from(matrix, scale):
+
+    perturbation = np.random.RandomState(seed=2).normal(size=matrix.shape) * scale
+
+    return matrix + perturbation @ perturbation.T
+
+
+class TestSolverUtil:
+    def test__log_determinant_via_sparse_lu__same_as_cholesky(self):
+
+        regularization = al.reg.Constant(coefficient=2.0)
+
+        pixel_neighbors = np.array(
+            [[1, 3, -1, -1], [0, 2, 4, -1], [1, 5, -1, -1], [0, 4, -1, -1]]
+            + [[1, 3, 5, -1], [2, 4, -1, -1]]
+        )
+        pixel_neighbors_size = np.array([2, 3, 2, 2, 3, 2])
+
+        regularization_matrix = al.util.regularization.constant_regularization_matrix_from(
+            coefficient=regularization.coefficient,
+            pixel_neighbors=pixel_neighbors,
+            pixel_neighbors_size=pixel_neighbors_size,
+        )
+
+        assert solver_util.log_determinant_via_sparse_lu_from(
+            matrix=regularization_matrix
+        ) == pytest.approx(
+            2.0 * np.sum(np.log(np.diag(np.linalg.cholesky(regularization_matrix)))),
+            1.0e-4,
+        )
+
+    def test__sparse_lu__solution_and_log_determinant_same_as_dense(self, matrix):
+
+        lu = solver_util.sparse_lu_from(matrix=matrix)
+
+        assert lu.solve(np.arange(50.0)) == pytest.approx(
+            np.linalg.solve(matrix, np.arange(50.0)), 1.0e-8
+        )
+        assert solver_util.log_determinant_from_sparse_lu(lu=lu) == pytest.approx(
+            np.linalg.slogdet(matrix)[1], 1.0e-8
+        )
+
+        with pytest.raises(exc.InversionException):
+            solver_util.sparse_lu_from(matrix=-1.0 * matrix)
+
+    def test__block_cholesky__solution_and_log_determinant_same_as_dense(self, matrix):
+
+        matrix[40:, :20] = 0.0
+        matrix[:20, 40:] = 0.0
+
+        edges = [0, 20, 40, 50]
+
+        blocks = [
+            [matrix[edges[i] : edges[i + 1], edges[j] : edges[j + 1]] for j in range(3)]
+            for i in range(3)
+        ]
+        blocks[2][0] = None
+
+        factors = solver_util.block_cholesky_from(blocks=blocks)
+
+        assert factors[2][0] is None
+        assert solver_util.log_determinant_from_block_cholesky(
+            factors=factors
+        ) == pytest.approx(np.linalg.slogdet(matrix)[1], 1.0e-8)
+
+        solutions = solver_util.solution_via_block_cholesky_from(
+            factors=factors,
+            vectors=[np.arange(20.0), np.arange(20.0), np.arange(10.0)],
+        )
+
+        assert np.concatenate(solutions) == pytest.approx(
+            np.linalg.solve(
+                matrix,
+                np.concatenate([np.arange(20.0), np.arange(20.0), np.arange(10.0)]),
+            ),
+            1.0e-8,
+        )
+
+        inverse = np.linalg.inv(matrix)
+
+        for index in range(3):
+            assert solver_util.inverse_diagonal_block_via_block_cholesky_from(
+                factors=factors, index=index
+            ) == pytest.approx(
+                inverse[
+                    edges[index] : edges[index + 1], edges[index] : edges[index + 1]
+                ],
+                1.0e-6,
+            )
+
+        blocks[1][1] = -blocks[1][1]
+
+        with pytest.raises(exc.InversionException):
+            solver_util.block_cholesky_from(blocks=blocks)
+
+    def test__log_determinant_via_stochastic_lanczos_quadrature__within_error_of_exact(
+        self, matrix
+    ):
+
+        reference_cholesky = linalg.cho_factor(matrix, lower=True)
+        reference_log_det = np.linalg.slogdet(matrix)[1]
+
+        perturbed_matrix = perturbed_matrix_from(matrix=matrix, scale=0.05)
+
+        (
+            log_det,
+            standard_error,
+        ) = solver_util.log_determinant_via_stochastic_lanczos_quadrature_from(
+            matrix=perturbed_matrix,
+            reference_cholesky=reference_cholesky,
+            reference_log_det=reference_log_det,
+            tolerance=0.05,
+        )
+
+        assert standard_error < 0.05
+        assert log_det == pytest.approx(
+            np.linalg.slogdet(perturbed_matrix)[1], abs=4.0 * standard_error
+        )
+
+        (
+            log_det,
+            standard_error,
+        ) = solver_util.log_determinant_via_stochastic_lanczos_quadrature_from(
+            matrix=perturbed_matrix_from(matrix=matrix, scale=1.0),
+            reference_cholesky=reference_cholesky,
+            reference_log_det=reference_log_det,
+            tolerance=0.05,
+        )
+
+        assert log_det is None
+        assert standard_error > 0.05
+
+    def test__reconstruction_via_conjugate_gradient__warm_start(self, matrix):
+
+        perturbed_matrix = perturbed_matrix_from(matrix=matrix, scale=0.05)
+        data_vector = np.arange(50.0)
+
+        reconstruction = solver_util.reconstruction_via_conjugate_gradient_from(
+            curvature_reg_matrix=perturbed_matrix,
+            data_vector=data_vector,
+            preconditioner_cholesky=linalg.cho_factor(matrix, lower=True),
+            initial_reconstruction=np.linalg.solve(matrix, data_vector),
+            tolerance=1.0e-10,
+        )
+
+        assert reconstruction == pytest.approx(
+            np.linalg.solve(perturbed_matrix, data_vector), 1.0e-6
+        )
+
+        assert (
+            solver_util.reconstruction_via_conjugate_gradient_from(
+                curvature_reg_matrix=perturbed_matrix,
+                data_vector=data_vector,
+                preconditioner_cholesky=linalg.cho_factor(matrix, lower=True),
+                tolerance=1.0e-10,
+                maxiter=1,
+            )
+            is None
+        )
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import sparse_inversion_util
+
+
+@pytest.fixture(name="mapper")
+def make_mapper(masked_imaging_7x7):
+
+    tracer = al.Tracer.from_galaxies(
+        galaxies=[
+            al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            ),
+            al.Galaxy(
+                redshift=1.0,
+                pixelization=al.pix.Rectangular(shape=(3, 3)),
+                regularization=al.reg.Constant(),
+            ),
+        ]
+    )
+
+    return tracer.mappers_of_planes_from_grid(grid=masked_imaging_7x7.grid)[-1]
+
+
+class TestSparseInversionUtil:
+    def test__mapping_and_blurred_mapping_matrices__same_as_dense(
+        self, masked_imaging_7x7, mapper
+    ):
+
+        mapping_matrix = sparse_inversion_util.mapping_matrix_sparse_from(mapper=mapper)
+
+        assert mapping_matrix.toarray() == pytest.approx(mapper.mapping_matrix, 1.0e-8)
+
+        convolver = masked_imaging_7x7.convolver
+
+        blurred_mapping_matrix = (
+            sparse_inversion_util.convolution_matrix_sparse_from(convolver=convolver)
+            @ mapping_matrix
+        )
+
+        assert blurred_mapping_matrix.toarray() == pytest.approx(
+            convolver.convolve_mapping_matrix(mapping_matrix=mapper.mapping_matrix),
+            1.0e-8,
+        )
+
+        noise_map = np.arange(1.0, 10.0)
+
+        assert sparse_inversion_util.curvature_matrix_sparse_from(
+            blurred_mapping_matrix=blurred_mapping_matrix, noise_map=noise_map
+        ).toarray() == pytest.approx(
+            al.util.inversion.curvature_matrix_via_mapping_matrix_from(
+                mapping_matrix=blurred_mapping_matrix.toarray(), noise_map=noise_map
+            ),
+            1.0e-8,
+        )
+
+        image = np.arange(9.0)
+
+        assert sparse_inversion_util.data_vector_sparse_from(
+            blurred_mapping_matrix=blurred_mapping_matrix,
+            image=image,
+            noise_map=noise_map,
+        ) == pytest.approx(
+            al.util.inversion.data_vector_via_blurred_mapping_matrix_from(
+                blurred_mapping_matrix=blurred_mapping_matrix.toarray(),
+                image=image,
+                noise_map=noise_map,
+            ),
+            1.0e-8,
+        )
+
+    def test__regularization_matrices__same_as_dense(self, mapper):
+
+        for regularization in [
+            al.reg.Constant(coefficient=2.0),
+            al.reg.AdaptiveBrightness(inner_coefficient=1.0, outer_coefficient=3.0),
+        ]:
+
+            if isinstance(regularization, al.reg.AdaptiveBrightness):
+                mapper.hyper_image = np.arange(1.0, 10.0)
+
+            assert sparse_inversion_util.regularization_matrix_sparse_from(
+                regularization=regularization, mapper=mapper
+            ).toarray() == pytest.approx(
+                regularization.regularization_matrix_from_mapper(mapper=mapper), 1.0e-8
+            )
@@ -0,0 +1,158 @@
+import copy
+import pickle
+
+import autolens as al
+import numpy as np
+
+
+class TestThreadedEvaluation:
+    def test__is_used_for_plane__depends_on_threads_and_total_profiles(self):
+
+        plane = al.Plane(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic(),
+                    mass=al.mp.SphericalIsothermal(),
+                    shear=al.mp.ExternalShear(),
+                )
+            ]
+        )
+
+        threaded_evaluation = al.ThreadedEvaluation(
+            number_of_threads=2, minimum_profiles=2
+        )
+
+        assert threaded_evaluation.is_used_for_plane_deflections(plane=plane) is True
+        assert threaded_evaluation.is_used_for_plane_image(plane=plane) is False
+
+        threaded_evaluation = al.ThreadedEvaluation(
+            number_of_threads=1, minimum_profiles=2
+        )
+
+        assert threaded_evaluation.is_used_for_plane_deflections(plane=plane) is False
+
+    def test__deflections_and_image_of_plane__identical_to_serial_evaluation(
+        self, sub_grid_7x7
+    ):
+
+        plane = al.Plane(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    bulge=al.lp.EllipticalSersic(intensity=1.0),
+                    disk=al.lp.EllipticalExponential(intensity=2.0),
+                    mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+                    shear=al.mp.ExternalShear(elliptical_comps=(0.05, 0.0)),
+                ),
+                al.Galaxy(redshift=0.5),
+                al.Galaxy(
+                    redshift=0.5,
+                    light=al.lp.SphericalSersic(centre=(0.1, 0.1), intensity=0.5),
+                    mass=al.mp.SphericalIsothermal(
+                        centre=(0.1, 0.1), einstein_radius=0.1
+                    ),
+                ),
+            ]
+        )
+
+        threaded_evaluation = al.ThreadedEvaluation(number_of_threads=4)
+
+        deflections = threaded_evaluation.deflections_from_plane_and_grid(
+            plane=plane, grid=sub_grid_7x7
+        )
+
+        assert (
+            np.asarray(deflections)
+            == np.asarray(plane.deflections_from_grid(grid=sub_grid_7x7))
+        ).all()
+
+        image = threaded_evaluation.image_from_plane_and_grid(
+            plane=plane, grid=sub_grid_7x7
+        )
+
+        assert (
+            np.asarray(image) == np.asarray(plane.image_from_grid(grid=sub_grid_7x7))
+        ).all()
+
+    def test__can_be_pickled_after_thread_pool_is_used(self, sub_grid_7x7):
+
+        plane = al.Plane(
+            galaxies=[
+                al.Galaxy(
+                    redshift=0.5,
+                    mass=al.mp.SphericalIsothermal(),
+                    shear=al.mp.ExternalShear(),
+                )
+            ]
+        )
+
+        threaded_evaluation = al.ThreadedEvaluation(number_of_threads=2)
+
+        deflections = threaded_evaluation.deflections_from_plane_and_grid(
+            plane=plane, grid=sub_grid_7x7
+        )
+
+        threaded_evaluation = pickle.loads(pickle.dumps(threaded_evaluation))
+
+        assert threaded_evaluation.number_of_threads == 2
+        assert (
+            np.asarray(
+                threaded_evaluation.deflections_from_plane_and_grid(
+                    plane=plane, grid=sub_grid_7x7
+                )
+            )
+            == np.asarray(deflections)
+        ).all()
+
+    def test__thread_pool_shared_by_instances_with_same_number_of_threads(self):
+
+        threaded_evaluation = al.ThreadedEvaluation(number_of_threads=2)
+
+        assert (
+            threaded_evaluation.executor is copy.deepcopy(threaded_evaluation).executor
+        )
+        assert (
+            threaded_evaluation.executor
+            is al.ThreadedEvaluation(number_of_threads=2).executor
+        )
+        assert (
+            threaded_evaluation.executor
+            is not al.ThreadedEvaluation(number_of_threads=3).executor
+        )
+
+
+class TestTracerWithThreadedEvaluation:
+    def test__traced_grids_and_image__identical_to_serial_tracer(self, sub_grid_7x7):
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            bulge=al.lp.EllipticalSersic(intensity=1.0),
+            disk=al.lp.EllipticalExponential(intensity=2.0),
+            mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+            shear=al.mp.ExternalShear(elliptical_comps=(0.05, 0.0)),
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0,
+            bulge=al.lp.EllipticalSersic(intensity=1.0),
+            disk=al.lp.EllipticalExponential(intensity=2.0),
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=[lens_galaxy, source_galaxy])
+
+        tracer_threaded = al.Tracer.from_galaxies(
+            galaxies=[lens_galaxy, source_galaxy],
+            threaded_evaluation=al.ThreadedEvaluation(number_of_threads=4),
+        )
+
+        traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+        traced_grids_threaded = tracer_threaded.traced_grids_of_planes_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        assert (traced_grids[1] == traced_grids_threaded[1]).all()
+
+        assert (
+            tracer.image_from_grid(grid=sub_grid_7x7)
+            == tracer_threaded.image_from_grid(grid=sub_grid_7x7)
+        ).all()
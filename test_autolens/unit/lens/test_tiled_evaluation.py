@@ -0,0 +1,167 @@
+import autolens as al
+import numpy as np
+import pytest
+
+
+class TestTiledEvaluation:
+    def test__tile_size_and_slices__from_memory_budget_threads_and_planes(self):
+
+        tiled_evaluation = al.TiledEvaluation(
+            memory_budget_mb=0.001, bytes_per_coordinate_per_plane=100
+        )
+
+        assert tiled_evaluation.tile_size_from_total_planes(total_planes=1) == 10
+        assert tiled_evaluation.tile_size_from_total_planes(total_planes=2) == 5
+
+        tiled_evaluation = al.TiledEvaluation(
+            memory_budget_mb=0.001,
+            number_of_threads=2,
+            bytes_per_coordinate_per_plane=100,
+        )
+
+        assert tiled_evaluation.tile_size_from_total_planes(total_planes=1) == 5
+        assert tiled_evaluation.tile_size_from_total_planes(total_planes=10) == 1
+
+        assert tiled_evaluation.tile_slices_from(
+            total_coordinates=12, total_planes=1
+        ) == [slice(0, 5), slice(5, 10), slice(10, 12)]
+
+        assert (
+            tiled_evaluation.is_used_for_grid(grid=np.zeros((5, 2)), total_planes=1)
+            is False
+        )
+        assert (
+            tiled_evaluation.is_used_for_grid(grid=np.zeros((6, 2)), total_planes=1)
+            is True
+        )
+
+
+class TestTracerWithTiledEvaluation:
+    def test__image_and_padded_image__identical_to_untiled_tracer(self, sub_grid_7x7):
+
+        lens_galaxy = al.Galaxy(
+            redshift=0.5,
+            light=al.lp.EllipticalSersic(intensity=1.0),
+            mass=al.mp.EllipticalIsothermal(einstein_radius=1.0),
+        )
+        los_galaxy = al.Galaxy(
+            redshift=0.75,
+            mass=al.mp.SphericalIsothermal(centre=(0.1, 0.1), einstein_radius=0.1),
+        )
+        source_galaxy = al.Galaxy(
+            redshift=1.0, light=al.lp.EllipticalSersic(intensity=1.0)
+        )
+
+        tracer = al.Tracer.from_galaxies(
+            galaxies=[lens_galaxy, los_galaxy, source_galaxy]
+        )
+
+        image = tracer.image_from_grid(grid=sub_grid_7x7)
+        padded_image = tracer.padded_image_from_grid_and_psf_shape(
+            grid=sub_grid_7x7, psf_shape_2d=(3, 3)
+        )
+
+        for number_of_threads in [1, 3]:
+
+            tracer_tiled = al.Tracer.from_galaxies(
+                galaxies=[lens_galaxy, los_galaxy, source_galaxy],
+                tiled_evaluation=al.TiledEvaluation(
+                    memory_budget_mb=0.01,
+                    number_of_threads=number_of_threads,
+                    bytes_per_coordinate_per_plane=1000,
+                ),
+            )
+
+            image_tiled = tracer_tiled.image_from_grid(grid=sub_grid_7x7)
+
+            assert isinstance(image_tiled, al.Array)
+            assert image_tiled.shape == image.shape
+            assert (image_tiled == image).all()
+
+            padded_image_tiled = tracer_tiled.padded_image_from_grid_and_psf_shape(
+                grid=sub_grid_7x7, psf_shape_2d=(3, 3)
+            )
+
+            assert (padded_image_tiled.in_2d == padded_image.in_2d).all()
+
+    def test__interpolated_deflections__identical_to_untiled_tracer(self):
+
+        grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.05, sub_size=2)
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.EllipticalIsothermal(
+                    centre=(0.05, 0.05), einstein_radius=1.0
+                ),
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=1.0)),
+        ]
+
+        interpolated_deflections = al.InterpolatedDeflections(
+            pixel_scale=0.1, maximum_error=1.0e-2
+        )
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        tracer_interpolated = al.Tracer.from_galaxies(
+            galaxies=galaxies, interpolated_deflections=interpolated_deflections
+        )
+
+        tracer_interpolated_tiled = al.Tracer.from_galaxies(
+            galaxies=galaxies,
+            interpolated_deflections=interpolated_deflections,
+            tiled_evaluation=al.TiledEvaluation(
+                memory_budget_mb=0.8, bytes_per_coordinate_per_plane=1000
+            ),
+        )
+
+        image = np.asarray(tracer.image_from_grid(grid=grid))
+        image_interpolated = np.asarray(tracer_interpolated.image_from_grid(grid=grid))
+        image_interpolated_tiled = np.asarray(
+            tracer_interpolated_tiled.image_from_grid(grid=grid)
+        )
+
+        assert (image_interpolated != image).any()
+        assert (image_interpolated_tiled == image_interpolated).all()
+
+    def test__tree_deflections__within_expansion_error_of_untiled_tracer(self):
+
+        grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.05, sub_size=2)
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                **{
+                    f"mass_{index}": al.mp.SphericalIsothermal(
+                        centre=(3.0 * np.cos(index), 3.0 * np.sin(index)),
+                        einstein_radius=0.1,
+                    )
+                    for index in range(10)
+                },
+            ),
+            al.Galaxy(redshift=1.0, light=al.lp.EllipticalSersic(intensity=1.0)),
+        ]
+
+        tree_deflections = al.TreeDeflections(opening_angle=0.5, leaf_size=16)
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+
+        tracer_tree = al.Tracer.from_galaxies(
+            galaxies=galaxies, tree_deflections=tree_deflections
+        )
+
+        tracer_tree_tiled = al.Tracer.from_galaxies(
+            galaxies=galaxies,
+            tree_deflections=tree_deflections,
+            tiled_evaluation=al.TiledEvaluation(
+                memory_budget_mb=0.8, bytes_per_coordinate_per_plane=1000
+            ),
+        )
+
+        image = np.asarray(tracer.image_from_grid(grid=grid))
+        image_tree = np.asarray(tracer_tree.image_from_grid(grid=grid))
+        image_tree_tiled = np.asarray(tracer_tree_tiled.image_from_grid(grid=grid))
+
+        assert (image_tree_tiled != image_tree).any()
+        assert image_tree_tiled == pytest.approx(image, 1.0e-2)
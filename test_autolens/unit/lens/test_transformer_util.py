@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+import autolens as al
+from autolens.lens import transformer_util
+
+
+@pytest.fixture(name="images_7x7")
+def make_images_7x7(sub_grid_7x7):
+
+    return [
+        al.lp.EllipticalSersic(intensity=1.0).image_from_grid(grid=sub_grid_7x7),
+        al.Array.zeros(shape_2d=(7, 7), pixel_scales=1.0, sub_size=2).in_1d,
+        al.lp.SphericalExponential(intensity=-2.0).image_from_grid(grid=sub_grid_7x7),
+    ]
+
+
+class TestVisibilitiesOfImages:
+    @pytest.mark.parametrize("preload_transform", [True, False])
+    def test__dft__identical_to_transforming_every_image(
+        self, images_7x7, transformer_7x7_7, mask_7x7, preload_transform
+    ):
+
+        transformer = al.TransformerDFT(
+            uv_wavelengths=transformer_7x7_7.uv_wavelengths,
+            real_space_mask=mask_7x7,
+            preload_transform=preload_transform,
+        )
+
+        visibilities_of_images = transformer_util.visibilities_of_images_from(
+            images=images_7x7, transformer=transformer
+        )
+
+        assert len(visibilities_of_images) == 3
+        assert isinstance(visibilities_of_images[0], al.Visibilities)
+
+        assert (
+            visibilities_of_images[0]
+            == transformer.visibilities_from_image(image=images_7x7[0])
+        ).all()
+        assert (visibilities_of_images[1] == np.zeros(7)).all()
+        assert (
+            visibilities_of_images[2]
+            == transformer.visibilities_from_image(image=images_7x7[2])
+        ).all()
+
+    def test__images_without_light_are_not_transformed(self, transformer_7x7_7):
+        class MockTransformer:
+            def __init__(self):
+                self.uv_wavelengths = transformer_7x7_7.uv_wavelengths
+                self.images = []
+
+            def visibilities_from_image(self, image):
+                self.images.append(image)
+                return al.Visibilities.ones(shape_1d=(7,))
+
+        transformer = MockTransformer()
+
+        visibilities_of_images = transformer_util.visibilities_of_images_from(
+            images=[np.zeros(9), np.ones(9), np.zeros(9)], transformer=transformer
+        )
+
+        assert len(transformer.images) == 1
+        assert (visibilities_of_images[0] == np.zeros(7)).all()
+        assert (visibilities_of_images[1] == np.full(7, 1.0 + 1.0j)).all()
+        assert (visibilities_of_images[2] == np.zeros(7)).all()
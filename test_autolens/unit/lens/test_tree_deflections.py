@@ -0,0 +1,137 @@
+import autolens as al
+import numpy as np
+import pytest
+from autolens.lens import tree_deflections
+
+
+class TestGridTree:
+    def test__leaf_nodes_partition_grid_and_have_at_most_leaf_size_coordinates(self):
+
+        grid = np.asarray(al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.1))
+
+        tree = tree_deflections.GridTree(grid=grid, leaf_size=8)
+
+        leaf_indexes = [
+            tree.indexes[node]
+            for node in range(tree.total_nodes)
+            if tree.children[node] is None
+        ]
+
+        assert max([len(indexes) for indexes in leaf_indexes]) <= 8
+        assert sorted(np.concatenate(leaf_indexes)) == list(range(100))
+
+        assert tree.centres[0] == pytest.approx((0.0, 0.0), 1.0e-4)
+        assert tree.half_sizes[0] == pytest.approx(0.45, 1.0e-4)
+
+    def test__expansion_and_leaf_nodes_from_centre(self):
+
+        grid = np.asarray(al.Grid.uniform(shape_2d=(10, 10), pixel_scales=0.1))
+
+        tree = tree_deflections.GridTree(grid=grid, leaf_size=8)
+
+        expansion_nodes, leaf_nodes = tree.expansion_and_leaf_nodes_from_centre(
+            centre=np.array([100.0, 100.0]), opening_angle=0.5
+        )
+
+        assert expansion_nodes == [0]
+        assert leaf_nodes == []
+
+        expansion_nodes, leaf_nodes = tree.expansion_and_leaf_nodes_from_centre(
+            centre=np.array([0.0, 0.0]), opening_angle=0.0
+        )
+
+        assert expansion_nodes == []
+        assert len(leaf_nodes) == len(
+            [node for node in range(tree.total_nodes) if tree.children[node] is None]
+        )
+
+
+class TestTreeDeflections:
+    def test__biquadratic_weights_interpolate_quadratic_function_exactly(self):
+
+        stencil_values = np.array(
+            [
+                1.0 + 2.0 * y - x + 0.5 * y * x + y ** 2.0
+                for (y, x) in tree_deflections.stencil_offsets
+            ]
+        )
+
+        offsets = np.array([[0.3, -0.7], [1.0, 1.0], [-0.2, 0.0]])
+
+        interpolated = np.dot(
+            tree_deflections.biquadratic_weights_from(offsets=offsets), stencil_values
+        )
+
+        assert interpolated == pytest.approx(
+            [1.0 + 2.0 * y - x + 0.5 * y * x + y ** 2.0 for (y, x) in offsets], 1.0e-8
+        )
+
+    def test__deflections_of_many_halos_match_exact_deflections(self):
+
+        grid = al.Grid.uniform(shape_2d=(20, 20), pixel_scales=0.1, sub_size=2)
+
+        galaxies = [
+            al.Galaxy(
+                redshift=0.5,
+                mass=al.mp.SphericalNFW(
+                    centre=(3.0 * np.sin(i), 3.0 * np.cos(2.0 * i)),
+                    kappa_s=0.05,
+                    scale_radius=1.0,
+                ),
+            )
+            for i in range(20)
+        ]
+
+        plane = al.Plane(galaxies=galaxies)
+
+        deflections = al.TreeDeflections(
+            opening_angle=0.1, leaf_size=16
+        ).deflections_from_plane_and_grid(plane=plane, grid=grid)
+
+        assert deflections == pytest.approx(
+            np.asarray(plane.deflections_from_grid(grid=grid)), abs=1.0e-4
+        )
+
+        deflections = al.TreeDeflections(
+            opening_angle=0.0, leaf_size=16
+        ).deflections_from_plane_and_grid(plane=plane, grid=grid)
+
+        assert deflections == pytest.approx(
+            np.asarray(plane.deflections_from_grid(grid=grid)), 1.0e-8
+        )
+
+    def test__tracer_uses_tree_for_planes_with_minimum_mass_profiles(
+        self, sub_grid_7x7
+    ):
+
+        line_of_sight_galaxies = [
+            al.Galaxy(
+                redshift=0.25,
+                mass=al.mp.SphericalIsothermal(
+                    centre=(5.0 * np.sin(i), 5.0 * np.cos(i)), einstein_radius=0.1
+                ),
+            )
+            for i in range(10)
+        ]
+
+        galaxies = line_of_sight_galaxies + [
+            al.Galaxy(
+                redshift=0.5, mass=al.mp.SphericalIsothermal(einstein_radius=1.0)
+            ),
+            al.Galaxy(redshift=1.0),
+        ]
+
+        tree = al.TreeDeflections(opening_angle=0.1, minimum_mass_profiles=10)
+
+        tracer = al.Tracer.from_galaxies(galaxies=galaxies)
+        tree_tracer = al.Tracer.from_galaxies(galaxies=galaxies, tree_deflections=tree)
+
+        assert tree.is_used_for_plane(plane=tree_tracer.planes[0]) is True
+        assert tree.is_used_for_plane(plane=tree_tracer.planes[1]) is False
+
+        traced_grids = tracer.traced_grids_of_planes_from_grid(grid=sub_grid_7x7)
+        tree_traced_grids = tree_tracer.traced_grids_of_planes_from_grid(
+            grid=sub_grid_7x7
+        )
+
+        assert tree_traced_grids[2] == pytest.approx(traced_grids[2], abs=1.0e-4)
@@ -131,6 +131,53 @@ class TestMakeAnalysis:
             "Neff=3.05, m_nu=[0.   0.   0.06] eV, Ob0=0.0486) \n"
         )
 
+    def test__phase_info_includes_uv_binning_and_warns_of_large_phase_error(
+        self, mask_7x7, caplog
+    ):
+
+        interferometer = al.Interferometer(
+            visibilities=al.Visibilities.manual_1d(
+                visibilities=[1.0 + 4.0j, 3.0 + 2.0j, 5.0 + 5.0j]
+            ),
+            noise_map=al.VisibilitiesNoiseMap.manual_1d(
+                visibilities=[1.0 + 1.0j, 1.0 + 2.0j, 1.0 + 1.0j]
+            ),
+            uv_wavelengths=np.array([[1.0e5, 1.0e5], [3.0e5, 3.0e5], [1.5e6, 1.0e5]]),
+        )
+
+        phase_interferometer_7 = al.PhaseInterferometer(
+            search=mock.MockSearch("phase_interferometer_7"),
+            settings=al.SettingsPhaseInterferometer(
+                settings_masked_interferometer=al.SettingsMaskedInterferometer(
+                    transformer_class=al.TransformerDFT, uv_bin_size=1.0e6
+                )
+            ),
+            real_space_mask=mask_7x7,
+        )
+
+        analysis = phase_interferometer_7.make_analysis(
+            dataset=interferometer,
+            mask=np.full(fill_value=False, shape=(3,)),
+            results=mock.MockResults(),
+        )
+
+        max_phase_error = analysis.masked_interferometer.uv_binning_max_phase_error
+
+        assert max_phase_error > 1.0
+
+        file_phase_info = path.join(
+            phase_interferometer_7.search.paths.output_path, "phase.info"
+        )
+
+        with open(file_phase_info, "r") as phase_info:
+            lines = phase_info.readlines()
+
+        assert lines[4] == "UV Bin Size = 1000000.0 \n"
+        assert lines[5] == "UV Binning Compression = 1.5 \n"
+        assert lines[6] == f"UV Binning Max Phase Error = {max_phase_error} \n"
+
+        assert "not well below 1.0" in caplog.text
+
     def test__phase_can_receive_hyper_image_and_noise_maps(self, mask_7x7):
         phase_interferometer_7 = al.PhaseInterferometer(
             galaxies=dict(
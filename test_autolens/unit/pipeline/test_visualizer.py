@@ -6,6 +6,8 @@ import pytest
 from autoconf import conf
 import autofit as af
 import autolens as al
+from astropy.io import fits
+from autolens.pipeline import fits_bundle
 from autolens.pipeline import visualizer as vis
 
 directory = path.dirname(path.realpath(__file__))
@@ -125,6 +127,65 @@ class TestPhaseDataSetVisualizer:
 
         assert convergence.shape == (5, 5)
 
+    def test__visualizes_ray_tracing_in_fits_bundle(
+        self, masked_imaging_7x7, tracer_x2_plane_7x7, plot_path, plot_patch, caplog
+    ):
+
+        if os.path.exists(plot_path):
+            shutil.rmtree(plot_path)
+
+        visualizer = vis.PhaseDatasetVisualizer(masked_dataset=masked_imaging_7x7)
+
+        visualizer.fits_bundle_ray_tracing = True
+        visualizer.fits_bundle_asynchronous = True
+
+        future = visualizer.output_fits_bundle(
+            paths=af.Paths(),
+            bundle=fits_bundle.FitsBundle.from_tracer_and_grid(
+                tracer=tracer_x2_plane_7x7, grid=masked_imaging_7x7.grid
+            ),
+            subfolders=path.join("ray_tracing", "fits"),
+            filename="ray_tracing",
+        )
+        future.result()
+
+        file_path = path.join(
+            plot_path, "image", "ray_tracing", "fits", "ray_tracing.fits"
+        )
+
+        with fits.open(file_path) as hdu_list:
+            assert [hdu.name for hdu in hdu_list[1:]] == [
+                "IMAGE",
+                "SOURCE_PLANE",
+                "CONVERGENCE",
+                "POTENTIAL",
+                "DEFLECTIONS_Y",
+                "DEFLECTIONS_X",
+                "MAGNIFICATION",
+            ]
+            assert hdu_list["CONVERGENCE"].data.shape == (7, 7)
+
+        future = fits_bundle.FitsBundle.from_tracer_and_grid(
+            tracer=tracer_x2_plane_7x7, grid=masked_imaging_7x7.grid
+        ).output_to_fits(file_path=file_path, overwrite=False, asynchronous=True)
+
+        assert isinstance(future.exception(), OSError)
+
+        # Callbacks run in the output thread after the write, so waiting on the next write waits on them.
+        fits_bundle._output_executor().submit(lambda: None).result()
+
+        assert (
+            f"Asynchronous output of the fits bundle {file_path} failed" in caplog.text
+        )
+
+        visualizer.visualize_ray_tracing_in_fits(
+            paths=af.Paths(), tracer=tracer_x2_plane_7x7
+        )
+
+        assert not path.exists(
+            path.join(plot_path, "image", "ray_tracing", "fits", "convergence.fits")
+        )
+
     def test__visualize_stochastic_histogram(
         self, masked_imaging_7x7, plot_path, plot_patch
     ):
@@ -337,6 +398,58 @@ class TestPhaseImagingVisualizer:
 
         assert image.shape == (7, 7)
 
+    def test__visualizes_fit_in_fits_bundle(
+        self,
+        masked_imaging_7x7,
+        masked_imaging_fit_x2_plane_inversion_7x7,
+        plot_path,
+        plot_patch,
+    ):
+
+        if os.path.exists(plot_path):
+            shutil.rmtree(plot_path)
+
+        visualizer = vis.PhaseImagingVisualizer(masked_dataset=masked_imaging_7x7)
+
+        visualizer.fits_bundle_fit = True
+
+        visualizer.visualize_fit_in_fits(
+            paths=af.Paths(), fit=masked_imaging_fit_x2_plane_inversion_7x7
+        )
+
+        assert not path.exists(
+            path.join(plot_path, "image", "fit_imaging", "fits", "image.fits")
+        )
+
+        with fits.open(
+            path.join(plot_path, "image", "fit_imaging", "fits", "fit_imaging.fits")
+        ) as hdu_list:
+
+            names = [hdu.name for hdu in hdu_list]
+
+            assert "IMAGE" in names
+            assert "CHI_SQUARED_MAP" in names
+            assert "MODEL_IMAGE_OF_PLANE_1" in names
+            assert "SUBTRACTED_IMAGE_OF_PLANE_0" in names
+            assert "PLANE_IMAGE_OF_PLANE_0" in names
+            assert "RECONSTRUCTION" in names
+            assert "INTERPOLATED_RECONSTRUCTION" in names
+
+            assert hdu_list[0].header["LOGLIKE"] == pytest.approx(
+                masked_imaging_fit_x2_plane_inversion_7x7.log_likelihood, 1.0e-4
+            )
+
+            chi_squared_map = al.util.array.numpy_array_2d_from_fits(
+                file_path=path.join(
+                    plot_path, "image", "fit_imaging", "fits", "fit_imaging.fits"
+                ),
+                hdu=names.index("CHI_SQUARED_MAP"),
+            )
+
+            assert chi_squared_map == pytest.approx(
+                masked_imaging_fit_x2_plane_inversion_7x7.chi_squared_map.in_2d, 1.0e-4,
+            )
+
     def test__visualizes_hyper_images_using_config(
         self,
         masked_imaging_7x7,
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+import pytest
+
+import autolens as al
+from autolens.pipeline.phase.imaging.phase import PhaseImaging
+from autolens.plot import ray_tracing_plots
+
+
+def test__import_autolens__does_not_import_plot_aggregator_or_phases():
+
+    statement = (
+        "import sys, autolens; "
+        "print(any(module in sys.modules for module in "
+        "['autolens.plot', 'autolens.aggregator', 'autolens.pipeline.phase']))"
+    )
+
+    stdout = subprocess.run(
+        [sys.executable, "-c", statement],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+    assert stdout.strip() == "False"
+
+
+def test__lazy_attributes__load_the_same_objects_as_a_direct_import():
+
+    assert al.PhaseImaging is PhaseImaging
+    assert al.plot.Tracer is ray_tracing_plots
+    assert "agg" in dir(al)
+
+
+def test__unknown_attribute__raises_attribute_error():
+
+    with pytest.raises(AttributeError):
+        al.not_an_attribute
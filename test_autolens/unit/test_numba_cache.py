@@ -0,0 +1,60 @@
+import glob
+import numba
+from os import path
+import pytest
+import subprocess
+import sys
+
+from autolens import decorator_util
+from autolens import numba_cache
+
+
+@pytest.fixture(name="restore_kernel_caches")
+def make_restore_kernel_caches():
+
+    cache_dir = numba.config.CACHE_DIR
+    caches = [kernel._cache for kernel in decorator_util.kernels]
+
+    yield
+
+    numba.config.CACHE_DIR = cache_dir
+
+    for kernel, cache in zip(decorator_util.kernels, caches):
+        kernel._cache = cache
+
+
+def test__warm_up__compiles_every_kernel_into_cache_dir(
+    tmp_path, restore_kernel_caches
+):
+
+    cache_dir = str(tmp_path)
+
+    uncompiled_kernels = numba_cache.uncompiled_kernels()
+
+    numba_cache.warm_up(cache_dir=cache_dir)
+
+    assert len(decorator_util.kernels) > 0
+    assert numba_cache.uncompiled_kernels() == []
+    assert numba.config.CACHE_DIR == cache_dir
+
+    for kernel_name in uncompiled_kernels:
+        assert glob.glob(
+            path.join(cache_dir, "**", f"*.{kernel_name}-*.nbi"), recursive=True
+        )
+
+
+def test__command_line__writes_every_kernel_to_cache_dir(tmp_path):
+
+    cache_dir = str(tmp_path)
+
+    stdout = subprocess.run(
+        [sys.executable, "-m", "autolens.numba_cache", cache_dir],
+        check=True,
+        stdout=subprocess.PIPE,
+        universal_newlines=True,
+    ).stdout
+
+    assert f"Compiled {len(decorator_util.kernels)} autolens Numba kernels" in stdout
+    assert len(glob.glob(path.join(cache_dir, "**", "*.nbi"), recursive=True)) == len(
+        decorator_util.kernels
+    )